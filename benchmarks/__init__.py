@@ -0,0 +1 @@
+"""Benchmarks for the Blacktown Bin Buddy integration."""
@@ -0,0 +1,57 @@
+"""Synthetic council waste services pages for benchmarking."""
+
+from __future__ import annotations
+
+SERVICES = (
+    ("general-waste", "red-lid", "Tue 16/9/2025"),
+    ("recycling", "yellow-lid", "Tue 23/9/2025"),
+    ("food-and-garden-waste", "green-lid", "Tue 23/9/2025"),
+)
+
+_SERVICE = """
+<div class="regular-service {waste_class}">
+    <div class="service-image">
+        <img src="/images/{image}.png" alt="">
+    </div>
+    <div class="service-details">
+        <h3 class="service-name">{waste_class}</h3>
+        <div class="next-service">
+            {pickup}
+        </div>
+    </div>
+</div>
+"""
+
+_FILLER = """
+<div class="content-block">
+    <div class="content-inner" data-index="{index}">
+        <p>Find out about waste services, clean-ups and recycling in your area.</p>
+        <a href="/services/{index}">Learn more</a>
+    </div>
+</div>
+"""
+
+
+def realistic_page() -> str:
+    """Return a page shaped like the council's waste services response."""
+    head = "".join(_FILLER.format(index=index) for index in range(10))
+    services = "".join(
+        _SERVICE.format(waste_class=waste_class, image=image, pickup=pickup)
+        for waste_class, image, pickup in SERVICES
+    )
+    return f'<div class="waste-services">{head}{services}</div>'
+
+
+def bloated_page(size: int, services_last: bool = True) -> str:
+    """Return a page of roughly size characters padded with non-service divs."""
+    services = "".join(
+        _SERVICE.format(waste_class=waste_class, image=image, pickup=pickup)
+        for waste_class, image, pickup in SERVICES
+    )
+    block = len(_FILLER.format(index=0))
+    filler = "".join(
+        _FILLER.format(index=index) for index in range(max(size // block, 1))
+    )
+    if services_last:
+        return f"<div>{filler}{services}</div>"
+    return f"<div>{services}{filler}</div>"
@@ -0,0 +1,351 @@
+"""Benchmark the parser, service and coordinator hot paths.
+
+Run from the repository root:
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --compare baseline.json results.json
+
+Results are written as JSON, keyed by benchmark name, so runs from two
+commits can be compared.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import date, timedelta
+import itertools
+import json
+import logging
+import math
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import aiohttp
+from aiohttp import hdrs, web
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.entity_platform import EntityPlatform
+
+from custom_components.blacktown_bin_buddy import council_service
+from custom_components.blacktown_bin_buddy.const import DOMAIN
+from custom_components.blacktown_bin_buddy.coordinator import BinBuddyCoordinator
+from custom_components.blacktown_bin_buddy.council_service import CouncilService
+from custom_components.blacktown_bin_buddy.date import ENTITIES, BinBuddyDateEntity
+from custom_components.blacktown_bin_buddy.hub import BinBuddyHub
+from custom_components.blacktown_bin_buddy.parser import (
+    extract_pickups,
+    extract_pickups_soup,
+)
+from custom_components.blacktown_bin_buddy.schedule import Schedule
+from custom_components.blacktown_bin_buddy.store import ScheduleStore
+
+from .pages import bloated_page, realistic_page
+
+FANOUT_ENTRIES = (1, 100, 1000)
+# Entries in the memory benchmark, spread over a few distinct collection weeks
+FLEET_ENTRIES = 10_000
+FLEET_WEEKS = 4
+
+type Result = dict[str, float | int]
+
+
+def _summarise(timings: list[float]) -> Result:
+    """Summarise per-round timings in seconds."""
+    return {
+        "rounds": len(timings),
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+    }
+
+
+def _measure(func: Callable[[], Any], rounds: int) -> Result:
+    """Time a synchronous callable."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return _summarise(timings)
+
+
+async def _async_measure(func: Callable[[], Awaitable[Any]], rounds: int) -> Result:
+    """Time an async callable."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await func()
+        timings.append(time.perf_counter() - start)
+    return _summarise(timings)
+
+
+def bench_parser(rounds: int) -> dict[str, Result]:
+    """Benchmark the extractor and its fallback on realistic and bloated pages."""
+    pages = {
+        "realistic": realistic_page(),
+        "bloated_250kb": bloated_page(250_000),
+        "bloated_500kb": bloated_page(500_000),
+        "bloated_500kb_services_first": bloated_page(500_000, services_last=False),
+    }
+    results = {}
+    for name, page in pages.items():
+        results[f"parse_{name}"] = _measure(
+            lambda page=page: extract_pickups(page), rounds
+        )
+        results[f"parse_soup_{name}"] = _measure(
+            lambda page=page: extract_pickups_soup(page), rounds
+        )
+    return results
+
+
+async def _async_start_server(page: str) -> web.AppRunner:
+    """Start a local stand-in for the council's waste services endpoint."""
+    body = json.dumps({"responseContent": page})
+    etag = '"benchmark"'
+
+    async def _waste_services(request: web.Request) -> web.Response:
+        if (
+            request.query.get("etag")
+            and request.headers.get(hdrs.IF_NONE_MATCH) == etag
+        ):
+            return web.Response(status=304)
+        headers = {hdrs.ETAG: etag} if request.query.get("etag") else None
+        return web.Response(text=body, content_type="application/json", headers=headers)
+
+    app = web.Application()
+    app.router.add_get("/wasteservices", _waste_services)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner
+
+
+async def bench_service(rounds: int) -> dict[str, Result]:
+    """Benchmark get_waste_collection_data end-to-end over local HTTP."""
+    results = {}
+    for name, page in (
+        ("realistic", realistic_page()),
+        ("bloated_500kb", bloated_page(500_000)),
+    ):
+        runner = await _async_start_server(page)
+        host, port = runner.addresses[0][:2]
+        url = f"http://{host}:{port}/wasteservices?geolocationid="
+        async with aiohttp.ClientSession() as session:
+            # A bottomless bucket, so the rate limit's waits are not timed
+            with patch.object(council_service, "REFRESH_BURST", math.inf):
+                service = CouncilService(session)
+            with patch.object(council_service, "WASTE_COLLECTION_DATES_URL", url):
+                # A new address every round is always parsed
+                counter = iter(range(rounds))
+                results[f"fetch_{name}_cold"] = await _async_measure(
+                    lambda: service.get_waste_collection_data(f"cold-{next(counter)}"),
+                    rounds,
+                )
+                # The same address again hits the content hash
+                results[f"fetch_{name}_unchanged"] = await _async_measure(
+                    lambda: service.get_waste_collection_data("warm"), rounds
+                )
+                # Revalidation with an ETag is answered with 304
+                results[f"fetch_{name}_not_modified"] = await _async_measure(
+                    lambda: service.get_waste_collection_data("warm&etag=1"), rounds
+                )
+            service.close()
+        await runner.cleanup()
+    return results
+
+
+async def bench_fanout(rounds: int) -> dict[str, Result]:
+    """Benchmark a refresh fanned out to every entry's date entities."""
+    results = {}
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        await er.async_load(hass)
+        await dr.async_load(hass)
+
+        for entries in FANOUT_ENTRIES:
+            # Alternate between two schedules so every refresh changes the data
+            schedules = [
+                Schedule.of(
+                    {"red": date(2025, 9, 16) + timedelta(days=7 * week)}
+                    | {"yellow": date(2025, 9, 23), "green": date(2025, 9, 30)}
+                )
+                for week in range(2)
+            ]
+            service = MagicMock(spec=CouncilService)
+            fetches = itertools.count(1)
+
+            async def _get_waste_collection_data(_geolocation_id: str) -> Any:
+                return schedules[next(fetches) % 2]
+
+            service.get_waste_collection_data = _get_waste_collection_data
+            hub = BinBuddyHub(hass, service)
+            entity_platform = EntityPlatform(
+                hass=hass,
+                logger=logging.getLogger(__name__),
+                domain="date",
+                platform_name=DOMAIN,
+                platform=None,
+                scan_interval=timedelta(days=1),
+                entity_namespace=f"fanout_{entries}",
+            )
+
+            coordinators = []
+            for index in range(entries):
+                entry = MagicMock()
+                entry.entry_id = f"fanout-{entries}-{index}"
+                entry.title = entry.entry_id
+                entry.data = {"id": "shared-address"}
+                coordinator = BinBuddyCoordinator(
+                    hass, entry, hub, MagicMock(spec=ScheduleStore)
+                )
+                coordinator.data = schedules[0]
+                hub.async_subscribe(coordinator)
+                coordinators.append(coordinator)
+            await entity_platform.async_add_entities(
+                [
+                    BinBuddyDateEntity(coordinator, description)
+                    for coordinator in coordinators
+                    for description in ENTITIES
+                ]
+            )
+
+            results[f"coordinator_fanout_{entries}"] = await _async_measure(
+                coordinators[0].async_refresh, rounds
+            )
+            await entity_platform.async_reset()
+
+        await hass.async_stop(force=True)
+    return results
+
+
+def bench_memory() -> dict[str, int]:
+    """Measure the bytes held by a fleet's schedules, as dicts and as Schedules."""
+
+    def _dates(index: int) -> dict[str, date]:
+        # Every parse creates new date objects
+        week = timedelta(days=7 * (index % FLEET_WEEKS))
+        return {
+            "red": date(2025, 9, 16) + week,
+            "yellow": date(2025, 9, 23) + week,
+            "green": date(2025, 9, 30) + week,
+        }
+
+    results = {}
+    for name, build in (
+        ("dict", _dates),
+        ("schedule", lambda index: Schedule.of(_dates(index))),
+    ):
+        tracemalloc.start()
+        fleet = [build(index) for index in range(FLEET_ENTRIES)]
+        results[f"fleet_{name}_{FLEET_ENTRIES}"] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del fleet
+    return results
+
+
+def _git_revision() -> str | None:
+    """Return the current commit, if run from a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def async_run(rounds: int) -> dict[str, Any]:
+    """Run every benchmark and return the report."""
+    results = bench_parser(rounds)
+    results |= await bench_service(rounds)
+    results |= await bench_fanout(max(rounds // 4, 1))
+    return {
+        "commit": _git_revision(),
+        "python": platform.python_version(),
+        "timestamp": time.time(),
+        "results": results,
+        "memory": bench_memory(),
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> bool:
+    """Print median changes between two reports, returning False on regressions."""
+    ok = True
+    print(f"{'benchmark':45} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in current["results"].items():
+        if (previous := baseline["results"].get(name)) is None:
+            continue
+        change = result["median"] / previous["median"] - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            ok = False
+        print(
+            f"{name:45} {previous['median'] * 1000:10.3f}ms "
+            f"{result['median'] * 1000:10.3f}ms {change:+8.1%}{flag}"
+        )
+    for name, size in current.get("memory", {}).items():
+        if (previous := baseline.get("memory", {}).get(name)) is None:
+            continue
+        change = size / previous - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            ok = False
+        print(
+            f"{name:45} {previous / 1024:9.1f}KiB "
+            f"{size / 1024:9.1f}KiB {change:+8.1%}{flag}"
+        )
+    return ok
+
+
+def main() -> int:
+    """Run the benchmarks or compare two reports."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BASELINE", "CURRENT"),
+        help="compare two JSON reports instead of running",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="fractional slowdown of a median reported as a regression",
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        baseline, current = (
+            json.loads(open(path, encoding="utf-8").read()) for path in args.compare
+        )
+        return 0 if compare(baseline, current, args.threshold) else 1
+
+    report = asyncio.run(async_run(args.rounds))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,29 +5,67 @@ from __future__ import annotations
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .coordinator import BinBuddyCoordinator
+from .const import DOMAIN
+from .hub import async_get_hub
+from .services import async_setup_services
+from .store import ScheduleStore
+from .views import BinBuddyCalendarView
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
 # supporting date platform - each waste type will have a separate entity
-_PLATFORMS: list[Platform] = [Platform.DATE]
+# plus a calendar of projected collections, bin night and days until collection
+# countdowns, and a diagnostic sensor for fetch performance
+_PLATFORMS: list[Platform] = [
+    Platform.BINARY_SENSOR,
+    Platform.CALENDAR,
+    Platform.DATE,
+    Platform.SENSOR,
+]
 
 type BlacktownBinBuddyConfigEntry = ConfigEntry[BinBuddyCoordinator]
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the bin_buddy actions and calendar feeds."""
+    async_setup_services(hass)
+    hass.http.register_view(BinBuddyCalendarView())
+    return True
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: BlacktownBinBuddyConfigEntry
 ) -> bool:
     """Set up bin_buddy from a config entry."""
 
-    coordinator = BinBuddyCoordinator(hass, entry)
-    # populate data immediately
-    await coordinator.async_config_entry_first_refresh()
+    hub = async_get_hub(hass)
+    store = ScheduleStore(hass, entry.entry_id, entry.data["id"])
+    coordinator = BinBuddyCoordinator(hass, entry, hub, store)
+    # share fetches with other entries for the same address
+    entry.async_on_unload(hub.async_subscribe(coordinator))
+    # start from the saved schedule if there is one, entities are unavailable
+    # until the first refresh otherwise
+    restored = await coordinator.async_restore()
 
     entry.runtime_data = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
 
+    if restored:
+        # refresh the saved schedule soon, staggered so restarts do not burst
+        entry.async_on_unload(coordinator.async_schedule_startup_refresh())
+    else:
+        # fetch in the background rather than holding up Home Assistant's startup,
+        # failures are retried on the coordinator's backoff
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} {entry.title} first refresh"
+        )
+
     return True
 
 
@@ -36,3 +74,10 @@ async def async_unload_entry(
 ) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, _PLATFORMS)
+
+
+async def async_remove_entry(
+    hass: HomeAssistant, entry: BlacktownBinBuddyConfigEntry
+) -> None:
+    """Remove the saved schedule when a config entry is removed."""
+    await ScheduleStore(hass, entry.entry_id, entry.data["id"]).async_remove()
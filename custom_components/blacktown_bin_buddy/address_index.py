@@ -0,0 +1,168 @@
+"""Local index of the addresses the council's search has returned."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import Counter
+from collections.abc import Iterable
+import logging
+import re
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    ADDRESS_INDEX_MAX_SIZE,
+    ADDRESS_INDEX_MIN_SEARCH,
+    ADDRESS_INDEX_MIN_SIMILARITY,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+
+_NUMBER_RE = re.compile(r"\d+[a-z]?")
+
+
+def _normalise(address: str) -> str:
+    """Return the index key for an address or a search for one."""
+    return " ".join(address.casefold().replace(",", " ").split())
+
+
+def _trigrams(key: str) -> set[str]:
+    """Return the trigrams of a key, padded so word starts count."""
+    padded = f"  {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class AddressIndex:
+    """Every (Id, AddressSingleLine) pair seen, searchable by prefix or trigram.
+
+    Keys are normalised address lines, kept sorted so a prefix search is a
+    bisect. Searches that are not a prefix of any address fall back to the
+    trigram index, which matches addresses containing most of the search's
+    trigrams and every house number in it. Searches shorter than
+    ADDRESS_INDEX_MIN_SEARCH only match an address they spell out in full. The
+    oldest addresses are dropped beyond ADDRESS_INDEX_MAX_SIZE.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        # Key -> (Id, AddressSingleLine), oldest first
+        self._addresses: dict[str, tuple[str, str]] = {}
+        self._keys: list[str] = []
+        self._trigrams: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed addresses."""
+        return len(self._addresses)
+
+    def add(self, items: Iterable[dict[str, Any]]) -> bool:
+        """Index search result items, returning True if any were new."""
+        changed = False
+        for item in items:
+            geolocation_id = item.get("Id")
+            line = item.get("AddressSingleLine")
+            if not geolocation_id or not line:
+                continue
+            key = _normalise(line)
+            if self._addresses.get(key) == (geolocation_id, line):
+                continue
+            if key in self._addresses:
+                del self._addresses[key]
+            else:
+                insort(self._keys, key)
+                for trigram in _trigrams(key):
+                    self._trigrams.setdefault(trigram, set()).add(key)
+            self._addresses[key] = (geolocation_id, line)
+            changed = True
+        while len(self._addresses) > ADDRESS_INDEX_MAX_SIZE:
+            self._remove(next(iter(self._addresses)))
+        return changed
+
+    def _remove(self, key: str) -> None:
+        """Drop an address from the index."""
+        del self._addresses[key]
+        del self._keys[bisect_left(self._keys, key)]
+        for trigram in _trigrams(key):
+            keys = self._trigrams[trigram]
+            keys.discard(key)
+            if not keys:
+                del self._trigrams[trigram]
+
+    def search(self, search_term: str, limit: int) -> list[dict[str, str]]:
+        """Return up to limit confident matches, as council search result items.
+
+        An empty list means the index has no confident match for the search.
+        """
+        if not (query := _normalise(search_term)) or (
+            len(query) < ADDRESS_INDEX_MIN_SEARCH and query not in self._addresses
+        ):
+            return []
+        keys = self._prefix_matches(query, limit) or self._similar(query, limit)
+        return [
+            {"Id": geolocation_id, "AddressSingleLine": line}
+            for geolocation_id, line in (self._addresses[key] for key in keys)
+        ]
+
+    def _prefix_matches(self, query: str, limit: int) -> list[str]:
+        """Return the first keys starting with the query, in order."""
+        matches = []
+        for index in range(bisect_left(self._keys, query), len(self._keys)):
+            key = self._keys[index]
+            if not key.startswith(query) or len(matches) == limit:
+                break
+            matches.append(key)
+        return matches
+
+    def _similar(self, query: str, limit: int) -> list[str]:
+        """Return the keys sharing most of the query's trigrams, best first."""
+        query_trigrams = _trigrams(query)
+        shared = Counter(
+            key
+            for trigram in query_trigrams
+            for key in self._trigrams.get(trigram, ())
+        )
+        needed = ADDRESS_INDEX_MIN_SIMILARITY * len(query_trigrams)
+        numbers = set(_NUMBER_RE.findall(query))
+        return [
+            key
+            for key, count in shared.most_common()
+            if count >= needed and numbers <= set(_NUMBER_RE.findall(key))
+        ][:limit]
+
+    def as_data(self) -> list[list[str]]:
+        """Return the indexed addresses for storage, oldest first."""
+        return [list(address) for address in self._addresses.values()]
+
+
+class AddressIndexStore:
+    """Saves the address index across restarts."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the address index store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.address_index"
+        )
+
+    async def async_load(self) -> list[dict[str, str]]:
+        """Return the saved addresses as search result items."""
+        stored = await self._store.async_load()
+        try:
+            return [
+                {"Id": geolocation_id, "AddressSingleLine": line}
+                for geolocation_id, line in (stored or {}).get("addresses", [])
+            ]
+        except (TypeError, ValueError):
+            _LOGGER.warning("Ignoring invalid saved address index")
+            return []
+
+    @callback
+    def async_save(self, index: AddressIndex) -> None:
+        """Schedule the index to be saved."""
+        self._store.async_delay_save(
+            lambda: {"addresses": index.as_data()}, SAVE_DELAY
+        )
@@ -0,0 +1,84 @@
+"""Cached address search for the Blacktown Bin Buddy config flow."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import time
+from typing import Any
+
+from .address_index import AddressIndex, AddressIndexStore
+from .const import (
+    ADDRESS_INDEX_RESULTS,
+    ADDRESS_SEARCH_CACHE_SIZE,
+    ADDRESS_SEARCH_CACHE_TTL,
+)
+from .council_service import CouncilService
+
+
+def normalise_search_term(search_term: str) -> str:
+    """Return the cache key for a search term."""
+    return " ".join(search_term.casefold().split())
+
+
+class AddressSearchCache:
+    """A TTL + LRU cache in front of the council's address search.
+
+    Identical searches that are already in flight share a single request, so
+    repeated submits from one or more config flows cost one round-trip. Every
+    address returned is also added to a local index, saved by store if given.
+    """
+
+    def __init__(
+        self, service: CouncilService, store: AddressIndexStore | None = None
+    ) -> None:
+        """Initialize the cache."""
+        self._service = service
+        self._results: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+        self._store = store
+        self.index = AddressIndex()
+        self._index_loaded = store is None
+        self._index_lock = asyncio.Lock()
+
+    async def async_search_local(self, search_term: str) -> list[dict[str, str]]:
+        """Return confident matches for a term among the addresses seen before.
+
+        An empty list means the council's search is needed.
+        """
+        if not self._index_loaded:
+            async with self._index_lock:
+                if not self._index_loaded:
+                    assert self._store is not None
+                    self.index.add(await self._store.async_load())
+                    self._index_loaded = True
+        return self.index.search(search_term, ADDRESS_INDEX_RESULTS)
+
+    async def async_search(self, search_term: str) -> Any:
+        """Return the search results for a term, from the cache when possible."""
+        key = normalise_search_term(search_term)
+        if (cached := self._results.get(key)) is not None:
+            expires, results = cached
+            if expires > time.monotonic():
+                self._results.move_to_end(key)
+                return results
+            del self._results[key]
+
+        if (task := self._inflight.get(key)) is None:
+            task = asyncio.create_task(self._async_search(key, search_term))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _async_search(self, key: str, search_term: str) -> Any:
+        """Run the search as it was typed and cache its results under key."""
+        results = await self._service.search_address(search_term)
+        self._results[key] = (time.monotonic() + ADDRESS_SEARCH_CACHE_TTL, results)
+        while len(self._results) > ADDRESS_SEARCH_CACHE_SIZE:
+            self._results.popitem(last=False)
+        if (
+            self.index.add((results or {}).get("Items", []))
+            and self._store is not None
+        ):
+            self._store.async_save(self.index)
+        return results
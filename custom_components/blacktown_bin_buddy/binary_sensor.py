@@ -0,0 +1,52 @@
+"""Binary sensor platform for the Blacktown Bin Buddy integration."""
+
+from __future__ import annotations
+
+from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import BIN_COLOUR_MAP
+from .coordinator import BinBuddyCoordinator
+from .entity import BinBuddyCountdownEntity
+
+# Bin night runs from the day before a collection to the day of it
+BIN_NIGHT_DAYS = 1
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the bin night binary sensors from a config entry."""
+    coordinator: BinBuddyCoordinator = entry.runtime_data
+    async_add_entities(
+        BinBuddyBinNightBinarySensor(coordinator, colour) for colour in BIN_COLOUR_MAP
+    )
+
+
+class BinBuddyBinNightBinarySensor(BinBuddyCountdownEntity, BinarySensorEntity):
+    """On the day before and the day of a bin's collection."""
+
+    _attr_icon = "mdi:delete-clock"
+
+    def __init__(self, coordinator: BinBuddyCoordinator, colour: str) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, colour)
+        self._attr_name = f"{self._bin_name} bin night"
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{colour}_bin_night"
+
+    def days_until_change(self, days_until: int) -> int:
+        """Change when bin night starts, or the day after the collection."""
+        if days_until > BIN_NIGHT_DAYS:
+            return days_until - BIN_NIGHT_DAYS
+        return days_until + 1
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return whether the bin goes out tonight or is collected today."""
+        if self.days_until is None:
+            return None
+        return self.days_until <= BIN_NIGHT_DAYS
@@ -0,0 +1,178 @@
+"""Bulk import of addresses for the Blacktown Bin Buddy integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import csv
+from dataclasses import dataclass, field
+import io
+import logging
+from typing import Any
+
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from .address_search import AddressSearchCache, normalise_search_term
+from .const import (
+    DOMAIN,
+    IMPORT_BATCH_SIZE,
+    IMPORT_MAX_WORKERS,
+    IMPORT_REQUESTS_PER_SECOND,
+)
+from .council_service import CouncilServiceError
+from .hub import async_get_hub
+from .resilience import TokenBucket
+
+_LOGGER = logging.getLogger(__name__)
+
+ADDRESS_COLUMN = "address"
+
+
+def parse_address_csv(text: str) -> list[str]:
+    """Return the addresses in CSV text.
+
+    Addresses are read from the column headed "address" if there is one, and
+    from the first column otherwise. Blank rows are skipped.
+    """
+    rows = [
+        row
+        for row in csv.reader(io.StringIO(text))
+        if any(cell.strip() for cell in row)
+    ]
+    if not rows:
+        return []
+    header = [cell.strip().casefold() for cell in rows[0]]
+    column = 0
+    if ADDRESS_COLUMN in header:
+        column = header.index(ADDRESS_COLUMN)
+        rows = rows[1:]
+    return [
+        row[column].strip()
+        for row in rows
+        if len(row) > column and row[column].strip()
+    ]
+
+
+@dataclass(slots=True)
+class ImportReport:
+    """How each address of a bulk import was resolved."""
+
+    # Address as given -> (geolocation ID, council's address line)
+    matched: dict[str, tuple[str, str]] = field(default_factory=dict)
+    # Address as given -> candidate address lines
+    ambiguous: dict[str, list[str]] = field(default_factory=dict)
+    unmatched: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    created: list[str] = field(default_factory=list)
+    already_configured: list[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the report for a service response."""
+        return {
+            "created": self.created,
+            "already_configured": self.already_configured,
+            "ambiguous": self.ambiguous,
+            "unmatched": self.unmatched,
+            "failed": self.failed,
+        }
+
+
+async def async_resolve_addresses(
+    address_search: AddressSearchCache,
+    addresses: Iterable[str],
+    max_workers: int,
+    rate: float,
+) -> ImportReport:
+    """Resolve addresses to geolocation IDs through the council's search.
+
+    At most max_workers searches run at once, started no faster than rate per
+    second. An address is matched when exactly one result's AddressSingleLine
+    equals it, ignoring case and spacing.
+    """
+    report = ImportReport()
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for address in dict.fromkeys(addresses):
+        queue.put_nowait(address)
+    # Without bursts, and within the service's own search budget
+    limiter = TokenBucket(rate, 1)
+
+    async def _worker() -> None:
+        while not queue.empty():
+            address = queue.get_nowait()
+            await limiter.async_acquire()
+            try:
+                data = await address_search.async_search(address)
+            except CouncilServiceError as err:
+                _LOGGER.warning("Could not search for %s: %r", address, err)
+                report.failed.append(address)
+                continue
+            _match(report, address, (data or {}).get("Items", []))
+
+    await asyncio.gather(*(_worker() for _ in range(max_workers)))
+    return report
+
+
+def _match(report: ImportReport, address: str, items: list[dict[str, Any]]) -> None:
+    """Record how the search results for an address matched it."""
+    key = normalise_search_term(address)
+    exact = [
+        item
+        for item in items
+        if normalise_search_term(item.get("AddressSingleLine", "")) == key
+    ]
+    if len(exact) == 1:
+        report.matched[address] = (exact[0]["Id"], exact[0]["AddressSingleLine"])
+    elif exact or items:
+        report.ambiguous[address] = [
+            item["AddressSingleLine"] for item in exact or items
+        ]
+    else:
+        report.unmatched.append(address)
+
+
+async def async_import_addresses(
+    hass: HomeAssistant, addresses: Iterable[str]
+) -> ImportReport:
+    """Resolve addresses and create a config entry for each one matched.
+
+    Entries are created through the import step of the config flow, a batch
+    of IMPORT_BATCH_SIZE at a time, and each is set up as it is added.
+    """
+    report = await async_resolve_addresses(
+        async_get_hub(hass).address_search,
+        addresses,
+        IMPORT_MAX_WORKERS,
+        IMPORT_REQUESTS_PER_SECOND,
+    )
+    # Addresses written differently can resolve to the same ID
+    matched = list(dict(report.matched.values()).items())
+    for start in range(0, len(matched), IMPORT_BATCH_SIZE):
+        batch = matched[start : start + IMPORT_BATCH_SIZE]
+        results = await asyncio.gather(
+            *(
+                hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": SOURCE_IMPORT},
+                    data={"id": geolocation_id, "title": title},
+                )
+                for geolocation_id, title in batch
+            )
+        )
+        for (_id, title), result in zip(batch, results, strict=True):
+            if result["type"] == FlowResultType.CREATE_ENTRY:
+                report.created.append(title)
+            else:
+                report.already_configured.append(title)
+
+    _LOGGER.info(
+        "Imported %d addresses, %d already configured, %d ambiguous, "
+        "%d unmatched and %d failed",
+        len(report.created),
+        len(report.already_configured),
+        len(report.ambiguous),
+        len(report.unmatched),
+        len(report.failed),
+    )
+    return report
@@ -0,0 +1,73 @@
+"""Calendar platform for the Blacktown Bin Buddy integration."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .const import BIN_NAMES
+from .coordinator import BinBuddyCoordinator
+from .entity import BinBuddyEntity
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the calendar entity from a config entry."""
+    coordinator: BinBuddyCoordinator = entry.runtime_data
+    async_add_entities([BinBuddyCalendarEntity(coordinator)])
+
+
+def _event(day: date, colour: str) -> CalendarEvent:
+    """Return the all-day event for a bin's collection."""
+    return CalendarEvent(
+        start=day,
+        end=day + timedelta(days=1),
+        summary=BIN_NAMES.get(colour, colour),
+    )
+
+
+class BinBuddyCalendarEntity(BinBuddyEntity, CalendarEntity):
+    """Projected bin collections for the next year.
+
+    Events are served from the coordinator's event index, which is rebuilt when
+    the schedule changes.
+    """
+
+    _attr_name = "Collections"
+    _attr_icon = "mdi:calendar-refresh"
+
+    def __init__(self, coordinator: BinBuddyCoordinator) -> None:
+        """Initialize the calendar."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_calendar"
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return today's collection, or the next one."""
+        today = dt_util.now().date()
+        if (upcoming := self.coordinator.events.first_on_or_after(today)) is None:
+            return None
+        return _event(*upcoming)
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the collections on days overlapping start_date to end_date."""
+        first = dt_util.as_local(start_date).date()
+        end = dt_util.as_local(end_date)
+        last = end.date()
+        if end.time() == time.min:
+            # The day starting exactly at end_date is outside the range
+            last -= timedelta(days=1)
+        return [
+            _event(*collection)
+            for collection in self.coordinator.events.between(first, last)
+        ]
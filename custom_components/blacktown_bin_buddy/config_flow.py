@@ -6,17 +6,15 @@ import logging
 from typing import Any
 
 import voluptuous as vol
-import urllib.parse
 
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .council_service import CouncilService
-from .const import DOMAIN, ADD_SEARCH_URL
+from .const import DOMAIN
+from .hub import async_get_hub
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,6 +24,9 @@ ADDRESS_SEARCH_DATA = vol.Schema(
     }
 )
 
+# Offered with addresses from the local index, in case the right one is missing
+SEARCH_COUNCIL = "None of these, search the council"
+
 
 class BinBuddyConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for bin_buddy."""
@@ -35,35 +36,63 @@ class BinBuddyConfigFlow(ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         self.search_results = {}
+        # The search behind local results, kept to ask the council instead
+        self._council_query: str | None = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle initial step where user searches for their address."""
-        errors = {}
+        errors: dict[str, str] = {}
         if user_input is not None:
-            session = async_get_clientsession(self.hass)
-            service = CouncilService(session)
+            address_search = async_get_hub(self.hass).address_search
             query = user_input["Search Address"]
 
-            try:
-                data = await service.search_address(query)
-
-                if not data:
-                    errors["base"] = "no_results"
-                else:
-                    items_list = data.get("Items", [])
-                    self.search_results = {
-                        result["AddressSingleLine"]: result for result in items_list
-                    }
-                    return await self.async_step_select_address()
-            except Exception:
-                _LOGGER.exception("Failed to connect to council address API")
-                errors["base"] = "cannot_connect"
+            # Addresses found by earlier searches are offered straight away
+            if items_list := await address_search.async_search_local(query):
+                self.search_results = {
+                    result["AddressSingleLine"]: result for result in items_list
+                }
+                self._council_query = query
+                return await self.async_step_select_address()
+
+            if (result := await self._async_search_council(query, errors)) is not None:
+                return result
         return self.async_show_form(
             step_id="user", data_schema=ADDRESS_SEARCH_DATA, errors=errors
         )
 
+    async def _async_search_council(
+        self, query: str, errors: dict[str, str]
+    ) -> ConfigFlowResult | None:
+        """Search the council for an address, adding to errors if that fails."""
+        address_search = async_get_hub(self.hass).address_search
+        self._council_query = None
+        try:
+            data = await address_search.async_search(query)
+        except Exception:
+            _LOGGER.exception("Failed to connect to council address API")
+            errors["base"] = "cannot_connect"
+            return None
+
+        if not data:
+            errors["base"] = "no_results"
+            return None
+        items_list = data.get("Items", [])
+        self.search_results = {
+            result["AddressSingleLine"]: result for result in items_list
+        }
+        return await self.async_step_select_address()
+
+    async def async_step_import(
+        self, import_data: dict[str, Any]
+    ) -> ConfigFlowResult:
+        """Handle an address resolved by a bulk import."""
+        self._async_abort_entries_match({"id": import_data["id"]})
+        return self.async_create_entry(
+            title=import_data["title"], data={"id": import_data["id"]}
+        )
+
     async def async_step_select_address(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -71,6 +100,13 @@ class BinBuddyConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             selected_display_name = user_input["Select Address"]
 
+            if selected_display_name == SEARCH_COUNCIL and self._council_query:
+                errors: dict[str, str] = {}
+                result = await self._async_search_council(self._council_query, errors)
+                return result or self.async_show_form(
+                    step_id="user", data_schema=ADDRESS_SEARCH_DATA, errors=errors
+                )
+
             # Get the full data object we stored earlier
             final_address_data = self.search_results[selected_display_name]
 
@@ -84,9 +120,10 @@ class BinBuddyConfigFlow(ConfigFlow, domain=DOMAIN):
             )
         # --- STEP 2: SCHEMA FOR THE SELECTION DROPDOWN ---
         # The keys of our stored search_results become the dropdown options
-        SELECTION_SCHEMA = vol.Schema(
-            {vol.Required("Select Address"): vol.In(list(self.search_results.keys()))}
-        )
+        options = list(self.search_results.keys())
+        if self._council_query:
+            options.append(SEARCH_COUNCIL)
+        SELECTION_SCHEMA = vol.Schema({vol.Required("Select Address"): vol.In(options)})
 
         return self.async_show_form(
             step_id="select_address", data_schema=SELECTION_SCHEMA
@@ -1,5 +1,7 @@
 """Constants for the bin_buddy integration."""
 
+from datetime import timedelta
+
 DOMAIN = "blacktown_bin_buddy"
 ADD_SEARCH_URL = "https://www.blacktown.nsw.gov.au/api/v1/myarea/search?keywords="  # append URL encoded search term
 WASTE_COLLECTION_DATES_URL = "https://www.blacktown.nsw.gov.au/ocapi/Public/myarea/wasteservices?ocsvclang=en-AU&geolocationid="  # append address GUID - returns html to be parsed
@@ -9,3 +11,98 @@ BIN_COLOUR_MAP = {
     "yellow": "recycling",
     "green": "food-and-garden-waste",
 }
+BIN_NAMES = {
+    "red": "General Waste",
+    "yellow": "Recycling",
+    "green": "Food and Garden Waste",
+}
+
+# Upper bound on council fetches the shared hub runs at the same time
+MAX_CONCURRENT_FETCHES = 4
+
+# Saved schedules older than this are not used at startup
+SCHEDULE_CACHE_MAX_AGE = timedelta(days=7)
+
+# Adaptive polling: refresh at 1 AM the day after the earliest collection,
+# never sooner than MIN_UPDATE_INTERVAL and never later than MAX_UPDATE_INTERVAL
+REFRESH_AFTER_COLLECTION = timedelta(days=1, hours=1)
+MIN_UPDATE_INTERVAL = timedelta(hours=1)
+MAX_UPDATE_INTERVAL = timedelta(days=7)
+
+# Refreshes are staggered by a hash of the address plus jitter, so entries that
+# share a collection day or start together do not all fetch at once. Restored
+# schedules are refreshed within STARTUP_REFRESH_SPREAD of startup.
+REFRESH_SPREAD = timedelta(hours=1)
+STARTUP_REFRESH_SPREAD = timedelta(minutes=10)
+REFRESH_JITTER = timedelta(minutes=1)
+
+# Retries after a failed fetch start fast and back off exponentially
+RETRY_INTERVAL_MIN = timedelta(minutes=5)
+RETRY_INTERVAL_MAX = timedelta(hours=1)
+
+# Blacktown collects red bins weekly and yellow/green bins on alternate fortnights
+DEFAULT_CADENCE_DAYS = {"red": 7, "yellow": 14, "green": 14}
+MAX_CADENCE_DAYS = 28
+
+# How far ahead the calendar projects collections
+CALENDAR_HORIZON_DAYS = 365
+
+# Address search results shared across config flows
+ADDRESS_SEARCH_CACHE_TTL = 1800  # seconds
+ADDRESS_SEARCH_CACHE_SIZE = 128
+# Addresses from past searches, kept to answer config flows without the council.
+# A search that is not the start of an address must share this fraction of its
+# trigrams with one to match it. Shorter searches than ADDRESS_INDEX_MIN_SEARCH
+# characters match too many addresses the index may not hold, so they are left to
+# the council unless they are a whole address.
+ADDRESS_INDEX_MAX_SIZE = 5000
+ADDRESS_INDEX_MIN_SIMILARITY = 0.75
+ADDRESS_INDEX_MIN_SEARCH = 8
+ADDRESS_INDEX_RESULTS = 10
+
+# Bulk imports search for at most IMPORT_MAX_WORKERS addresses at once, starting
+# no more than IMPORT_REQUESTS_PER_SECOND, and add entries in batches
+IMPORT_MAX_WORKERS = 4
+IMPORT_REQUESTS_PER_SECOND = 2
+IMPORT_BATCH_SIZE = 20
+
+# Threads available for parsing council pages, which caps concurrent parses
+PARSE_MAX_WORKERS = 2
+
+# Samples kept for the rolling fetch and parse time percentiles
+METRICS_WINDOW_SIZE = 100
+
+# Connection pool owned by the integration, both endpoints share one host.
+# Connections are kept alive between the bursts of a bulk refresh and the
+# host's address is cached rather than resolved per connection.
+COUNCIL_CONNECTION_LIMIT = 8
+COUNCIL_CONNECTIONS_PER_HOST = MAX_CONCURRENT_FETCHES + 2  # room for searches
+KEEPALIVE_TIMEOUT = 120  # seconds
+DNS_CACHE_TTL = 600  # seconds
+# Responses larger than this are refused, waste pages are a few hundred KB
+MAX_RESPONSE_SIZE = 4 * 1024 * 1024  # bytes
+# Waste services pages are read and extracted in chunks of this size
+STREAM_CHUNK_SIZE = 16 * 1024  # bytes
+
+# Requests to the council's API: each attempt is bounded by REQUEST_TIMEOUT and
+# transient errors are retried with jittered exponential backoff
+REQUEST_TIMEOUT = 20  # seconds
+REQUEST_ATTEMPTS = 3
+RETRY_BACKOFF_BASE = 0.5  # seconds
+RETRY_BACKOFF_MAX = 5  # seconds
+
+# Token buckets limiting requests to the council. Searches have their own budget
+# so they stay fast while entries refresh, and fail rather than queue for long.
+# A Retry-After from a throttled response pauses both, for at most RETRY_AFTER_MAX.
+# Refreshes give up on a long pause rather than hold one of the hub's fetch slots.
+SEARCH_REQUESTS_PER_SECOND = 4
+SEARCH_BURST = 8
+SEARCH_MAX_WAIT = 10  # seconds
+REFRESH_REQUESTS_PER_SECOND = 1
+REFRESH_BURST = MAX_CONCURRENT_FETCHES
+REFRESH_MAX_WAIT = 30  # seconds
+RETRY_AFTER_MAX = 300  # seconds
+
+# Requests fail fast for CIRCUIT_RESET_TIMEOUT after this many failed requests
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 60  # seconds
@@ -2,36 +2,233 @@
 
 from __future__ import annotations
 
-from datetime import date, timedelta
+from collections.abc import Callable, Mapping
+from datetime import date, datetime, timedelta
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
-from .council_service import CannotConnect, CouncilService
+from .const import (
+    CALENDAR_HORIZON_DAYS,
+    DOMAIN,
+    MAX_UPDATE_INTERVAL,
+    MIN_UPDATE_INTERVAL,
+    REFRESH_AFTER_COLLECTION,
+    REFRESH_JITTER,
+    REFRESH_SPREAD,
+    RETRY_INTERVAL_MAX,
+    RETRY_INTERVAL_MIN,
+    STARTUP_REFRESH_SPREAD,
+)
+from .council_service import CannotConnect, CouncilServiceError
+from .event_index import CollectionEventIndex
+from .hub import BinBuddyHub
+from .metrics import FetchMetrics
+from .recurrence import RecurrenceEngine
+from .schedule import Schedule
+from .stagger import jittered, refresh_offset
+from .store import ScheduleStore
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class BinBuddyCoordinator(DataUpdateCoordinator[dict[str, date]]):
+def next_refresh_interval(data: Mapping[str, date], now: datetime) -> timedelta:
+    """Return how long to wait before refreshing the given schedule.
+
+    The council page only changes once a collection has happened, so the next
+    refresh is timed for shortly after the earliest collection, capped at
+    MAX_UPDATE_INTERVAL. An empty schedule, or one with a date that has already
+    passed, is stale and is refreshed after MIN_UPDATE_INTERVAL.
+    """
+    if not data or (earliest := min(data.values())) < now.date():
+        return MIN_UPDATE_INTERVAL
+
+    next_refresh = dt_util.start_of_local_day(earliest) + REFRESH_AFTER_COLLECTION
+    return max(MIN_UPDATE_INTERVAL, min(next_refresh - now, MAX_UPDATE_INTERVAL))
+
+
+class BinBuddyCoordinator(DataUpdateCoordinator[Schedule]):
     """Manages fetching data from the council API."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        hub: BinBuddyHub,
+        store: ScheduleStore,
+    ) -> None:
         """Initialize the data update coordinator."""
-        session = async_get_clientsession(hass)
-        self.service: CouncilService = CouncilService(session)
+        self.hub = hub
+        self.store = store
         self.geolocation_id = entry.data["id"]
+        self.consecutive_failures = 0
+        self.recurrence = RecurrenceEngine()
+        self.events = CollectionEventIndex([], [])
+        # The schedule and day the event index was projected from
+        self._events_source: tuple[Schedule, date] | None = None
+        self.next_refresh: datetime | None = None
+        # This address's slot in the hour after each scheduled refresh
+        self.refresh_offset = refresh_offset(self.geolocation_id, REFRESH_SPREAD)
+        self._refresh_listeners: list[CALLBACK_TYPE] = []
+        # What listeners were last told, to notify only the bins that changed
+        self._notified_data: Schedule | None = None
+        self._notified_success = True
 
         super().__init__(
             hass, _LOGGER, name=DOMAIN, config_entry=entry, always_update=False
-        )  
+        )
 
-    async def _async_update_data(self) -> dict[str, date]:
+    async def _async_update_data(self) -> Schedule:
         """Fetch the latest waste collection dates from the service."""
         try:
-            return await self.service.get_waste_collection_data(self.geolocation_id)
+            data = await self.hub.async_fetch(self)
         except CannotConnect as err:
+            self._async_schedule_retry()
             raise UpdateFailed("Failed to connect to the council's service") from err
+        except CouncilServiceError:
+            self._async_schedule_retry()
+            raise
+        self._async_handle_schedule(data)
+        self.store.async_save(data)
+        return data
+
+    @callback
+    def async_set_updated_data(self, data: Schedule) -> None:
+        """Update data shared by another entry and save it."""
+        self._async_handle_schedule(data)
+        super().async_set_updated_data(data)
+        self.store.async_save(data)
+        self._async_refresh_finished()
+
+    @callback
+    def _async_handle_schedule(self, data: Schedule) -> None:
+        """Learn from a new schedule and time the next refresh from it."""
+        now = dt_util.now()
+        today = now.date()
+        self.consecutive_failures = 0
+        self.recurrence.observe(data, today)
+        # Calendar feeds are cached on the index's identity, so it is only
+        # replaced when the projection can have changed
+        if self._events_source != (data, today):
+            self._events_source = (data, today)
+            self.events = CollectionEventIndex.build(
+                self.recurrence, today, CALENDAR_HORIZON_DAYS
+            )
+        self.update_interval = jittered(
+            next_refresh_interval(data, now) + self.refresh_offset, REFRESH_JITTER
+        )
+
+    @callback
+    def _async_schedule_retry(self) -> None:
+        """Back off exponentially between retries after a failed fetch."""
+        self.consecutive_failures += 1
+        self.update_interval = min(
+            RETRY_INTERVAL_MIN * 2 ** (self.consecutive_failures - 1),
+            RETRY_INTERVAL_MAX,
+        )
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners, skipping bins whose date did not change.
+
+        Listeners with a bin colour as their context are only called when that
+        bin's date or the coordinator's availability changed. Listeners without
+        a context are always called.
+        """
+        previous, self._notified_data = self._notified_data, self.data
+        was_successful, self._notified_success = (
+            self._notified_success,
+            self.last_update_success,
+        )
+        if previous is None or was_successful != self.last_update_success:
+            super().async_update_listeners()
+            return
+
+        data = self.data or {}
+        changed = {
+            key
+            for key in previous.keys() | data.keys()
+            if previous.get(key) != data.get(key)
+        }
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
+
+    def next_collection(self, colour: str, today: date) -> date | None:
+        """Return a bin's next collection on or after today.
+
+        A date that has passed is projected forward until the next refresh.
+        """
+        if self.data is None or (pickup := self.data.get(colour)) is None:
+            return None
+        if pickup >= today:
+            return pickup
+        return next(self.recurrence.occurrences(colour, today), None)
+
+    @property
+    def fetch_metrics(self) -> FetchMetrics | None:
+        """Return the service's fetch metrics for this entry's address."""
+        return self.hub.service.metrics.get(self.geolocation_id)
+
+    @callback
+    def async_add_refresh_listener(
+        self, update_callback: CALLBACK_TYPE
+    ) -> Callable[[], None]:
+        """Listen for every finished refresh, whether or not the data changed."""
+        self._refresh_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._refresh_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_refresh_finished(self) -> None:
+        """Let refresh listeners know about the fetch that just finished.
+
+        Called by every refresh, whatever the outcome, and by shared updates.
+        """
+        super()._async_refresh_finished()
+        for update_callback in list(self._refresh_listeners):
+            update_callback()
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next refresh and remember when it is due."""
+        super()._schedule_refresh()
+        if self.update_interval is not None:
+            self.next_refresh = dt_util.utcnow() + self.update_interval
+
+    async def async_restore(self) -> bool:
+        """Load the last saved schedule, returning True if one was restored."""
+        if (data := await self.store.async_load()) is None:
+            return False
+        self.data = data
+        self._async_handle_schedule(data)
+        return True
+
+    @callback
+    def async_schedule_startup_refresh(self) -> CALLBACK_TYPE:
+        """Refresh a restored schedule in this address's slot after startup.
+
+        Returns a callback to cancel the refresh.
+        """
+        delay = jittered(
+            refresh_offset(self.geolocation_id, STARTUP_REFRESH_SPREAD),
+            REFRESH_JITTER,
+        )
+        return async_call_later(self.hass, delay, self._async_startup_refresh)
+
+    @callback
+    def _async_startup_refresh(self, _now: datetime) -> None:
+        """Start the refresh of a restored schedule."""
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self.async_refresh(),
+            f"{DOMAIN} {self.config_entry.title} refresh",
+        )
@@ -2,14 +2,57 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime
+import asyncio
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+import hashlib
+from http import HTTPStatus
 import logging
+import time
 from typing import Any
+from urllib.parse import quote
 
 import aiohttp
-from bs4 import BeautifulSoup
+from aiohttp import hdrs
 
-from .const import ADD_SEARCH_URL, WASTE_COLLECTION_DATES_URL, BIN_COLOUR_MAP
+from .const import (
+    ADD_SEARCH_URL,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+    MAX_RESPONSE_SIZE,
+    PARSE_MAX_WORKERS,
+    REFRESH_BURST,
+    REFRESH_MAX_WAIT,
+    REFRESH_REQUESTS_PER_SECOND,
+    REQUEST_ATTEMPTS,
+    REQUEST_TIMEOUT,
+    RETRY_AFTER_MAX,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+    SEARCH_BURST,
+    SEARCH_MAX_WAIT,
+    SEARCH_REQUESTS_PER_SECOND,
+    STREAM_CHUNK_SIZE,
+    WASTE_COLLECTION_DATES_URL,
+)
+from .date_formats import CollectionDateParser
+from .metrics import FetchMetrics
+from .parser import (
+    ResponseContentDecoder,
+    UnrecognisedMarkup,
+    WasteDatesExtractor,
+    extract_pickups_soup,
+)
+from .resilience import (
+    CircuitBreaker,
+    TokenBucket,
+    async_backoff,
+    is_transient,
+    retry_after,
+)
+from .schedule import Schedule
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,12 +65,161 @@ class CannotConnect(CouncilServiceError):
     """Exception to indicate a connection error."""
 
 
+class CircuitOpen(CannotConnect):
+    """Exception to indicate requests are paused after repeated failures."""
+
+
+class RateLimited(CannotConnect):
+    """Exception to indicate a request gave up waiting for the rate limit."""
+
+
+class ResponseTooLarge(CouncilServiceError):
+    """Exception to indicate a response larger than MAX_RESPONSE_SIZE."""
+
+
+@dataclass(slots=True)
+class _Page:
+    """What was read of the waste services page, and its validators."""
+
+    content_hash: bytes
+    size: int
+    # None when the markup needs the BeautifulSoup fallback
+    pickups: list[tuple[str, str]] | None
+    service_count: int
+    # The whole page, only kept for the fallback
+    html_content: str | None
+    extract_duration: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+@dataclass(slots=True)
+class _CachedSchedule:
+    """The last parsed schedule for an address and how to revalidate it."""
+
+    content_hash: bytes
+    dates: Schedule
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+def _check_size(response: aiohttp.ClientResponse) -> None:
+    """Refuse a response that declares a body larger than MAX_RESPONSE_SIZE."""
+    if (size := response.content_length) is not None and size > MAX_RESPONSE_SIZE:
+        raise ResponseTooLarge(f"Response of {size} bytes is too large")
+
+
+class _PageReader:
+    """Decodes, hashes and extracts the page one body chunk at a time.
+
+    The content hash covers the markup that was read, which determines the
+    extracted pickups. Chunks are fed in the parser pool, one at a time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the reader."""
+        self._decoder = ResponseContentDecoder()
+        self._extractor: WasteDatesExtractor | None = WasteDatesExtractor()
+        self._content_hash = hashlib.blake2b(digest_size=16)
+        # Held until the extractor has finished, in case the fallback needs it
+        self._markup: list[str] = []
+        self._extract_duration = 0.0
+
+    def feed(self, chunk: bytes) -> bool:
+        """Consume a chunk of the body, returning True once every bin has text."""
+        start = time.perf_counter()
+        text = self._decoder.feed(chunk)
+        self._content_hash.update(text.encode())
+        if self._extractor is not None:
+            try:
+                self._extractor.feed(text)
+            except UnrecognisedMarkup as err:
+                _LOGGER.debug("Falling back to BeautifulSoup parser: %s", err)
+                self._extractor = None
+        self._markup.append(text)
+        self._extract_duration += time.perf_counter() - start
+        return self._extractor is not None and self._extractor.done
+
+    def check_complete(self) -> None:
+        """Check the whole page was in the body."""
+        self._decoder.close()
+
+    def close(self, response: aiohttp.ClientResponse, size: int) -> _Page:
+        """Finish extraction and return what was read of the page."""
+        pickups = None
+        service_count = 0
+        if self._extractor is not None:
+            try:
+                pickups = self._extractor.close()
+                service_count = self._extractor.service_elements
+            except UnrecognisedMarkup as err:
+                _LOGGER.debug("Falling back to BeautifulSoup parser: %s", err)
+        return _Page(
+            self._content_hash.digest(),
+            size,
+            pickups,
+            service_count,
+            "".join(self._markup) if pickups is None else None,
+            self._extract_duration,
+            response.headers.get(hdrs.ETAG),
+            response.headers.get(hdrs.LAST_MODIFIED),
+        )
+
+
+async def _async_read_page(
+    response: aiohttp.ClientResponse, executor: ThreadPoolExecutor
+) -> _Page:
+    """Stream the page out of the response and extract pickups as it arrives.
+
+    Reading stops as soon as every bin colour has collection text, leaving the
+    rest of the body unread. Decoding and extraction run in executor.
+    """
+    loop = asyncio.get_running_loop()
+    reader = _PageReader()
+    size = 0
+    async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+        size += len(chunk)
+        if size > MAX_RESPONSE_SIZE:
+            raise ResponseTooLarge(f"Response exceeded {MAX_RESPONSE_SIZE} bytes")
+        if await loop.run_in_executor(executor, reader.feed, chunk):
+            break
+    else:
+        reader.check_complete()
+    return reader.close(response, size)
+
+
 class CouncilService:
     """A class to interface with the council's waste collection service."""
 
     def __init__(self, session: aiohttp.ClientSession) -> None:
         """Initialize the council service."""
         self._session = session
+        self._schedules: dict[str, _CachedSchedule] = {}
+        # Fetches answered without parsing (304 or unchanged content) vs parsed
+        self.parse_cache_hits = 0
+        self.parse_cache_misses = 0
+        # Parsing is CPU bound, keep it off the event loop in a small pool
+        self._parse_executor = ThreadPoolExecutor(
+            max_workers=PARSE_MAX_WORKERS, thread_name_prefix="blacktown_bin_buddy"
+        )
+        self.last_parse_duration: float | None = None
+        self._date_parser = CollectionDateParser()
+        # Fetch and parse performance per geolocation ID
+        self.metrics: dict[str, FetchMetrics] = {}
+        # Shared by every request so a struggling endpoint is left alone
+        self.breaker = CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT)
+        # Separate request budgets, so searches are not held up by refreshes
+        self.search_bucket = TokenBucket(
+            SEARCH_REQUESTS_PER_SECOND, SEARCH_BURST, SEARCH_MAX_WAIT
+        )
+        self.refresh_bucket = TokenBucket(
+            REFRESH_REQUESTS_PER_SECOND, REFRESH_BURST, REFRESH_MAX_WAIT
+        )
+        self._timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+
+    def close(self) -> None:
+        """Release the parser threads."""
+        self._parse_executor.shutdown(wait=False, cancel_futures=True)
 
     async def search_address(self, search_term: str) -> list[dict[str, Any]]:
         """Search for an address and return a list of matching suggestions.
@@ -43,93 +235,229 @@ class CouncilService:
             CannotConnect: If there is a network-related error.
             CouncilServiceError: For other unexpected errors.
         """
-        search_url = f"{ADD_SEARCH_URL}{search_term}"
+        search_url = f"{ADD_SEARCH_URL}{quote(search_term)}"
+
+        async def _read(response: aiohttp.ClientResponse) -> list[dict[str, Any]]:
+            response.raise_for_status()
+            _check_size(response)
+            # The API returns a list of address suggestions
+            return await response.json()
+
         try:
-            async with self._session.get(search_url) as response:
-                response.raise_for_status()
-                # The API returns a list of address suggestions
-                return await response.json()
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Error searching for address: %s", err)
+            return await self._async_request(self.search_bucket, search_url, _read)
+        except CouncilServiceError:
+            raise
+        except (aiohttp.ClientError, TimeoutError) as err:
+            _LOGGER.error("Error searching for address: %r", err)
             raise CannotConnect from err
         except Exception as err:
             _LOGGER.exception("Unexpected error during address search")
             raise CouncilServiceError from err
 
-    async def get_waste_collection_data(self, geolocation_id: str) -> dict[str, date]:
+    async def get_waste_collection_data(self, geolocation_id: str) -> Schedule:
         """Fetch and parse waste collection dates for a given geolocation ID.
 
+        Requests are made conditional on the last response's validators, and a
+        response whose content is unchanged reuses the last parsed result. The
+        body is streamed into the extractor and the rest of it is left unread
+        once every bin has a date.
+
         Args:
             geolocation_id: The unique identifier for the address.
 
         Returns:
-            A dictionary mapping waste type to its next collection date object.
-            Example: {'general-waste': datetime.date(2025, 9, 16)}
+            The shared schedule mapping waste type to its next collection date.
+            Example: Schedule({'red': datetime.date(2025, 9, 16)})
 
         Raises:
             CannotConnect: If there is a network-related error.
             CouncilServiceError: For other unexpected errors.
         """
         url = f"{WASTE_COLLECTION_DATES_URL}{geolocation_id}"
+        cached = self._schedules.get(geolocation_id)
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers[hdrs.IF_NONE_MATCH] = cached.etag
+            if cached.last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = cached.last_modified
+        metrics = self.metrics.setdefault(geolocation_id, FetchMetrics())
+
+        async def _read(response: aiohttp.ClientResponse) -> _Page | None:
+            if cached is not None and response.status == HTTPStatus.NOT_MODIFIED:
+                return None
+            response.raise_for_status()
+            _check_size(response)
+            return await _async_read_page(response, self._parse_executor)
+
+        start = time.perf_counter()
         try:
-            async with self._session.get(url) as response:
-                response.raise_for_status()
-                html_content = await response.json()
-                return self._parse_waste_dates_html(html_content["responseContent"])
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Error fetching waste collection dates: %s", err)
+            page = await self._async_request(self.refresh_bucket, url, _read, headers)
+            if page is None:
+                assert cached is not None
+                metrics.record_fetch(time.perf_counter() - start, 0)
+                self.parse_cache_hits += 1
+                metrics.cache_hits += 1
+                return cached.dates
+
+            metrics.record_fetch(time.perf_counter() - start, page.size)
+
+            if cached is not None and cached.content_hash == page.content_hash:
+                # Same page as last time, skip parsing
+                self.parse_cache_hits += 1
+                metrics.cache_hits += 1
+            else:
+                self.parse_cache_misses += 1
+                metrics.cache_misses += 1
+                cached = _CachedSchedule(
+                    page.content_hash,
+                    await self._async_parse(page, geolocation_id, metrics),
+                )
+                self._schedules[geolocation_id] = cached
+            cached.etag = page.etag
+            cached.last_modified = page.last_modified
+            return cached.dates
+        except CouncilServiceError:
+            raise
+        except (aiohttp.ClientError, TimeoutError) as err:
+            _LOGGER.error("Error fetching waste collection dates: %r", err)
             raise CannotConnect from err
         except Exception as err:
             _LOGGER.exception("Unexpected error fetching waste dates")
             raise CouncilServiceError from err
 
-    def _parse_waste_dates_html(self, html_content: str) -> dict[str, date]:
-        """Parse the HTML content to extract waste collection dates.
+    async def _async_request[T](
+        self,
+        bucket: TokenBucket,
+        url: str,
+        read: Callable[[aiohttp.ClientResponse], Awaitable[T]],
+        headers: dict[str, str] | None = None,
+    ) -> T:
+        """Make a GET request and return what read makes of the response.
+
+        Every attempt takes a token from bucket and is bounded by REQUEST_TIMEOUT.
+        Transient errors are retried with jittered exponential backoff, and the
+        shared circuit breaker fails requests fast while the council's service
+        keeps failing.
 
-        Note: This parser is based on the observed HTML structure of the council's
-        website. If the website layout changes, this function will need to be updated.
+        Raises:
+            CircuitOpen: If the circuit breaker is open.
+            RateLimited: If no token was free within the bucket's max_wait.
         """
-        soup = BeautifulSoup(html_content, "html.parser")
-        collection_dates: dict[str, date] = {}
-
-        # Find all service containers with the 'regular-service' class
-        service_elements = soup.find_all("div", class_="regular-service")
-        _LOGGER.info("Found %d service elements in HTML", len(service_elements))
-        for element in service_elements:
-            element_classes = element.get("class", [])
-            waste_type = None
-
-            # Determine waste type from bin color class
-            for color, type_name in BIN_COLOUR_MAP.items():
-                if type_name in element_classes:
-                    waste_type = color
-                    break
-
-            if not waste_type:
-                continue
-
-            # Find the div that contains the date information
-            date_container = element.find("div", class_="next-service")
-
-            if date_container:
-                pickup_date_str = date_container.text.strip()
-                try:
-                    # Expected format: "Fri 12/9/2025", so we split and take the date part
-                    date_part = pickup_date_str.split(" ")[1]
-                    pickup_date = datetime.strptime(date_part, "%d/%m/%Y").date()
-                    collection_dates[waste_type] = pickup_date
-                except (IndexError, ValueError) as e:
+        if not self.breaker.allow_request():
+            raise CircuitOpen("Council service is unavailable, retrying later")
+        try:
+            result = await self._async_attempts(bucket, url, read, headers)
+        except RateLimited:
+            # Nothing was learned about the service
+            self.breaker.release()
+            raise
+        except Exception as err:
+            if is_transient(err):
+                self.breaker.record_failure()
+            else:
+                # The service answered, even if not how we hoped
+                self.breaker.record_success()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+        self.breaker.record_success()
+        return result
+
+    async def _async_attempts[T](
+        self,
+        bucket: TokenBucket,
+        url: str,
+        read: Callable[[aiohttp.ClientResponse], Awaitable[T]],
+        headers: dict[str, str] | None,
+    ) -> T:
+        """Attempt a request up to REQUEST_ATTEMPTS times."""
+        attempt = 1
+        while True:
+            try:
+                await bucket.async_acquire()
+            except TimeoutError as err:
+                raise RateLimited("Too many requests to the council service") from err
+            try:
+                async with self._session.get(
+                    url, headers=headers, timeout=self._timeout
+                ) as response:
+                    return await read(response)
+            except Exception as err:
+                if (delay := retry_after(err, RETRY_AFTER_MAX)) is not None:
+                    # The council throttles us as a whole, hold back every request
                     _LOGGER.warning(
-                        "Could not parse date string: '%s'. Error: %s",
-                        pickup_date_str,
-                        e,
+                        "Council service asked us to wait %.0f seconds", delay
                     )
-                    # Handle special message currently being displayed for green waste - it is picked up on the same day as red waste
-                    if (
-                        collection_dates.get("red") is not None
-                        and waste_type == "green"
-                    ):
-                        collection_dates["green"] = collection_dates["red"]
+                    self.search_bucket.pause(delay)
+                    self.refresh_bucket.pause(delay)
+                if attempt == REQUEST_ATTEMPTS or not is_transient(err):
+                    raise
+                _LOGGER.debug(
+                    "Attempt %d of %d failed, retrying: %r",
+                    attempt,
+                    REQUEST_ATTEMPTS,
+                    err,
+                )
+                await async_backoff(attempt, RETRY_BACKOFF_BASE, RETRY_BACKOFF_MAX)
+                attempt += 1
+
+    async def _async_parse(
+        self, page: _Page, geolocation_id: str, metrics: FetchMetrics
+    ) -> Schedule:
+        """Turn the page's pickups into dates in the parser pool and time it.
+
+        The parse time includes the streamed extraction.
+        """
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        collection_dates, service_count = await loop.run_in_executor(
+            self._parse_executor, self._parse_page, page, geolocation_id, metrics
+        )
+        self.last_parse_duration = page.extract_duration + time.perf_counter() - start
+        metrics.record_parse(self.last_parse_duration, service_count)
+        _LOGGER.debug(
+            "Parsed %d service elements in %.4f seconds",
+            service_count,
+            self.last_parse_duration,
+        )
+        return Schedule.of(collection_dates)
+
+    def _parse_page(
+        self, page: _Page, geolocation_id: str, metrics: FetchMetrics
+    ) -> tuple[dict[str, date], int]:
+        """Return the page's collection dates and the service elements seen.
+
+        Markup the streaming extractor rejected is parsed with BeautifulSoup.
+        """
+        pickups, service_count = page.pickups, page.service_count
+        if pickups is None:
+            assert page.html_content is not None
+            pickups, service_count = extract_pickups_soup(page.html_content)
+        return self._pickup_dates(pickups, geolocation_id, metrics), service_count
+
+    def _pickup_dates(
+        self,
+        pickups: list[tuple[str, str]],
+        geolocation_id: str | None = None,
+        metrics: FetchMetrics | None = None,
+    ) -> dict[str, date]:
+        """Convert (colour, text) pairs to collection dates.
+
+        Text in no known format is counted in the address's metrics.
+        """
+        collection_dates, unparsed = self._date_parser.parse_pickups(
+            pickups, geolocation_id
+        )
+        for waste_type, pickup_date_str in unparsed:
+            _LOGGER.warning(
+                "Could not parse date string for %s bin: '%s'",
+                waste_type,
+                pickup_date_str,
+            )
+        if metrics is not None:
+            metrics.unparsed_dates += len(unparsed)
 
         if not collection_dates:
             _LOGGER.warning(
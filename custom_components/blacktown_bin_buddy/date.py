@@ -10,11 +10,11 @@ from homeassistant.components.date import DateEntity, DateEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 import logging
 
-from .const import DOMAIN
 from .coordinator import BinBuddyCoordinator
+from .entity import BinBuddyEntity
+from .schedule import Schedule
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,7 +23,7 @@ _LOGGER = logging.getLogger(__name__)
 class BinBuddyDateEntityDescription(DateEntityDescription):
     """Describes a Bin Buddy date entity."""
 
-    value_fn: Callable[[dict[str, date]], date | None]
+    value_fn: Callable[[Schedule], date | None]
 
 
 # Define the entities for each waste type
@@ -33,21 +33,21 @@ ENTITIES: tuple[BinBuddyDateEntityDescription, ...] = (
         name="General Waste",
         translation_key="general_waste",
         icon="mdi:trash-can",
-        value_fn=lambda data: data.get("red"),
+        value_fn=lambda data: data.red,
     ),
     BinBuddyDateEntityDescription(
         key="yellow",
         name="Recycling",
         translation_key="recycling",
         icon="mdi:recycle",
-        value_fn=lambda data: data.get("yellow"),
+        value_fn=lambda data: data.yellow,
     ),
     BinBuddyDateEntityDescription(
         key="green",
         name="Food and Garden Waste",
         translation_key="food_and_garden_waste",
         icon="mdi:leaf",
-        value_fn=lambda data: data.get("green"),
+        value_fn=lambda data: data.green,
     ),
 )
 
@@ -60,18 +60,15 @@ async def async_setup_entry(
     """Set up the date entities from a config entry."""
     coordinator: BinBuddyCoordinator = entry.runtime_data
     _LOGGER.debug("Setting up date entities %s", coordinator.data)
-    # Create entities if they have data from the initial refresh
+    # Every bin is added up front, the first refresh may still be running
     async_add_entities(
-        BinBuddyDateEntity(coordinator, description)
-        for description in ENTITIES
-        if description.key in coordinator.data
+        BinBuddyDateEntity(coordinator, description) for description in ENTITIES
     )
 
 
-class BinBuddyDateEntity(CoordinatorEntity[BinBuddyCoordinator], DateEntity):
+class BinBuddyDateEntity(BinBuddyEntity, DateEntity):
     """Represents a bin collection date."""
 
-    _attr_has_entity_name = True
     entity_description: BinBuddyDateEntityDescription
 
     def __init__(
@@ -80,17 +77,19 @@ class BinBuddyDateEntity(CoordinatorEntity[BinBuddyCoordinator], DateEntity):
         description: BinBuddyDateEntityDescription,
     ) -> None:
         """Initialize the date entity."""
-        super().__init__(coordinator)
+        # Only updated when this bin's date changes
+        super().__init__(coordinator, context=description.key)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.config_entry.entry_id)},
-            "name": "Bin Collection",
-            "manufacturer": "Blacktown City Council",
-            "entry_type": "service",
-        }
+
+    @property
+    def available(self) -> bool:
+        """Return True once the first schedule has been fetched or restored."""
+        return super().available and self.coordinator.data is not None
 
     @property
     def native_value(self) -> date | None:
         """Return the next collection date."""
+        if self.coordinator.data is None:
+            return None
         return self.entity_description.value_fn(self.coordinator.data)
@@ -0,0 +1,154 @@
+"""Recognition of the collection dates written on the council's waste services page."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+import re
+
+from .const import BIN_COLOUR_MAP, BIN_NAMES
+
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        "jan feb mar apr may jun jul aug sep oct nov dec".split(), start=1
+    )
+}
+_MONTH_NAME = (
+    r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?"
+    r"|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DateFormat:
+    """A way the council writes a collection date.
+
+    The pattern has day, month and year groups. The month is a number or an
+    English month name.
+    """
+
+    name: str
+    pattern: re.Pattern[str]
+
+    def match(self, text: str) -> date | None:
+        """Return the date in text if it is written in this format."""
+        if (match := self.pattern.search(text)) is None:
+            return None
+        month = match["month"]
+        try:
+            return date(
+                int(match["year"]),
+                int(month) if month.isdigit() else _MONTHS[month[:3].lower()],
+                int(match["day"]),
+            )
+        except ValueError:
+            # Looks like a date but is not one, such as 31/2/2025
+            return None
+
+
+# Known formats, most common first
+DATE_FORMATS = (
+    # Fri 12/9/2025
+    DateFormat(
+        "numeric",
+        re.compile(r"\b(?P<day>\d{1,2})/(?P<month>\d{1,2})/(?P<year>\d{4})\b"),
+    ),
+    # Tuesday, 16 September 2025
+    DateFormat(
+        "long",
+        re.compile(
+            rf"\b(?P<day>\d{{1,2}})(?:st|nd|rd|th)?\s+(?P<month>{_MONTH_NAME})\.?,?"
+            r"\s+(?P<year>\d{4})\b",
+            re.IGNORECASE,
+        ),
+    ),
+)
+
+
+def _bin_key(name: str) -> str:
+    """Return the lookup key for a way of naming a bin."""
+    return " ".join(name.replace("-", " ").casefold().split())
+
+
+# Colour for each way a bin is named: its colour, its service class on the
+# page ("general-waste") and its display name ("General Waste")
+_BIN_COLOURS = {
+    _bin_key(name): colour
+    for colour in BIN_COLOUR_MAP
+    for name in (colour, BIN_COLOUR_MAP[colour], BIN_NAMES.get(colour, colour))
+}
+
+# Messages giving no date of their own, such as "Collected with your red bin"
+# or "Same day as your general waste bin"
+_SAME_DAY_AS_RE = re.compile(
+    r"\b(?:with|same day as)\s+(?:your\s+|the\s+)?(?P<bin>"
+    + "|".join(
+        r"[-\s]+".join(map(re.escape, key.split()))
+        for key in sorted(_BIN_COLOURS, key=len, reverse=True)
+    )
+    + r")\b",
+    re.IGNORECASE,
+)
+
+# Council's standing rule for a bin whose text is not understood at all: green
+# waste is picked up on the same day as red waste
+_FALLBACK_SAME_DAY_AS = {"green": "red"}
+
+
+class CollectionDateParser:
+    """Turn the collection text of each bin into dates.
+
+    The format that last matched for an address is tried first, so the common
+    case is a single pattern match.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        self._last_format: dict[str, DateFormat] = {}
+
+    def parse(self, text: str, key: str | None = None) -> date | None:
+        """Return the date in text, remembering its format under key."""
+        last = self._last_format.get(key) if key is not None else None
+        if last is not None and (pickup_date := last.match(text)) is not None:
+            return pickup_date
+        for date_format in DATE_FORMATS:
+            if date_format is last:
+                continue
+            if (pickup_date := date_format.match(text)) is not None:
+                if key is not None:
+                    self._last_format[key] = date_format
+                return pickup_date
+        return None
+
+    def parse_pickups(
+        self, pickups: list[tuple[str, str]], key: str | None = None
+    ) -> tuple[dict[str, date], list[tuple[str, str]]]:
+        """Return the dates of (colour, text) pairs and the pairs not understood.
+
+        A bin collected on the same day as another takes that bin's date,
+        wherever the two appear on the page. As a last resort, a green bin whose
+        text is not understood takes the red bin's date, and is still returned
+        as not understood.
+        """
+        collection_dates: dict[str, date] = {}
+        # (colour, text, the bin the text names if any) for text with no date
+        undated: list[tuple[str, str, str | None]] = []
+        unparsed: list[tuple[str, str]] = []
+        for colour, text in pickups:
+            if (pickup_date := self.parse(text, key)) is not None:
+                collection_dates[colour] = pickup_date
+            elif (match := _SAME_DAY_AS_RE.search(text)) is not None:
+                undated.append((colour, text, _BIN_COLOURS[_bin_key(match["bin"])]))
+            else:
+                undated.append((colour, text, None))
+
+        for colour, text, named in undated:
+            if named in collection_dates:
+                collection_dates.setdefault(colour, collection_dates[named])
+                continue
+            # Not understood, even if the standing rule gives it a date
+            unparsed.append((colour, text))
+            if (fallback := _FALLBACK_SAME_DAY_AS.get(colour)) in collection_dates:
+                collection_dates.setdefault(colour, collection_dates[fallback])
+        return collection_dates, unparsed
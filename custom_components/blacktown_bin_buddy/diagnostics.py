@@ -0,0 +1,51 @@
+"""Diagnostics support for the Blacktown Bin Buddy integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .coordinator import BinBuddyCoordinator
+
+# The title and ID identify the address
+TO_REDACT = {"id", "title", "AddressSingleLine"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: BinBuddyCoordinator = entry.runtime_data
+    metrics = coordinator.fetch_metrics
+    next_refresh = coordinator.next_refresh
+
+    return {
+        "entry": async_redact_data(
+            {"title": entry.title, "data": dict(entry.data)}, TO_REDACT
+        ),
+        "schedule": {
+            colour: collection.isoformat()
+            for colour, collection in (coordinator.data or {}).items()
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "last_exception": repr(coordinator.last_exception)
+            if coordinator.last_exception
+            else None,
+            "consecutive_failures": coordinator.consecutive_failures,
+            "circuit": coordinator.hub.service.breaker.state,
+            "update_interval": coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None,
+            "next_refresh": next_refresh.isoformat() if next_refresh else None,
+            "seconds_to_next_refresh": (next_refresh - dt_util.utcnow()).total_seconds()
+            if next_refresh
+            else None,
+        },
+        "cadences": coordinator.recurrence.cadences,
+        "metrics": metrics.as_dict() if metrics is not None else None,
+    }
@@ -0,0 +1,97 @@
+"""Base entities for the Blacktown Bin Buddy integration."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import BIN_NAMES, DOMAIN
+from .coordinator import BinBuddyCoordinator
+
+
+class BinBuddyEntity(CoordinatorEntity[BinBuddyCoordinator]):
+    """An entity of an address's Bin Collection device."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: BinBuddyCoordinator, context: Any = None) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator, context)
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, coordinator.config_entry.entry_id)},
+            "name": "Bin Collection",
+            "manufacturer": "Blacktown City Council",
+            "entry_type": "service",
+        }
+
+
+class BinBuddyCountdownEntity(BinBuddyEntity, ABC):
+    """An entity whose state follows the days until a bin's next collection.
+
+    The state only changes when the bin's date does or when a day passes. Rather
+    than polling, each entity asks the hub's MidnightDispatcher to wake it on the
+    next day its state changes.
+    """
+
+    def __init__(self, coordinator: BinBuddyCoordinator, colour: str) -> None:
+        """Initialize the entity."""
+        # Only updated when this bin's date changes
+        super().__init__(coordinator, context=colour)
+        self.colour = colour
+        self.days_until: int | None = None
+        self._cancel_wakeup: CALLBACK_TYPE | None = None
+        self._bin_name = BIN_NAMES.get(colour, colour)
+
+    @property
+    def available(self) -> bool:
+        """Return True once the first schedule has been fetched or restored."""
+        return super().available and self.coordinator.data is not None
+
+    @abstractmethod
+    def days_until_change(self, days_until: int) -> int:
+        """Return how many days from today the state next changes."""
+
+    async def async_added_to_hass(self) -> None:
+        """Start counting down."""
+        await super().async_added_to_hass()
+        self._async_update_countdown()
+        self.async_on_remove(self._async_cancel_wakeup)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recount from the bin's new date."""
+        self._async_update_countdown()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_midnight(self) -> None:
+        """Recount on the day the state changes."""
+        self._cancel_wakeup = None
+        self._async_update_countdown()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_update_countdown(self) -> None:
+        """Count the days until the next collection and schedule the next change."""
+        self._async_cancel_wakeup()
+        today = dt_util.now().date()
+        if (pickup := self.coordinator.next_collection(self.colour, today)) is None:
+            self.days_until = None
+            return
+        self.days_until = (pickup - today).days
+        self._cancel_wakeup = self.coordinator.hub.midnight.async_schedule(
+            today + timedelta(days=self.days_until_change(self.days_until)),
+            self._async_midnight,
+        )
+
+    @callback
+    def _async_cancel_wakeup(self) -> None:
+        """Cancel the scheduled wake-up, if any."""
+        if self._cancel_wakeup is not None:
+            self._cancel_wakeup()
+            self._cancel_wakeup = None
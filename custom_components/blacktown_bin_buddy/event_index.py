@@ -0,0 +1,60 @@
+"""Sorted index of projected bin collections for range queries."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+from .recurrence import RecurrenceEngine
+
+
+class CollectionEventIndex:
+    """Projected collections as parallel, date-ordered lists of ordinals and bins.
+
+    Built once per schedule update. Range queries bisect the ordinals, so they
+    cost O(log n) plus the number of collections returned.
+    """
+
+    __slots__ = ("_colours", "_ordinals")
+
+    def __init__(self, ordinals: list[int], colours: list[str]) -> None:
+        """Initialize the index from ordinals sorted ascending and their bins."""
+        self._ordinals = ordinals
+        self._colours = colours
+
+    @classmethod
+    def build(
+        cls, engine: RecurrenceEngine, start: date, horizon_days: int
+    ) -> CollectionEventIndex:
+        """Project every bin's collections from start for horizon_days days."""
+        last = start.toordinal() + horizon_days
+        ordinals: list[int] = []
+        colours: list[str] = []
+        for ordinal, colour in engine.merged_ordinals(start):
+            if ordinal > last:
+                break
+            ordinals.append(ordinal)
+            colours.append(colour)
+        return cls(ordinals, colours)
+
+    def __len__(self) -> int:
+        """Return the number of indexed collections."""
+        return len(self._ordinals)
+
+    def between(self, first: date, last: date) -> list[tuple[date, str]]:
+        """Return the collections from first to last inclusive, in date order."""
+        lo = bisect_left(self._ordinals, first.toordinal())
+        hi = bisect_right(self._ordinals, last.toordinal(), lo)
+        return [
+            (date.fromordinal(ordinal), colour)
+            for ordinal, colour in zip(
+                self._ordinals[lo:hi], self._colours[lo:hi], strict=True
+            )
+        ]
+
+    def first_on_or_after(self, day: date) -> tuple[date, str] | None:
+        """Return the first collection on or after a day."""
+        index = bisect_left(self._ordinals, day.toordinal())
+        if index == len(self._ordinals):
+            return None
+        return date.fromordinal(self._ordinals[index]), self._colours[index]
@@ -0,0 +1,161 @@
+"""Shared fetch hub for the Blacktown Bin Buddy integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .address_index import AddressIndexStore
+from .address_search import AddressSearchCache
+from .const import DOMAIN, MAX_CONCURRENT_FETCHES
+from .council_service import CouncilService
+from .midnight import MidnightDispatcher
+from .schedule import Schedule
+from .session import async_create_council_session
+
+if TYPE_CHECKING:
+    from .coordinator import BinBuddyCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_HUB: HassKey[BinBuddyHub] = HassKey(f"{DOMAIN}_hub")
+
+
+class BinBuddyHub:
+    """Coalesces council fetches for every config entry sharing an address.
+
+    Config entries are grouped by geolocation ID. Only one fetch per ID is in
+    flight at any time, at most MAX_CONCURRENT_FETCHES fetches run at once, and
+    each result is fanned out to every coordinator subscribed to that ID.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        service: CouncilService,
+        session: aiohttp.ClientSession | None = None,
+        address_index: AddressIndexStore | None = None,
+    ) -> None:
+        """Initialize the hub.
+
+        A session passed in is owned by the hub and closed with it. Addresses
+        found by searches are saved to address_index, if given.
+        """
+        self._hass = hass
+        self.service = service
+        self._session = session
+        self._unsub_close: CALLBACK_TYPE | None = None
+        if session is not None:
+            # Entries are not unloaded at shutdown, so close the pool then too
+            self._unsub_close = hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_CLOSE, self._async_on_close
+            )
+        self.address_search = AddressSearchCache(service, address_index)
+        # Day changes for every entry's countdown entities
+        self.midnight = MidnightDispatcher(hass)
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        self._subscribers: dict[str, set[BinBuddyCoordinator]] = {}
+        self._inflight: dict[str, asyncio.Task[Schedule]] = {}
+        self._requesters: dict[str, set[BinBuddyCoordinator]] = {}
+
+    @property
+    def geolocation_ids(self) -> list[str]:
+        """Return the distinct geolocation IDs with at least one subscriber."""
+        return list(self._subscribers)
+
+    @callback
+    def async_subscribe(self, coordinator: BinBuddyCoordinator) -> CALLBACK_TYPE:
+        """Subscribe a coordinator to results for its geolocation ID."""
+        geolocation_id = coordinator.geolocation_id
+        self._subscribers.setdefault(geolocation_id, set()).add(coordinator)
+
+        @callback
+        def _async_unsubscribe() -> None:
+            subscribers = self._subscribers.get(geolocation_id)
+            if subscribers is None:
+                return
+            subscribers.discard(coordinator)
+            if not subscribers:
+                del self._subscribers[geolocation_id]
+            if not self._subscribers:
+                # The last entry is gone, release the hub
+                self._hass.data.pop(DATA_HUB, None)
+                self.service.close()
+                if self._session is not None:
+                    self._hass.async_create_task(
+                        self._async_close_session(), f"{DOMAIN} close session"
+                    )
+
+        return _async_unsubscribe
+
+    async def _async_on_close(self, _event: Event) -> None:
+        """Close the hub's session when Home Assistant stops."""
+        self._unsub_close = None
+        await self._async_close_session()
+
+    async def _async_close_session(self) -> None:
+        """Close the hub's session and its connection pool."""
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        assert self._session is not None
+        await self._session.close()
+
+    async def async_fetch(self, requester: BinBuddyCoordinator) -> Schedule:
+        """Fetch collection dates for the requester's geolocation ID.
+
+        Joins the in-flight fetch for the same ID if there is one.
+        """
+        geolocation_id = requester.geolocation_id
+        task = self._inflight.get(geolocation_id)
+        if task is None:
+            self._requesters[geolocation_id] = set()
+            task = asyncio.create_task(self._async_fetch(geolocation_id))
+            self._inflight[geolocation_id] = task
+            task.add_done_callback(lambda _: self._async_fetch_done(geolocation_id))
+        self._requesters[geolocation_id].add(requester)
+        # Shield so a cancelled requester does not cancel the shared fetch
+        return await asyncio.shield(task)
+
+    async def _async_fetch(self, geolocation_id: str) -> Schedule:
+        """Run a single fetch and fan the result out to idle subscribers."""
+        async with self._semaphore:
+            data = await self.service.get_waste_collection_data(geolocation_id)
+
+        # Requesters receive the data as the result of their own refresh. Idle
+        # subscribers get it even when unchanged, which resets their refresh
+        # timers so each address is polled once rather than once per entry
+        requesters = self._requesters.get(geolocation_id, set())
+        for coordinator in list(self._subscribers.get(geolocation_id, ())):
+            if coordinator not in requesters:
+                _LOGGER.debug(
+                    "Sharing collection dates for %s with %s",
+                    geolocation_id,
+                    coordinator.config_entry.title,
+                )
+                coordinator.async_set_updated_data(data)
+        return data
+
+    @callback
+    def _async_fetch_done(self, geolocation_id: str) -> None:
+        """Forget a finished fetch."""
+        self._inflight.pop(geolocation_id, None)
+        self._requesters.pop(geolocation_id, None)
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> BinBuddyHub:
+    """Return the hub for this Home Assistant instance, creating it if needed."""
+    if (hub := hass.data.get(DATA_HUB)) is None:
+        session = async_create_council_session()
+        hub = hass.data[DATA_HUB] = BinBuddyHub(
+            hass, CouncilService(session), session, AddressIndexStore(hass)
+        )
+    return hub
@@ -0,0 +1,88 @@
+"""iCalendar rendering of projected bin collections."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, timedelta
+import hashlib
+
+PRODID = "-//Blacktown Bin Buddy//Collections//EN"
+# Content lines longer than this many octets are folded (RFC 5545 3.1)
+MAX_LINE_OCTETS = 75
+
+
+@dataclass(frozen=True, slots=True)
+class CalendarFeed:
+    """A rendered calendar and the strong ETag of its bytes."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def render(
+        cls, name: str, events: Iterable[tuple[str, date, str]]
+    ) -> CalendarFeed:
+        """Render (uid, day, summary) all-day events as a calendar."""
+        body = render_calendar(name, events)
+        return cls(body, hashlib.blake2b(body, digest_size=16).hexdigest())
+
+
+def _escape(text: str) -> str:
+    """Escape a TEXT value."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold a content line into chunks of at most MAX_LINE_OCTETS octets."""
+    if len(line.encode()) <= MAX_LINE_OCTETS:
+        return line
+    chunks: list[str] = []
+    chunk = ""
+    size = 0
+    for char in line:
+        octets = len(char.encode())
+        # Continuation lines start with a space, which counts against the limit
+        if size + octets > MAX_LINE_OCTETS - (1 if chunks else 0):
+            chunks.append(chunk)
+            chunk, size = "", 0
+        chunk += char
+        size += octets
+    chunks.append(chunk)
+    return "\r\n ".join(chunks)
+
+
+def render_calendar(name: str, events: Iterable[tuple[str, date, str]]) -> bytes:
+    """Return a VCALENDAR of (uid, day, summary) all-day events.
+
+    DTSTAMP is taken from the event's day rather than the time of rendering,
+    so the same events always render to the same bytes.
+    """
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escape(name)}",
+    ]
+    for uid, day, summary in events:
+        lines.extend(
+            (
+                "BEGIN:VEVENT",
+                f"UID:{uid}",
+                f"DTSTAMP:{day:%Y%m%d}T000000Z",
+                f"DTSTART;VALUE=DATE:{day:%Y%m%d}",
+                f"DTEND;VALUE=DATE:{day + timedelta(days=1):%Y%m%d}",
+                f"SUMMARY:{_escape(summary)}",
+                "TRANSP:TRANSPARENT",
+                "END:VEVENT",
+            )
+        )
+    lines.append("END:VCALENDAR")
+    return "".join(f"{_fold(line)}\r\n" for line in lines).encode()
@@ -0,0 +1,96 @@
+"""Fetch and parse metrics for the Blacktown Bin Buddy integration."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from .const import METRICS_WINDOW_SIZE
+
+PERCENTILES = (50, 95, 99)
+
+
+class RollingHistogram:
+    """Percentiles over the most recent samples.
+
+    Samples are kept in a fixed-size ring buffer, so memory use stays flat
+    however long Home Assistant runs.
+    """
+
+    __slots__ = ("_samples",)
+
+    def __init__(self, size: int = METRICS_WINDOW_SIZE) -> None:
+        """Initialize the histogram."""
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return len(self._samples)
+
+    def add(self, value: float) -> None:
+        """Record a sample, dropping the oldest once the buffer is full."""
+        self._samples.append(value)
+
+    def percentiles(self) -> dict[str, float]:
+        """Return the nearest-rank p50, p95 and p99 of the held samples."""
+        if not self._samples:
+            return {}
+        ordered = sorted(self._samples)
+        last = len(ordered) - 1
+        return {
+            f"p{percentile}": ordered[
+                min(last, -(-percentile * len(ordered) // 100) - 1)
+            ]
+            for percentile in PERCENTILES
+        }
+
+
+@dataclass(slots=True)
+class FetchMetrics:
+    """Fetch and parse metrics for one address."""
+
+    fetch_latency: RollingHistogram = field(default_factory=RollingHistogram)
+    parse_time: RollingHistogram = field(default_factory=RollingHistogram)
+    last_fetch_latency: float | None = None
+    last_response_size: int | None = None
+    last_parse_time: float | None = None
+    service_elements: int | None = None
+    cache_hits: int = 0
+    cache_misses: int = 0
+    # Collection text in no known date format
+    unparsed_dates: int = 0
+
+    @property
+    def cache_hit_ratio(self) -> float | None:
+        """Return the share of fetches that did not need parsing."""
+        if not (total := self.cache_hits + self.cache_misses):
+            return None
+        return self.cache_hits / total
+
+    def record_fetch(self, latency: float, response_size: int | None) -> None:
+        """Record a completed fetch."""
+        self.last_fetch_latency = latency
+        self.last_response_size = response_size
+        self.fetch_latency.add(latency)
+
+    def record_parse(self, duration: float, service_elements: int) -> None:
+        """Record a parse of the council page."""
+        self.last_parse_time = duration
+        self.service_elements = service_elements
+        self.parse_time.add(duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for diagnostics and state attributes."""
+        return {
+            "last_fetch_latency": self.last_fetch_latency,
+            "fetch_latency": self.fetch_latency.percentiles(),
+            "last_response_size": self.last_response_size,
+            "last_parse_time": self.last_parse_time,
+            "parse_time": self.parse_time.percentiles(),
+            "service_elements": self.service_elements,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_ratio": self.cache_hit_ratio,
+            "unparsed_dates": self.unparsed_dates,
+        }
@@ -0,0 +1,60 @@
+"""Shared midnight wake-ups for the Blacktown Bin Buddy integration."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.util import dt as dt_util
+
+
+class MidnightDispatcher:
+    """Runs callbacks at local midnight on the day each one asked for.
+
+    A single time tracker serves every entry. Callbacks are bucketed by day, so a
+    midnight only runs the callbacks due that day, and the tracker is removed
+    while nothing is scheduled.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the dispatcher."""
+        self._hass = hass
+        self._due: dict[int, set[CALLBACK_TYPE]] = {}
+        self._unsub_midnight: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_schedule(self, day: date, action: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Run action at the start of day, returning a callback to cancel it."""
+        ordinal = day.toordinal()
+        self._due.setdefault(ordinal, set()).add(action)
+        if self._unsub_midnight is None:
+            self._unsub_midnight = async_track_time_change(
+                self._hass, self._async_midnight, hour=0, minute=0, second=0
+            )
+
+        @callback
+        def _async_cancel() -> None:
+            if (actions := self._due.get(ordinal)) is not None:
+                actions.discard(action)
+                if not actions:
+                    del self._due[ordinal]
+            self._async_stop_if_idle()
+
+        return _async_cancel
+
+    @callback
+    def _async_midnight(self, now: datetime) -> None:
+        """Run the callbacks due today, and any missed ones."""
+        today = dt_util.as_local(now).date().toordinal()
+        for ordinal in [ordinal for ordinal in self._due if ordinal <= today]:
+            for action in self._due.pop(ordinal):
+                action()
+        self._async_stop_if_idle()
+
+    @callback
+    def _async_stop_if_idle(self) -> None:
+        """Remove the time tracker once nothing is scheduled."""
+        if not self._due and self._unsub_midnight is not None:
+            self._unsub_midnight()
+            self._unsub_midnight = None
@@ -0,0 +1,301 @@
+"""HTML extraction of bin collection text from the council's waste services page."""
+
+from __future__ import annotations
+
+import codecs
+import html
+import json
+import logging
+import re
+
+from .const import BIN_COLOUR_MAP
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_CLASS = "regular-service"
+NEXT_SERVICE_CLASS = "next-service"
+
+# Markup we act on: comments, raw text elements whose content must be skipped,
+# and div start/end tags. Quoted attribute values may contain ">".
+_TOKEN_RE = re.compile(
+    r"""<!--|<(/?)(div|script|style)\b((?:[^>"']|"[^"]*"|'[^']*')*)>""",
+    re.IGNORECASE,
+)
+_CLASS_RE = re.compile(
+    r"""\bclass\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.IGNORECASE
+)
+_INNER_TAG_RE = re.compile(r"<[^>]*>")
+_COMMENT_END_RE = re.compile(r"-->")
+_RAW_TEXT_END_RE = {
+    "script": re.compile(r"</script\s*>", re.IGNORECASE),
+    "style": re.compile(r"</style\s*>", re.IGNORECASE),
+}
+
+# The page is the string value of the response's responseContent key. Within a
+# JSON string, runs of plain characters and complete escapes are safe to decode.
+_CONTENT_KEY_RE = re.compile(r'"responseContent"\s*:\s*"')
+_STRING_PART_RE = re.compile(r'(?:[^"\\]+|\\["\\/bfnrt]|\\u[0-9a-fA-F]{4})*')
+_PARTIAL_ESCAPE_RE = re.compile(r"\\(?:u[0-9a-fA-F]{0,3})?")
+
+
+class UnrecognisedMarkup(Exception):
+    """Raised when the fast extractor sees markup it cannot handle reliably."""
+
+
+def _bin_colour(classes: list[str]) -> str | None:
+    """Return the bin colour for a service element's class list."""
+    for color, type_name in BIN_COLOUR_MAP.items():
+        if type_name in classes:
+            return color
+    return None
+
+
+class WasteDatesExtractor:
+    """Incremental single-pass extractor for bin collection text.
+
+    Only div nesting is tracked, and only the text of the first next-service div
+    inside each regular-service div is kept. Markup can be fed in chunks, and
+    feeding stops paying off as soon as every colour in BIN_COLOUR_MAP has been
+    seen. Anything that a tree builder could interpret differently raises
+    UnrecognisedMarkup so the caller can fall back to BeautifulSoup.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the extractor."""
+        self.pickups: list[tuple[str, str]] = []
+        self.service_elements = 0
+        self.done = False
+        self._buffer = ""
+        self._depth = 0
+        self._skip_re: re.Pattern[str] | None = None
+        # (colour, depth) of the regular-service div currently open
+        self._service: tuple[str | None, int] | None = None
+        self._service_text: str | None = None
+        self._capture_depth: int | None = None
+        self._capture: list[str] = []
+        self._saw_service_class = False
+
+    def feed(self, markup: str) -> bool:
+        """Consume a chunk of markup.
+
+        Returns True once every bin colour has collection text.
+        """
+        if self.done:
+            return True
+
+        data = self._buffer + markup
+        self._buffer = ""
+        if not self._saw_service_class and SERVICE_CLASS in data:
+            self._saw_service_class = True
+        pos = 0
+
+        while not self.done:
+            if self._skip_re is not None:
+                end = self._skip_re.search(data, pos)
+                if end is None:
+                    # Keep enough of the tail to match a split terminator
+                    self._buffer = data[max(pos, len(data) - 16) :]
+                    return False
+                pos = end.end()
+                self._skip_re = None
+                continue
+
+            token = _TOKEN_RE.search(data, pos)
+            if token is None:
+                break
+            if self._capture_depth is not None:
+                self._capture.append(data[pos : token.start()])
+            pos = token.end()
+            self._handle_token(token)
+
+        if self.done:
+            return True
+
+        # Hold back a possibly incomplete tag for the next chunk
+        cut = data.rfind("<", pos)
+        if cut == -1:
+            cut = len(data)
+        if self._capture_depth is not None:
+            self._capture.append(data[pos:cut])
+        self._buffer = data[cut:]
+        return False
+
+    def close(self) -> list[tuple[str, str]]:
+        """Finish extraction and return (colour, text) pairs in document order."""
+        if not self.done:
+            if self._buffer and self._capture_depth is not None:
+                self._capture.append(self._buffer)
+            self._buffer = ""
+            # Elements left open at the end of the markup are implicitly closed
+            if self._capture_depth is not None:
+                self._finish_capture()
+            if self._service is not None:
+                self._finish_service()
+            if not self.service_elements and self._saw_service_class:
+                raise UnrecognisedMarkup("service class seen outside a div")
+        return self.pickups
+
+    def _handle_token(self, token: re.Match[str]) -> None:
+        """Update state for a single comment, raw text or div tag."""
+        closing, tag, attrs = token.groups()
+        if tag is None:
+            self._skip_re = _COMMENT_END_RE
+            return
+
+        tag = tag.lower()
+        if tag != "div":
+            if not closing and not attrs.rstrip().endswith("/"):
+                self._skip_re = _RAW_TEXT_END_RE[tag]
+            return
+
+        if closing:
+            self._handle_div_end()
+        elif attrs.rstrip().endswith("/"):
+            raise UnrecognisedMarkup("self-closing div")
+        else:
+            self._handle_div_start(attrs)
+
+    def _handle_div_start(self, attrs: str) -> None:
+        """Track an opening div."""
+        self._depth += 1
+        if self._capture_depth is not None:
+            return
+
+        classes: list[str] = []
+        if (match := _CLASS_RE.search(attrs)) is not None:
+            classes = next(group for group in match.groups() if group is not None)
+            classes = html.unescape(classes).split()
+
+        if SERVICE_CLASS in classes:
+            if self._service is not None:
+                raise UnrecognisedMarkup("nested service elements")
+            self.service_elements += 1
+            self._service = (_bin_colour(classes), self._depth)
+            self._service_text = None
+        elif (
+            NEXT_SERVICE_CLASS in classes
+            and self._service is not None
+            and self._service_text is None
+        ):
+            self._capture_depth = self._depth
+            self._capture = []
+
+    def _handle_div_end(self) -> None:
+        """Track a closing div."""
+        if self._depth == 0:
+            raise UnrecognisedMarkup("unbalanced closing div")
+        if self._capture_depth == self._depth:
+            self._finish_capture()
+        if self._service is not None and self._service[1] == self._depth:
+            self._finish_service()
+        self._depth -= 1
+
+    def _finish_capture(self) -> None:
+        """Store the text of the next-service div that just closed."""
+        text = _INNER_TAG_RE.sub("", "".join(self._capture))
+        self._service_text = html.unescape(text).strip()
+        self._capture_depth = None
+        self._capture = []
+
+    def _finish_service(self) -> None:
+        """Record the regular-service div that just closed."""
+        assert self._service is not None
+        colour = self._service[0]
+        if colour is not None and self._service_text is not None:
+            self.pickups.append((colour, self._service_text))
+            self.done = all(
+                color in (found for found, _ in self.pickups)
+                for color in BIN_COLOUR_MAP
+            )
+        self._service = None
+        self._service_text = None
+
+
+class ResponseContentDecoder:
+    """Incremental decoder for the page in a waste services JSON response.
+
+    Raw body chunks are fed as they arrive and the next decoded piece of the
+    responseContent string is returned, so the page can be extracted without
+    buffering and decoding the whole body first. Escapes, multi-byte characters
+    and surrogate pairs split across chunks are held back until complete.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the decoder."""
+        self.done = False
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._in_content = False
+        self._high_surrogate = ""
+
+    def feed(self, chunk: bytes) -> str:
+        """Consume a chunk of the body and return the newly decoded markup."""
+        if self.done:
+            return ""
+
+        data = self._buffer + self._utf8.decode(chunk)
+        self._buffer = ""
+        pos = 0
+        if not self._in_content:
+            if (key := _CONTENT_KEY_RE.search(data)) is None:
+                # Keep enough of the tail to match a split key
+                self._buffer = data[-64:]
+                return ""
+            self._in_content = True
+            pos = key.end()
+
+        end = _STRING_PART_RE.match(data, pos).end()
+        if end < len(data):
+            if data[end] == '"':
+                self.done = True
+            elif _PARTIAL_ESCAPE_RE.fullmatch(data, end):
+                self._buffer = data[end:]
+            else:
+                raise ValueError(f"Invalid escape: {data[end : end + 6]!r}")
+
+        text = json.loads(f'"{data[pos:end]}"')
+        if self._high_surrogate:
+            pair = (self._high_surrogate + text).encode("utf-16-le", "surrogatepass")
+            text = pair.decode("utf-16-le", "surrogatepass")
+            self._high_surrogate = ""
+        if not self.done and text and "\ud800" <= text[-1] <= "\udbff":
+            # The low surrogate is in the next chunk
+            self._high_surrogate = text[-1]
+            text = text[:-1]
+        return text
+
+    def close(self) -> None:
+        """Check the whole responseContent string was decoded."""
+        if not self.done:
+            raise ValueError("Response ended before the end of responseContent")
+
+
+def extract_pickups(html_content: str) -> tuple[list[tuple[str, str]], int]:
+    """Extract (colour, text) pairs and the service element count in one pass."""
+    extractor = WasteDatesExtractor()
+    extractor.feed(html_content)
+    pickups = extractor.close()
+    return pickups, extractor.service_elements
+
+
+def extract_pickups_soup(html_content: str) -> tuple[list[tuple[str, str]], int]:
+    """Extract (colour, text) pairs by building a BeautifulSoup tree."""
+    # Only needed for markup the fast extractor rejects, so import on first use
+    from bs4 import BeautifulSoup  # noqa: PLC0415
+
+    soup = BeautifulSoup(html_content, "html.parser")
+    pickups: list[tuple[str, str]] = []
+
+    # Find all service containers with the 'regular-service' class
+    service_elements = soup.find_all("div", class_=SERVICE_CLASS)
+    for element in service_elements:
+        waste_type = _bin_colour(element.get("class", []))
+        if not waste_type:
+            continue
+
+        # Find the div that contains the date information
+        date_container = element.find("div", class_=NEXT_SERVICE_CLASS)
+        if date_container:
+            pickups.append((waste_type, date_container.text.strip()))
+
+    return pickups, len(service_elements)
@@ -0,0 +1,119 @@
+"""Recurrence inference for bin collections."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from datetime import date
+import heapq
+from itertools import islice
+import logging
+
+from .const import DEFAULT_CADENCE_DAYS, MAX_CADENCE_DAYS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BinRecurrence:
+    """The cadence and phase of a single bin's collections, as day ordinals."""
+
+    __slots__ = ("anchor", "cadence")
+
+    def __init__(self, anchor: int, cadence: int) -> None:
+        """Initialize the recurrence."""
+        self.anchor = anchor
+        self.cadence = cadence
+
+    def first_on_or_after(self, ordinal: int) -> int:
+        """Return the ordinal of the first projected collection on or after a day."""
+        if ordinal <= self.anchor:
+            return self.anchor
+        return self.anchor - (self.anchor - ordinal) // self.cadence * self.cadence
+
+    def ordinals(self, start: int) -> Iterator[int]:
+        """Lazily yield projected collection ordinals from a day onwards."""
+        ordinal = self.first_on_or_after(start)
+        cadence = self.cadence
+        while True:
+            yield ordinal
+            ordinal += cadence
+
+
+class RecurrenceEngine:
+    """Learns each bin's collection cadence from successive fetches.
+
+    The council only publishes the next date per bin. Each observation is checked
+    against the projection from the previous ones; a mismatch re-anchors the bin
+    on the observed date and, where the gap is a whole number of weeks, re-learns
+    the cadence from it. Bins start from DEFAULT_CADENCE_DAYS.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the engine."""
+        self._bins: dict[str, BinRecurrence] = {}
+
+    @property
+    def cadences(self) -> dict[str, int]:
+        """Return the current cadence in days for each bin."""
+        return {colour: bin_.cadence for colour, bin_ in self._bins.items()}
+
+    def observe(self, data: Mapping[str, date], today: date) -> list[str]:
+        """Check a fetched schedule against the projection and learn from it.
+
+        Returns the bins whose projection did not match and were re-learned.
+        """
+        relearned: list[str] = []
+        today_ordinal = today.toordinal()
+        for colour, pickup in data.items():
+            ordinal = pickup.toordinal()
+            if (bin_ := self._bins.get(colour)) is None:
+                self._bins[colour] = BinRecurrence(
+                    ordinal, DEFAULT_CADENCE_DAYS.get(colour, 7)
+                )
+                continue
+
+            if bin_.first_on_or_after(today_ordinal) == ordinal:
+                bin_.anchor = ordinal
+                continue
+
+            gap = ordinal - bin_.anchor
+            if 0 < gap <= MAX_CADENCE_DAYS and gap % 7 == 0:
+                bin_.cadence = gap
+            _LOGGER.debug(
+                "Projection for %s bin missed %s, re-learned every %d days",
+                colour,
+                pickup,
+                bin_.cadence,
+            )
+            bin_.anchor = ordinal
+            relearned.append(colour)
+        return relearned
+
+    def occurrences(self, colour: str, start: date) -> Iterator[date]:
+        """Lazily yield projected collection dates for a bin from a day onwards."""
+        if (bin_ := self._bins.get(colour)) is None:
+            return
+        for ordinal in bin_.ordinals(start.toordinal()):
+            yield date.fromordinal(ordinal)
+
+    def merged_ordinals(self, start: date) -> Iterator[tuple[int, str]]:
+        """Lazily yield (ordinal, colour) for every bin from a day onwards, in order."""
+        start_ordinal = start.toordinal()
+        return heapq.merge(
+            *(
+                _labelled(bin_.ordinals(start_ordinal), colour)
+                for colour, bin_ in self._bins.items()
+            )
+        )
+
+    def upcoming(self, start: date, count: int) -> list[tuple[date, str]]:
+        """Return the next collections across all bins, in date order."""
+        return [
+            (date.fromordinal(ordinal), colour)
+            for ordinal, colour in islice(self.merged_ordinals(start), count)
+        ]
+
+
+def _labelled(ordinals: Iterator[int], colour: str) -> Iterator[tuple[int, str]]:
+    """Pair each projected ordinal with its bin colour."""
+    for ordinal in ordinals:
+        yield ordinal, colour
@@ -0,0 +1,190 @@
+"""Retry and circuit breaker helpers for requests to the council's API."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from enum import StrEnum
+import logging
+import random
+import time
+
+import aiohttp
+from aiohttp import hdrs
+
+_LOGGER = logging.getLogger(__name__)
+
+# Statuses the council's servers return while overloaded or restarting
+TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Statuses whose Retry-After header asks every client to slow down
+THROTTLED_STATUSES = frozenset({429, 503})
+
+
+class CircuitState(StrEnum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fails requests fast while an endpoint is unhealthy.
+
+    The circuit opens after failure_threshold consecutive failures. Once
+    reset_timeout seconds have passed it half-opens and lets a single probe
+    request through: success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        """Initialize the circuit breaker."""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state of the circuit."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    def allow_request(self) -> bool:
+        """Return whether a request may be made now."""
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after the endpoint answered."""
+        if self._opened_at is not None:
+            _LOGGER.info("Council service recovered, closing circuit")
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def release(self) -> None:
+        """Let another request probe after one ended without an outcome."""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold."""
+        self.failures += 1
+        if self._probing or (
+            self._opened_at is None and self.failures >= self.failure_threshold
+        ):
+            _LOGGER.warning(
+                "Council service unavailable after %d failures, pausing requests"
+                " for %d seconds",
+                self.failures,
+                self.reset_timeout,
+            )
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+
+class TokenBucket:
+    """Limits the rate requests start at, allowing short bursts.
+
+    The bucket holds up to capacity tokens and refills at rate tokens a second.
+    Each request takes a token, waiting its turn when the bucket is empty. A
+    paused bucket hands out no tokens until the pause is over, and starts
+    empty afterwards.
+    """
+
+    def __init__(
+        self, rate: float, capacity: float, max_wait: float | None = None
+    ) -> None:
+        """Initialize the bucket, full.
+
+        Requests give up after waiting max_wait seconds, if it is set.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.max_wait = max_wait
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        # Waiters take tokens in the order they asked for them
+        self._lock = asyncio.Lock()
+
+    async def async_acquire(self) -> None:
+        """Take a token, waiting for one if the bucket is empty or paused.
+
+        Raises:
+            TimeoutError: If no token was free within max_wait seconds.
+        """
+        async with asyncio.timeout(self.max_wait), self._lock:
+            while (delay := self._delay()) > 0:
+                await asyncio.sleep(delay)
+            self._tokens -= 1
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next seconds."""
+        paused_until = time.monotonic() + seconds
+        if paused_until > self._paused_until:
+            self._paused_until = self._updated = paused_until
+            self._tokens = 0
+
+    def _delay(self) -> float:
+        """Refill the bucket and return how long until a token is free."""
+        now = time.monotonic()
+        if now < self._paused_until:
+            return self._paused_until - now
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        if self._tokens >= 1:
+            return 0
+        return (1 - self._tokens) / self.rate
+
+
+def retry_after(err: Exception, cap: float) -> float | None:
+    """Return the seconds a throttled response asked us to wait, at most cap.
+
+    Returns None unless err is a 429 or 503 with a valid Retry-After header,
+    given either in seconds or as an HTTP date.
+    """
+    if (
+        not isinstance(err, aiohttp.ClientResponseError)
+        or err.status not in THROTTLED_STATUSES
+        or not err.headers
+        or (value := err.headers.get(hdrs.RETRY_AFTER)) is None
+    ):
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+        delay = (when - datetime.now(UTC)).total_seconds()
+    return min(max(delay, 0.0), cap)
+
+
+def is_transient(err: Exception) -> bool:
+    """Return whether a request that raised err is worth retrying."""
+    if isinstance(err, aiohttp.ClientResponseError):
+        return err.status in TRANSIENT_STATUSES
+    return isinstance(
+        err,
+        aiohttp.ClientConnectionError | aiohttp.ClientPayloadError | TimeoutError,
+    )
+
+
+async def async_backoff(attempt: int, base: float, cap: float) -> None:
+    """Sleep before retry number attempt, with full jitter."""
+    await asyncio.sleep(random.uniform(0, min(cap, base * 2**attempt)))
@@ -0,0 +1,120 @@
+"""Immutable collection schedule snapshots for the Blacktown Bin Buddy integration."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from datetime import date
+from typing import Any
+from weakref import WeakValueDictionary
+
+# Stored in a bin's slot when it has no collection date
+_NO_DATE = 0
+# The bins of BIN_COLOUR_MAP, in slot order
+_BINS = ("red", "yellow", "green")
+
+_interned: WeakValueDictionary[tuple[int, int, int], Schedule] = (
+    WeakValueDictionary()
+)
+
+
+class Schedule(Mapping[str, date]):
+    """The next collection date of each bin, as an immutable snapshot.
+
+    Dates are held as day ordinals in one slot per bin. Schedules are interned,
+    so addresses collected in the same weeks share one object and a fleet of
+    entries only holds a handful. Create them with Schedule.of().
+
+    A schedule reads as a mapping of bin colour to date for the bins that have
+    a date, and compares equal to a dict with the same items.
+    """
+
+    __slots__ = ("_green", "_hash", "_red", "_yellow", "__weakref__")
+
+    _red: int
+    _yellow: int
+    _green: int
+    _hash: int
+
+    def __new__(cls, *_args: Any) -> Schedule:
+        """Refuse direct construction, schedules must be interned."""
+        raise TypeError("Use Schedule.of() to create a schedule")
+
+    @classmethod
+    def of(cls, dates: Mapping[str, date]) -> Schedule:
+        """Return the schedule for the given dates, dropping unknown bins."""
+        if isinstance(dates, Schedule):
+            return dates
+        key = tuple(
+            value.toordinal() if (value := dates.get(colour)) is not None else _NO_DATE
+            for colour in _BINS
+        )
+        if (schedule := _interned.get(key)) is None:
+            schedule = object.__new__(cls)
+            setattr_ = object.__setattr__
+            setattr_(schedule, "_red", key[0])
+            setattr_(schedule, "_yellow", key[1])
+            setattr_(schedule, "_green", key[2])
+            setattr_(schedule, "_hash", hash(key))
+            _interned[key] = schedule
+        return schedule
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Refuse changes, schedules are shared."""
+        raise AttributeError("Schedule is immutable")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Copy and pickle through Schedule.of() so copies stay interned."""
+        return (Schedule.of, (dict(self),))
+
+    @property
+    def red(self) -> date | None:
+        """Return the next general waste collection."""
+        return date.fromordinal(self._red) if self._red else None
+
+    @property
+    def yellow(self) -> date | None:
+        """Return the next recycling collection."""
+        return date.fromordinal(self._yellow) if self._yellow else None
+
+    @property
+    def green(self) -> date | None:
+        """Return the next food and garden waste collection."""
+        return date.fromordinal(self._green) if self._green else None
+
+    def _ordinals(self) -> tuple[int, int, int]:
+        """Return the day ordinal of each bin, _NO_DATE for bins without one."""
+        return (self._red, self._yellow, self._green)
+
+    def __getitem__(self, colour: str) -> date:
+        """Return a bin's next collection date."""
+        try:
+            ordinal = self._ordinals()[_BINS.index(colour)]
+        except ValueError:
+            raise KeyError(colour) from None
+        if ordinal == _NO_DATE:
+            raise KeyError(colour)
+        return date.fromordinal(ordinal)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the bins with a collection date."""
+        for colour, ordinal in zip(_BINS, self._ordinals(), strict=True):
+            if ordinal != _NO_DATE:
+                yield colour
+
+    def __len__(self) -> int:
+        """Return the number of bins with a collection date."""
+        return sum(ordinal != _NO_DATE for ordinal in self._ordinals())
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another schedule by identity, or with a mapping."""
+        if isinstance(other, Schedule):
+            return self is other
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        """Return the hash of the bins' ordinals."""
+        return self._hash
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return f"Schedule({dict(self)!r})"
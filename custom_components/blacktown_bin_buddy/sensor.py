@@ -0,0 +1,115 @@
+"""Sensor platform for the Blacktown Bin Buddy integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import MATCH_ALL, EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import BIN_COLOUR_MAP
+from .coordinator import BinBuddyCoordinator
+from .entity import BinBuddyCountdownEntity, BinBuddyEntity
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the sensor entities from a config entry."""
+    coordinator: BinBuddyCoordinator = entry.runtime_data
+    async_add_entities(
+        [
+            BinBuddyFetchMetricsSensor(coordinator),
+            *(
+                BinBuddyDaysUntilSensor(coordinator, colour)
+                for colour in BIN_COLOUR_MAP
+            ),
+        ]
+    )
+
+
+class BinBuddyDaysUntilSensor(BinBuddyCountdownEntity, SensorEntity):
+    """Days until a bin's next collection, updated at midnight."""
+
+    _attr_icon = "mdi:calendar-clock"
+    _attr_native_unit_of_measurement = UnitOfTime.DAYS
+
+    def __init__(self, coordinator: BinBuddyCoordinator, colour: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, colour)
+        self._attr_name = f"{self._bin_name} days until collection"
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{colour}_days_until"
+        )
+
+    def days_until_change(self, days_until: int) -> int:
+        """Change every day."""
+        return 1
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the days until the next collection."""
+        return self.days_until
+
+
+class BinBuddyFetchMetricsSensor(BinBuddyEntity, SensorEntity):
+    """Reports how long fetching the council's page takes.
+
+    Disabled by default. The state is the latest fetch latency, and the
+    attributes hold the rest of the fetch and parse metrics.
+    """
+
+    _attr_translation_key = "fetch_latency"
+    _attr_icon = "mdi:timer-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_suggested_display_precision = 3
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    # The metrics change on every refresh and are only useful live
+    _unrecorded_attributes = frozenset({MATCH_ALL})
+
+    def __init__(self, coordinator: BinBuddyCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_fetch_latency"
+
+    async def async_added_to_hass(self) -> None:
+        """Update on every refresh, not only when the schedule changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_refresh_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def available(self) -> bool:
+        """Stay available while fetches fail, the failures are of interest."""
+        return True
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the latest fetch latency."""
+        if (metrics := self.coordinator.fetch_metrics) is None:
+            return None
+        return metrics.last_fetch_latency
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the fetch and parse metrics."""
+        metrics = self.coordinator.fetch_metrics
+        next_refresh = self.coordinator.next_refresh
+        return {
+            **(metrics.as_dict() if metrics is not None else {}),
+            "consecutive_failures": self.coordinator.consecutive_failures,
+            "next_refresh": next_refresh.isoformat() if next_refresh else None,
+        }
@@ -0,0 +1,55 @@
+"""Actions for the Blacktown Bin Buddy integration."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.helpers import config_validation as cv
+
+from .bulk_import import async_import_addresses, parse_address_csv
+from .const import DOMAIN
+
+SERVICE_IMPORT_ADDRESSES = "import_addresses"
+ATTR_ADDRESSES = "addresses"
+ATTR_CSV = "csv"
+
+IMPORT_ADDRESSES_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Exclusive(ATTR_ADDRESSES, "source"): vol.All(
+                cv.ensure_list, [cv.string]
+            ),
+            vol.Exclusive(ATTR_CSV, "source"): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_ADDRESSES, ATTR_CSV),
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's actions."""
+
+    async def _async_import_addresses(call: ServiceCall) -> ServiceResponse:
+        """Add a config entry for every address that resolves exactly."""
+        if ATTR_CSV in call.data:
+            addresses = parse_address_csv(call.data[ATTR_CSV])
+        else:
+            addresses = call.data[ATTR_ADDRESSES]
+        report = await async_import_addresses(hass, addresses)
+        return report.as_dict()
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_ADDRESSES,
+        _async_import_addresses,
+        schema=IMPORT_ADDRESSES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,39 @@
+"""HTTP session for requests to the council's API."""
+
+from __future__ import annotations
+
+import aiohttp
+from aiohttp import hdrs
+
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util import ssl as ssl_util
+
+from .const import (
+    COUNCIL_CONNECTION_LIMIT,
+    COUNCIL_CONNECTIONS_PER_HOST,
+    DNS_CACHE_TTL,
+    KEEPALIVE_TIMEOUT,
+)
+
+
+@callback
+def async_create_council_session() -> aiohttp.ClientSession:
+    """Create a session with its own connection pool for the council's hosts.
+
+    Council traffic does not compete with other integrations for connections
+    in Home Assistant's shared pool, and warm TLS connections are reused across
+    the fetches of a bulk refresh. The caller owns the session and must close it.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=COUNCIL_CONNECTION_LIMIT,
+        limit_per_host=COUNCIL_CONNECTIONS_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        # Home Assistant's preloaded context, loading one blocks the event loop
+        ssl=ssl_util.client_context(),
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={hdrs.USER_AGENT: SERVER_SOFTWARE},
+    )
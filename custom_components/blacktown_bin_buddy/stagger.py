@@ -0,0 +1,22 @@
+"""Staggered refresh timing for the Blacktown Bin Buddy integration."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import hashlib
+import random
+
+
+def refresh_offset(geolocation_id: str, window: timedelta) -> timedelta:
+    """Return an address's slot within a window of refreshes.
+
+    The slot comes from a hash of the geolocation ID, so it is the same across
+    restarts while different addresses are spread evenly across the window.
+    """
+    digest = hashlib.blake2b(geolocation_id.encode(), digest_size=8).digest()
+    return window * (int.from_bytes(digest) / 2**64)
+
+
+def jittered(delay: timedelta, jitter: timedelta) -> timedelta:
+    """Return a delay lengthened by a random amount up to jitter."""
+    return delay + jitter * random.random()
@@ -0,0 +1,81 @@
+"""Persistent schedule cache for the Blacktown Bin Buddy integration."""
+
+from __future__ import annotations
+
+from datetime import date
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SCHEDULE_CACHE_MAX_AGE
+from .schedule import Schedule
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+
+class ScheduleStore:
+    """Saves the last good collection dates for a config entry.
+
+    The saved schedule lets entities come up at startup without waiting for
+    the council's service. Schedules older than SCHEDULE_CACHE_MAX_AGE are
+    ignored.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, geolocation_id: str) -> None:
+        """Initialize the schedule store."""
+        self._geolocation_id = geolocation_id
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+
+    async def async_load(self) -> Schedule | None:
+        """Return the saved collection dates, or None if missing or expired."""
+        stored = await self._store.async_load()
+        if not stored or stored.get("geolocation_id") != self._geolocation_id:
+            return None
+
+        saved_at = dt_util.parse_datetime(stored.get("saved_at", ""))
+        if saved_at is None or dt_util.utcnow() - saved_at > SCHEDULE_CACHE_MAX_AGE:
+            _LOGGER.debug("Ignoring expired schedule for %s", self._geolocation_id)
+            return None
+
+        try:
+            return Schedule.of(
+                {
+                    waste_type: date.fromisoformat(value)
+                    for waste_type, value in stored["dates"].items()
+                }
+            )
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.warning(
+                "Ignoring invalid saved schedule for %s", self._geolocation_id
+            )
+            return None
+
+    @callback
+    def async_save(self, data: Schedule) -> None:
+        """Schedule the collection dates to be saved."""
+        if not data:
+            # Only a schedule with dates is worth starting from
+            return
+        saved_at = dt_util.utcnow().isoformat()
+        self._store.async_delay_save(
+            lambda: {
+                "geolocation_id": self._geolocation_id,
+                "saved_at": saved_at,
+                "dates": {
+                    waste_type: value.isoformat() for waste_type, value in data.items()
+                },
+            },
+            SAVE_DELAY,
+        )
+
+    async def async_remove(self) -> None:
+        """Remove the saved schedule."""
+        await self._store.async_remove()
@@ -0,0 +1,105 @@
+"""iCalendar feeds of bin collections for calendar clients."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from datetime import date
+from http import HTTPStatus
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import HomeAssistant
+
+from .const import BIN_NAMES, DOMAIN
+from .ics import CalendarFeed
+
+CALENDAR_URL = f"/api/{DOMAIN}/calendar.ics"
+ENTRY_CALENDAR_URL = f"/api/{DOMAIN}/calendar/{{entry_id}}.ics"
+COMBINED_CALENDAR_NAME = "Bin Collections"
+
+
+def _loaded_entries(hass: HomeAssistant) -> list[ConfigEntry]:
+    """Return the config entries whose coordinators are running."""
+    return [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state is ConfigEntryState.LOADED
+    ]
+
+
+class BinBuddyCalendarView(HomeAssistantView):
+    """Serves projected collections as iCalendar, per entry and for all entries.
+
+    A feed is rendered the first time it is requested after a coordinator
+    rebuilds its event index, then served from cache. Responses carry the
+    feed's strong ETag and a matching If-None-Match is answered with 304, so a
+    calendar client polling an unchanged feed costs a dictionary lookup.
+    """
+
+    url = CALENDAR_URL
+    extra_urls = [ENTRY_CALENDAR_URL]
+    name = f"api:{DOMAIN}:calendar"
+
+    def __init__(self) -> None:
+        """Initialize the view."""
+        # Entry ID, or None for the combined feed -> what the feed was rendered
+        # from and the feed
+        self._feeds: dict[str | None, tuple[Hashable, CalendarFeed]] = {}
+
+    async def get(
+        self, request: web.Request, entry_id: str | None = None
+    ) -> web.Response:
+        """Return an entry's calendar, or every entry's if no ID is given."""
+        entries = _loaded_entries(request.app[KEY_HASS])
+        if entry_id is not None:
+            entries = [entry for entry in entries if entry.entry_id == entry_id]
+            if not entries:
+                self._feeds.pop(entry_id, None)
+                return self.json_message("Calendar not found", HTTPStatus.NOT_FOUND)
+
+        feed = self._feed(entry_id, entries)
+        headers = {hdrs.ETAG: f'"{feed.etag}"', hdrs.CACHE_CONTROL: "no-cache"}
+        if any(etag.value in (feed.etag, "*") for etag in request.if_none_match or ()):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+        return web.Response(
+            body=feed.body,
+            content_type="text/calendar",
+            charset="utf-8",
+            headers=headers,
+        )
+
+    def _feed(self, entry_id: str | None, entries: list[ConfigEntry]) -> CalendarFeed:
+        """Return the cached feed, rendering it if any of its entries changed."""
+        # Event indexes are replaced rather than changed and compare by identity,
+        # so a new index marks an update
+        sources = tuple(
+            (entry.entry_id, entry.title, entry.runtime_data.events)
+            for entry in entries
+        )
+        if (cached := self._feeds.get(entry_id)) is not None and cached[0] == sources:
+            return cached[1]
+
+        combined = entry_id is None
+        events = sorted(
+            (
+                (
+                    f"{entry.entry_id}-{colour}-{day:%Y%m%d}@{DOMAIN}",
+                    day,
+                    f"{BIN_NAMES.get(colour, colour)} ({entry.title})"
+                    if combined
+                    else BIN_NAMES.get(colour, colour),
+                )
+                for entry in entries
+                for day, colour in entry.runtime_data.events.between(
+                    date.min, date.max
+                )
+            ),
+            key=lambda event: event[1],
+        )
+        feed = CalendarFeed.render(
+            COMBINED_CALENDAR_NAME if combined else entries[0].title, events
+        )
+        self._feeds[entry_id] = (sources, feed)
+        return feed
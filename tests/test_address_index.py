@@ -0,0 +1,102 @@
+"""Tests for the local address index."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.blacktown_bin_buddy import address_index
+from custom_components.blacktown_bin_buddy.address_index import (
+    AddressIndex,
+    AddressIndexStore,
+)
+
+ITEMS = [
+    {"Id": "geo-1", "AddressSingleLine": "1 Test St, BLACKTOWN NSW 2148"},
+    {"Id": "geo-12", "AddressSingleLine": "12 Test St, BLACKTOWN NSW 2148"},
+    {"Id": "geo-2", "AddressSingleLine": "2 Other Rd, ROOTY HILL NSW 2766"},
+]
+
+
+@pytest.fixture
+def index():
+    """Fixture for an index of ITEMS."""
+    index = AddressIndex()
+    assert index.add(ITEMS) is True
+    return index
+
+
+def test_add_reports_new_addresses(index):
+    """Test only new or changed addresses count as changes."""
+    assert index.add(ITEMS[:1]) is False
+    moved = {"Id": "geo-1b", "AddressSingleLine": ITEMS[0]["AddressSingleLine"]}
+    assert index.add([moved]) is True
+    assert index.add([{"Id": "geo-3"}, {"AddressSingleLine": "3 Test St"}]) is False
+    assert len(index) == 3
+
+
+@pytest.mark.parametrize(
+    ("search_term", "expected"),
+    [
+        # Prefix matches, in address order
+        ("1 test st", ["geo-1"]),
+        ("  2 OTHER  rd", ["geo-2"]),
+        # Too short to be sure the index holds every match
+        ("1", []),
+        ("1 test", []),
+        # Trigram matches, without the start of the address or with a typo
+        ("other rd rooty hill", ["geo-2"]),
+        ("12 Tset St Blacktown", ["geo-12"]),
+        # A different house number is never a match
+        ("2 test st", []),
+        ("9 Nowhere Ave", []),
+        ("", []),
+    ],
+)
+def test_search(index, search_term, expected):
+    """Test prefix and trigram searches only return confident matches."""
+    assert [item["Id"] for item in index.search(search_term, 10)] == expected
+
+
+def test_search_limit(index):
+    """Test searches return at most limit addresses."""
+    assert len(index.search("test st blacktown", 1)) == 1
+
+
+def test_short_search_for_whole_address(index):
+    """Test a short search still matches an address it spells out in full."""
+    index.add([{"Id": "geo-4", "AddressSingleLine": "4 A St"}])
+    assert [item["Id"] for item in index.search("4 a st", 10)] == ["geo-4"]
+    assert index.search("4 a", 10) == []
+
+
+def test_oldest_addresses_are_dropped(index):
+    """Test the index keeps the newest ADDRESS_INDEX_MAX_SIZE addresses."""
+    with patch.object(address_index, "ADDRESS_INDEX_MAX_SIZE", 3):
+        index.add([{"Id": "geo-3", "AddressSingleLine": "3 New St"}])
+
+    assert len(index) == 3
+    assert index.search("1 test st", 10) == []
+    assert index.search("3 new st", 10) == [
+        {"Id": "geo-3", "AddressSingleLine": "3 New St"}
+    ]
+    assert [address[0] for address in index.as_data()] == ["geo-12", "geo-2", "geo-3"]
+
+
+async def test_store_round_trip(index):
+    """Test the index is saved compactly and loaded back."""
+    with patch.object(address_index, "Store") as store_class:
+        store = AddressIndexStore(MagicMock(spec=HomeAssistant))
+        store.async_save(index)
+        data_func = store_class.return_value.async_delay_save.call_args[0][0]
+        stored = data_func()
+        assert stored == {
+            "addresses": [[item["Id"], item["AddressSingleLine"]] for item in ITEMS]
+        }
+
+        store_class.return_value.async_load = AsyncMock(return_value=stored)
+        assert await store.async_load() == ITEMS
+
+        for invalid in (None, {"addresses": [["geo-1"]]}):
+            store_class.return_value.async_load = AsyncMock(return_value=invalid)
+            assert await store.async_load() == []
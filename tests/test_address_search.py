@@ -0,0 +1,110 @@
+"""Tests for the cached address search."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.blacktown_bin_buddy.address_index import AddressIndexStore
+from custom_components.blacktown_bin_buddy.address_search import (
+    AddressSearchCache,
+    normalise_search_term,
+)
+from custom_components.blacktown_bin_buddy.council_service import (
+    CannotConnect,
+    CouncilService,
+)
+
+MOCK_SEARCH_RESPONSE = {"Items": [{"Id": "123", "AddressSingleLine": "1 Test St"}]}
+
+
+@pytest.fixture
+def mock_service():
+    """Fixture for the council service."""
+    service = MagicMock(spec=CouncilService)
+    service.search_address = AsyncMock(return_value=MOCK_SEARCH_RESPONSE)
+    return service
+
+
+def test_normalise_search_term():
+    """Test search terms are normalised for case and whitespace."""
+    assert normalise_search_term("  1  Test\tSt ") == "1 test st"
+
+
+async def test_repeat_searches_are_cached(mock_service):
+    """Test equivalent searches are answered from the cache.
+
+    The council is sent the search as it was first typed.
+    """
+    cache = AddressSearchCache(mock_service)
+
+    assert await cache.async_search("1 Test St") == MOCK_SEARCH_RESPONSE
+    assert await cache.async_search("1 TEST  st") == MOCK_SEARCH_RESPONSE
+
+    mock_service.search_address.assert_called_once_with("1 Test St")
+
+
+async def test_concurrent_searches_share_a_request(mock_service):
+    """Test identical in-flight searches are coalesced."""
+    cache = AddressSearchCache(mock_service)
+
+    results = await asyncio.gather(
+        cache.async_search("1 Test St"), cache.async_search("1 test st")
+    )
+
+    assert results == [MOCK_SEARCH_RESPONSE, MOCK_SEARCH_RESPONSE]
+    mock_service.search_address.assert_called_once()
+
+
+async def test_expired_and_evicted_results_are_refetched(mock_service):
+    """Test results expire after the TTL and the oldest are evicted."""
+    cache = AddressSearchCache(mock_service)
+    with patch(
+        "custom_components.blacktown_bin_buddy.address_search.time.monotonic",
+        return_value=1000.0,
+    ) as mock_monotonic:
+        await cache.async_search("1 Test St")
+        mock_monotonic.return_value += 3600
+        await cache.async_search("1 Test St")
+    assert mock_service.search_address.call_count == 2
+
+    with patch(
+        "custom_components.blacktown_bin_buddy.address_search.ADDRESS_SEARCH_CACHE_SIZE",
+        1,
+    ):
+        await cache.async_search("2 Test St")
+        await cache.async_search("1 Test St")
+    assert mock_service.search_address.call_count == 4
+
+
+async def test_errors_are_not_cached(mock_service):
+    """Test failed searches are retried on the next submit."""
+    mock_service.search_address.side_effect = [CannotConnect, MOCK_SEARCH_RESPONSE]
+    cache = AddressSearchCache(mock_service)
+
+    with pytest.raises(CannotConnect):
+        await cache.async_search("1 Test St")
+    assert await cache.async_search("1 Test St") == MOCK_SEARCH_RESPONSE
+
+
+async def test_searched_addresses_are_indexed(mock_service):
+    """Test addresses from the council are saved and found locally later."""
+    store = MagicMock(spec=AddressIndexStore)
+    store.async_load = AsyncMock(
+        return_value=[{"Id": "456", "AddressSingleLine": "2 Saved St"}]
+    )
+    cache = AddressSearchCache(mock_service, store)
+
+    assert await cache.async_search_local("1 Test St") == []
+    await cache.async_search("1 Test St")
+    store.async_save.assert_called_once_with(cache.index)
+
+    assert await cache.async_search_local("1 Test St") == MOCK_SEARCH_RESPONSE["Items"]
+    assert await cache.async_search_local("2 saved st") == [
+        {"Id": "456", "AddressSingleLine": "2 Saved St"}
+    ]
+    store.async_load.assert_called_once()
+
+    # Results already indexed are not saved again
+    await cache.async_search("1 TEST st ")
+    store.async_save.assert_called_once()
@@ -0,0 +1,104 @@
+"""Tests for the binary sensor platform of the Blacktown Bin Buddy integration."""
+
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.blacktown_bin_buddy.binary_sensor import (
+    async_setup_entry,
+    BinBuddyBinNightBinarySensor,
+)
+from custom_components.blacktown_bin_buddy.coordinator import BinBuddyCoordinator
+from custom_components.blacktown_bin_buddy.hub import BinBuddyHub
+from custom_components.blacktown_bin_buddy.midnight import MidnightDispatcher
+from custom_components.blacktown_bin_buddy.recurrence import RecurrenceEngine
+from custom_components.blacktown_bin_buddy.schedule import Schedule
+
+MOCK_WASTE_DATA = Schedule.of({"red": date(2025, 9, 16), "yellow": date(2025, 9, 23)})
+
+
+@pytest.fixture
+def mock_coordinator():
+    """Fixture for a coordinator with a real next_collection."""
+    coordinator = MagicMock(spec=BinBuddyCoordinator)
+    coordinator.config_entry = MagicMock()
+    coordinator.config_entry.entry_id = "test-entry-id"
+    coordinator.data = MOCK_WASTE_DATA
+    coordinator.recurrence = RecurrenceEngine()
+    coordinator.recurrence.observe(MOCK_WASTE_DATA, date(2025, 9, 14))
+    coordinator.next_collection = lambda colour, today: (
+        BinBuddyCoordinator.next_collection(coordinator, colour, today)
+    )
+    coordinator.hub = MagicMock(spec=BinBuddyHub)
+    coordinator.hub.midnight = MagicMock(spec=MidnightDispatcher)
+    return coordinator
+
+
+def _at(day):
+    return patch.object(
+        dt_util,
+        "now",
+        return_value=datetime(day.year, day.month, day.day, 0, 0, tzinfo=dt_util.UTC),
+    )
+
+
+async def test_async_setup_entry(mock_coordinator):
+    """Test a bin night sensor is added for every bin before the first refresh."""
+    mock_coordinator.data = None
+    entry = MagicMock()
+    entry.runtime_data = mock_coordinator
+    add_entities = MagicMock()
+
+    await async_setup_entry(MagicMock(spec=HomeAssistant), entry, add_entities)
+
+    entities = list(add_entities.call_args[0][0])
+    assert [entity.unique_id for entity in entities] == [
+        "test-entry-id_red_bin_night",
+        "test-entry-id_yellow_bin_night",
+        "test-entry-id_green_bin_night",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("today", "is_on", "wake_up"),
+    [
+        # Off until the day before the collection
+        (date(2025, 9, 14), False, date(2025, 9, 15)),
+        # On the day before and the day of, then off the day after
+        (date(2025, 9, 15), True, date(2025, 9, 17)),
+        (date(2025, 9, 16), True, date(2025, 9, 17)),
+        # The passed date is projected a week on until the next refresh
+        (date(2025, 9, 17), False, date(2025, 9, 22)),
+    ],
+)
+def test_bin_night(mock_coordinator, today, is_on, wake_up):
+    """Test bin night is on around the collection and wakes when it changes."""
+    sensor = BinBuddyBinNightBinarySensor(mock_coordinator, "red")
+
+    with _at(today):
+        sensor._async_update_countdown()
+
+    assert sensor.is_on is is_on
+    (day, _action), _ = mock_coordinator.hub.midnight.async_schedule.call_args
+    assert day == wake_up
+
+
+def test_bin_night_at_midnight(mock_coordinator):
+    """Test the sensor writes state and reschedules when woken at midnight."""
+    sensor = BinBuddyBinNightBinarySensor(mock_coordinator, "red")
+    sensor.async_write_ha_state = MagicMock()
+    with _at(date(2025, 9, 14)):
+        sensor._async_update_countdown()
+    cancel = mock_coordinator.hub.midnight.async_schedule.return_value
+    (_day, on_midnight), _ = mock_coordinator.hub.midnight.async_schedule.call_args
+
+    with _at(date(2025, 9, 15)):
+        on_midnight()
+
+    assert sensor.is_on is True
+    sensor.async_write_ha_state.assert_called_once()
+    cancel.assert_not_called()
+    assert mock_coordinator.hub.midnight.async_schedule.call_count == 2
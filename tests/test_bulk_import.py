@@ -0,0 +1,139 @@
+"""Tests for the bulk address import."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.blacktown_bin_buddy.address_search import AddressSearchCache
+from custom_components.blacktown_bin_buddy.bulk_import import (
+    async_import_addresses,
+    async_resolve_addresses,
+    parse_address_csv,
+)
+from custom_components.blacktown_bin_buddy.council_service import CannotConnect
+
+SEARCH_RESULTS = {
+    "1 test st": {"Items": [{"Id": "geo-1", "AddressSingleLine": "1 Test St"}]},
+    "2 test st": {
+        "Items": [
+            {"Id": "geo-2", "AddressSingleLine": "2 Test St"},
+            {"Id": "geo-2a", "AddressSingleLine": "2A Test St"},
+        ]
+    },
+    "3 test st": {
+        "Items": [
+            {"Id": "geo-3", "AddressSingleLine": "Unit 1, 3 Test St"},
+            {"Id": "geo-3b", "AddressSingleLine": "Unit 2, 3 Test St"},
+        ]
+    },
+    "4 test st": {"Items": []},
+}
+
+
+def _mock_address_search():
+    """Return an address search answering from SEARCH_RESULTS."""
+    address_search = MagicMock(spec=AddressSearchCache)
+
+    async def _search(address):
+        if address == "5 Test St":
+            raise CannotConnect
+        return SEARCH_RESULTS[" ".join(address.casefold().split())]
+
+    address_search.async_search = AsyncMock(side_effect=_search)
+    return address_search
+
+
+def test_parse_address_csv():
+    """Test addresses are read from the address column or the first one."""
+    assert parse_address_csv("name,Address\nHome,1 Test St\n,\nShop,2 Test St\n") == [
+        "1 Test St",
+        "2 Test St",
+    ]
+    assert parse_address_csv('"1 Test St, Blacktown"\n2 Test St\n') == [
+        "1 Test St, Blacktown",
+        "2 Test St",
+    ]
+    assert parse_address_csv("") == []
+
+
+async def test_resolve_addresses():
+    """Test only exact hits are matched and the rest are reported."""
+    report = await async_resolve_addresses(
+        _mock_address_search(),
+        ["1 TEST  st", "2 Test St", "3 Test St", "4 Test St", "5 Test St"],
+        max_workers=2,
+        rate=1000,
+    )
+
+    # An exact hit among several results still matches
+    assert report.matched == {
+        "1 TEST  st": ("geo-1", "1 Test St"),
+        "2 Test St": ("geo-2", "2 Test St"),
+    }
+    assert report.ambiguous == {
+        "3 Test St": ["Unit 1, 3 Test St", "Unit 2, 3 Test St"],
+    }
+    assert report.unmatched == ["4 Test St"]
+    assert report.failed == ["5 Test St"]
+
+
+async def test_resolve_addresses_is_bounded():
+    """Test no more than max_workers searches run at once."""
+    running = 0
+    peak = 0
+
+    async def _search(_address):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"Items": []}
+
+    address_search = MagicMock(spec=AddressSearchCache)
+    address_search.async_search = AsyncMock(side_effect=_search)
+
+    report = await async_resolve_addresses(
+        address_search, [f"{n} Test St" for n in range(10)], max_workers=3, rate=1000
+    )
+
+    assert peak == 3
+    assert len(report.unmatched) == 10
+
+
+async def test_import_addresses_creates_entries():
+    """Test matched addresses become entries through the import flow."""
+    hass = MagicMock(spec=HomeAssistant)
+    hass.config_entries = MagicMock()
+    hass.config_entries.flow.async_init = AsyncMock(
+        side_effect=[
+            {"type": FlowResultType.CREATE_ENTRY},
+            {"type": FlowResultType.ABORT, "reason": "already_configured"},
+        ]
+    )
+    hub = MagicMock()
+    hub.address_search = _mock_address_search()
+
+    with patch(
+        "custom_components.blacktown_bin_buddy.bulk_import.async_get_hub",
+        return_value=hub,
+    ):
+        report = await async_import_addresses(
+            hass, ["1 Test St", "1 test st", "2 Test St", "4 Test St"]
+        )
+
+    # The two spellings of 1 Test St resolve to one entry
+    assert hass.config_entries.flow.async_init.call_count == 2
+    assert hass.config_entries.flow.async_init.call_args_list[0][1]["data"] == {
+        "id": "geo-1",
+        "title": "1 Test St",
+    }
+    assert report.as_dict() == {
+        "created": ["1 Test St"],
+        "already_configured": ["2 Test St"],
+        "ambiguous": {},
+        "unmatched": ["4 Test St"],
+        "failed": [],
+    }
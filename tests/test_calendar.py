@@ -0,0 +1,71 @@
+"""Tests for the calendar platform of the Blacktown Bin Buddy integration."""
+
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.blacktown_bin_buddy.calendar import (
+    async_setup_entry,
+    BinBuddyCalendarEntity,
+)
+from custom_components.blacktown_bin_buddy.coordinator import BinBuddyCoordinator
+from custom_components.blacktown_bin_buddy.event_index import CollectionEventIndex
+from custom_components.blacktown_bin_buddy.recurrence import RecurrenceEngine
+
+
+def _mock_coordinator():
+    """Return a mock coordinator with a year of projected collections."""
+    engine = RecurrenceEngine()
+    engine.observe(
+        {"red": date(2025, 9, 16), "yellow": date(2025, 9, 16)}, date(2025, 9, 14)
+    )
+    coordinator = MagicMock(spec=BinBuddyCoordinator)
+    coordinator.config_entry = MagicMock()
+    coordinator.config_entry.entry_id = "test-entry-id"
+    coordinator.events = CollectionEventIndex.build(engine, date(2025, 9, 14), 365)
+    return coordinator
+
+
+async def test_async_setup_entry():
+    """Test one calendar is added per entry."""
+    entry = MagicMock()
+    entry.runtime_data = _mock_coordinator()
+    add_entities = MagicMock()
+
+    await async_setup_entry(MagicMock(spec=HomeAssistant), entry, add_entities)
+
+    (entities,) = add_entities.call_args[0]
+    assert len(entities) == 1
+    assert entities[0].unique_id == "test-entry-id_calendar"
+
+
+async def test_async_get_events():
+    """Test events are returned for every day overlapping the range."""
+    calendar = BinBuddyCalendarEntity(_mock_coordinator())
+    tz = dt_util.get_default_time_zone()
+
+    events = await calendar.async_get_events(
+        MagicMock(spec=HomeAssistant),
+        datetime(2025, 9, 16, 12, 0, tzinfo=tz),
+        datetime(2025, 9, 30, 0, 0, tzinfo=tz),
+    )
+
+    assert [(event.start, event.summary) for event in events] == [
+        (date(2025, 9, 16), "General Waste"),
+        (date(2025, 9, 16), "Recycling"),
+        (date(2025, 9, 23), "General Waste"),
+    ]
+    assert events[0].end == date(2025, 9, 17)
+
+
+def test_event():
+    """Test the calendar's state is today's or the next collection."""
+    calendar = BinBuddyCalendarEntity(_mock_coordinator())
+
+    with patch.object(
+        dt_util, "now", return_value=datetime(2025, 9, 17, 9, 0, tzinfo=dt_util.UTC)
+    ):
+        assert calendar.event.start == date(2025, 9, 23)
+        assert calendar.event.summary == "General Waste"
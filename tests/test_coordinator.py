@@ -1,14 +1,21 @@
 """Tests for the BinBuddyCoordinator."""
 
-from datetime import date, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from custom_components.blacktown_bin_buddy.coordinator import BinBuddyCoordinator
+from custom_components.blacktown_bin_buddy.coordinator import (
+    BinBuddyCoordinator,
+    next_refresh_interval,
+)
 from custom_components.blacktown_bin_buddy.council_service import CannotConnect
+from custom_components.blacktown_bin_buddy.hub import BinBuddyHub
+from custom_components.blacktown_bin_buddy.schedule import Schedule
+from custom_components.blacktown_bin_buddy.store import ScheduleStore
 
 MOCK_ENTRY_DATA = {"id": "test-geo-id"}
 MOCK_WASTE_DATA = {"red": date(2025, 9, 16)}
@@ -17,8 +24,8 @@ MOCK_WASTE_DATA = {"red": date(2025, 9, 16)}
 class MockConfigEntry(MagicMock):
     """Mock ConfigEntry."""
 
-    def __init__(self, data):
-        super().__init__()
+    def __init__(self, data=None, **kwargs):
+        super().__init__(**kwargs)
         self.data = data
 
 
@@ -34,59 +41,218 @@ def mock_config_entry():
     return MockConfigEntry(MOCK_ENTRY_DATA)
 
 
-@patch("custom_components.blacktown_bin_buddy.coordinator.async_track_time_pattern")
-@patch("custom_components.blacktown_bin_buddy.coordinator.async_get_clientsession")
+@pytest.fixture
+def mock_hub():
+    """Fixture for the shared fetch hub."""
+    return MagicMock(spec=BinBuddyHub)
+
+
+@pytest.fixture
+def mock_store():
+    """Fixture for the schedule store."""
+    return MagicMock(spec=ScheduleStore)
+
+
 async def test_coordinator_initialization(
-    mock_get_session, mock_track_time, mock_hass, mock_config_entry
+    mock_hass, mock_config_entry, mock_hub, mock_store
 ):
-    """Test coordinator initialization and daily refresh scheduling."""
-    coordinator = BinBuddyCoordinator(mock_hass, mock_config_entry)
+    """Test coordinator initialization."""
+    coordinator = BinBuddyCoordinator(
+        mock_hass, mock_config_entry, mock_hub, mock_store
+    )
     assert coordinator.geolocation_id == "test-geo-id"
-    mock_get_session.assert_called_once_with(mock_hass)
+    assert coordinator.hub is mock_hub
+    assert coordinator.consecutive_failures == 0
+
+
+@pytest.mark.parametrize(
+    ("now", "data", "expected"),
+    [
+        # Refresh at 1 AM the day after the earliest collection
+        (
+            datetime(2025, 9, 15, 9, 0),
+            {"red": date(2025, 9, 16), "yellow": date(2025, 9, 23)},
+            timedelta(days=1, hours=16),
+        ),
+        # Never later than the maximum interval
+        (
+            datetime(2025, 9, 1, 9, 0),
+            {"yellow": date(2025, 9, 23)},
+            timedelta(days=7),
+        ),
+        # Stale or empty schedules are refreshed soon
+        (
+            datetime(2025, 9, 17, 9, 0),
+            {"red": date(2025, 9, 16), "yellow": date(2025, 9, 23)},
+            timedelta(hours=1),
+        ),
+        (datetime(2025, 9, 17, 0, 30), {}, timedelta(hours=1)),
+        # Late on collection day
+        (
+            datetime(2025, 9, 16, 23, 30),
+            {"red": date(2025, 9, 16)},
+            timedelta(hours=1, minutes=30),
+        ),
+    ],
+)
+def test_next_refresh_interval(now, data, expected):
+    """Test the refresh interval is derived from the schedule."""
+    now = now.replace(tzinfo=dt_util.get_default_time_zone())
+    assert next_refresh_interval(data, now) == expected
 
-    # Verify that the daily refresh is scheduled for 1 AM
-    mock_track_time.assert_called_once()
-    assert mock_track_time.call_args[1]["hour"] == 1
-    assert mock_track_time.call_args[1]["minute"] == 0
-    assert mock_track_time.call_args[1]["second"] == 0
 
-@patch("custom_components.blacktown_bin_buddy.coordinator.async_track_time_pattern")
-@patch("custom_components.blacktown_bin_buddy.coordinator.CouncilService")
-@patch("custom_components.blacktown_bin_buddy.coordinator.async_get_clientsession")
 async def test_async_update_data_success(
-    mock_get_session, mock_service_class, mock_track_time, mock_hass, mock_config_entry
+    mock_hass, mock_config_entry, mock_hub, mock_store
 ):
     """Test successful data update."""
-    mock_service_instance = mock_service_class.return_value
-    mock_service_instance.get_waste_collection_data = AsyncMock(
-        return_value=MOCK_WASTE_DATA
-    )
+    mock_hub.async_fetch = AsyncMock(return_value=MOCK_WASTE_DATA)
 
-    coordinator = BinBuddyCoordinator(mock_hass, mock_config_entry)
+    coordinator = BinBuddyCoordinator(
+        mock_hass, mock_config_entry, mock_hub, mock_store
+    )
     data = await coordinator._async_update_data()
 
     assert data == MOCK_WASTE_DATA
-    mock_service_instance.get_waste_collection_data.assert_called_once_with(
-        "test-geo-id"
-    )
-
+    mock_hub.async_fetch.assert_called_once_with(coordinator)
+    mock_store.async_save.assert_called_once_with(MOCK_WASTE_DATA)
 
 
-@patch("custom_components.blacktown_bin_buddy.coordinator.async_track_time_pattern")
-@patch("custom_components.blacktown_bin_buddy.coordinator.CouncilService")
-@patch("custom_components.blacktown_bin_buddy.coordinator.async_get_clientsession")
 async def test_async_update_data_failure(
-    mock_get_session, mock_service_class, mock_track_time, mock_hass, mock_config_entry
+    mock_hass, mock_config_entry, mock_hub, mock_store
 ):
     """Test data update failure due to CannotConnect."""
-    mock_service_instance = mock_service_class.return_value
-    mock_service_instance.get_waste_collection_data = AsyncMock(
+    mock_hub.async_fetch = AsyncMock(
         side_effect=CannotConnect("Test connection error")
     )
 
-    coordinator = BinBuddyCoordinator(mock_hass, mock_config_entry)
+    coordinator = BinBuddyCoordinator(
+        mock_hass, mock_config_entry, mock_hub, mock_store
+    )
 
     with pytest.raises(UpdateFailed) as excinfo:
         await coordinator._async_update_data()
 
     assert "Failed to connect" in str(excinfo.value)
+    mock_store.async_save.assert_not_called()
+
+
+async def test_failures_back_off_exponentially(
+    mock_hass, mock_config_entry, mock_hub, mock_store
+):
+    """Test failed fetches retry on a fast exponential backoff."""
+    mock_hub.async_fetch = AsyncMock(side_effect=CannotConnect)
+    coordinator = BinBuddyCoordinator(
+        mock_hass, mock_config_entry, mock_hub, mock_store
+    )
+
+    intervals = []
+    for _ in range(6):
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+        intervals.append(coordinator.update_interval)
+
+    assert intervals == [
+        timedelta(minutes=5),
+        timedelta(minutes=10),
+        timedelta(minutes=20),
+        timedelta(minutes=40),
+        timedelta(hours=1),
+        timedelta(hours=1),
+    ]
+
+    # A success resets the backoff
+    mock_hub.async_fetch = AsyncMock(return_value=MOCK_WASTE_DATA)
+    await coordinator._async_update_data()
+    assert coordinator.consecutive_failures == 0
+    assert coordinator.update_interval >= timedelta(hours=1)
+
+
+async def test_refreshes_are_staggered(
+    mock_hass, mock_config_entry, mock_hub, mock_store
+):
+    """Test refreshes fall in the address's slot after the scheduled time."""
+    mock_hub.async_fetch = AsyncMock(return_value=MOCK_WASTE_DATA)
+    coordinator = BinBuddyCoordinator(
+        mock_hass, mock_config_entry, mock_hub, mock_store
+    )
+    other = BinBuddyCoordinator(
+        mock_hass, MockConfigEntry({"id": "other-geo-id"}), mock_hub, mock_store
+    )
+    assert coordinator.refresh_offset != other.refresh_offset
+
+    now = dt_util.now()
+    await coordinator._async_update_data()
+    scheduled = next_refresh_interval(MOCK_WASTE_DATA, now)
+
+    assert (
+        scheduled + coordinator.refresh_offset - timedelta(seconds=1)
+        <= coordinator.update_interval
+        <= scheduled + coordinator.refresh_offset + timedelta(minutes=1)
+    )
+
+
+async def test_async_restore(mock_hass, mock_config_entry, mock_hub, mock_store):
+    """Test restoring the saved schedule without a fetch."""
+    mock_store.async_load = AsyncMock(return_value=MOCK_WASTE_DATA)
+    mock_hub.async_fetch = AsyncMock()
+
+    coordinator = BinBuddyCoordinator(
+        mock_hass, mock_config_entry, mock_hub, mock_store
+    )
+
+    assert await coordinator.async_restore() is True
+    assert coordinator.data == MOCK_WASTE_DATA
+    mock_hub.async_fetch.assert_not_called()
+
+    mock_store.async_load = AsyncMock(return_value=None)
+    assert await coordinator.async_restore() is False
+
+
+async def test_refresh_listeners(mock_hass, mock_config_entry, mock_hub, mock_store):
+    """Test refresh listeners hear about every refresh, changed or not."""
+    mock_hub.async_fetch = AsyncMock(return_value=MOCK_WASTE_DATA)
+    coordinator = BinBuddyCoordinator(
+        mock_hass, mock_config_entry, mock_hub, mock_store
+    )
+    refreshes = MagicMock()
+    remove_listener = coordinator.async_add_refresh_listener(refreshes)
+
+    # The second refresh finds the same schedule
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    assert refreshes.call_count == 2
+
+    # Failures are refreshes too, every one of them
+    mock_hub.async_fetch = AsyncMock(side_effect=CannotConnect)
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    assert refreshes.call_count == 4
+
+    # As is a schedule shared by another entry
+    coordinator.async_set_updated_data(MOCK_WASTE_DATA)
+    assert refreshes.call_count == 5
+
+    remove_listener()
+    await coordinator.async_refresh()
+    assert refreshes.call_count == 5
+
+
+async def test_events_kept_for_unchanged_schedule(
+    mock_hass, mock_config_entry, mock_hub, mock_store
+):
+    """Test the event index is only rebuilt when the schedule changes."""
+    mock_hub.async_fetch = AsyncMock(return_value=Schedule.of(MOCK_WASTE_DATA))
+    coordinator = BinBuddyCoordinator(
+        mock_hass, mock_config_entry, mock_hub, mock_store
+    )
+
+    await coordinator._async_update_data()
+    events = coordinator.events
+    await coordinator._async_update_data()
+    assert coordinator.events is events
+
+    mock_hub.async_fetch = AsyncMock(
+        return_value=Schedule.of({"red": date(2025, 9, 23)})
+    )
+    await coordinator._async_update_data()
+    assert coordinator.events is not events
@@ -1,16 +1,22 @@
 """Tests for the CouncilService."""
 
+import json
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 from datetime import date
+from multidict import CIMultiDict
 
+from custom_components.blacktown_bin_buddy import council_service
 from custom_components.blacktown_bin_buddy.council_service import (
     CouncilService,
     CannotConnect,
     CouncilServiceError,
+    ResponseTooLarge,
 )
+from custom_components.blacktown_bin_buddy.parser import extract_pickups
 
 MOCK_SEARCH_RESPONSE = {"Items": [{"Id": "123", "Text": "1 Test St"}]}
 MOCK_WASTE_DATES_HTML = """
@@ -32,47 +38,68 @@ MOCK_WASTE_DATES_HTML = """
 </div>
 """
 MOCK_WASTE_DATES_RESPONSE = {"responseContent": MOCK_WASTE_DATES_HTML}
+MOCK_WASTE_DATES_BODY = json.dumps(MOCK_WASTE_DATES_RESPONSE).encode()
+
+
+def _mock_body(response, body=MOCK_WASTE_DATES_BODY, chunk_size=16):
+    """Serve body from the response's stream in fixed-size chunks."""
+
+    async def _iter_chunked(_size):
+        for start in range(0, len(body), chunk_size):
+            chunk = body[start : start + chunk_size]
+            response.bytes_read += len(chunk)
+            yield chunk
+
+    response.bytes_read = 0
+    response.content.iter_chunked = MagicMock(side_effect=_iter_chunked)
 
 
 @pytest.fixture
 def mock_session():
     """Fixture for aiohttp client session."""
     session = MagicMock()
-    session.get = AsyncMock()
+    response = session.get.return_value.__aenter__.return_value
+    response.headers = CIMultiDict()
+    response.content_length = None
     return session
 
 
-async def test_search_address_success(mock_session):
+@pytest.fixture
+def service(mock_session):
+    """Fixture for a council service, joining its parser threads afterwards."""
+    service = CouncilService(mock_session)
+    yield service
+    service._parse_executor.shutdown()
+
+
+async def test_search_address_success(mock_session, service):
     """Test successful address search."""
     mock_response = mock_session.get.return_value.__aenter__.return_value
     mock_response.status = 200
     mock_response.json = AsyncMock(return_value=MOCK_SEARCH_RESPONSE)
     mock_response.raise_for_status = MagicMock()
 
-    service = CouncilService(mock_session)
     result = await service.search_address("1 Test St")
 
     mock_session.get.assert_called_once()
     assert result == MOCK_SEARCH_RESPONSE
 
 
-async def test_search_address_connection_error(mock_session):
+async def test_search_address_connection_error(mock_session, service):
     """Test address search with a connection error."""
     mock_session.get.side_effect = aiohttp.ClientError("Test connection error")
 
-    service = CouncilService(mock_session)
     with pytest.raises(CannotConnect):
         await service.search_address("1 Test St")
 
 
-async def test_get_waste_collection_data_success(mock_session):
+async def test_get_waste_collection_data_success(mock_session, service):
     """Test successful waste collection data fetch."""
     mock_response = mock_session.get.return_value.__aenter__.return_value
     mock_response.status = 200
-    mock_response.json = AsyncMock(return_value=MOCK_WASTE_DATES_RESPONSE)
+    _mock_body(mock_response)
     mock_response.raise_for_status = MagicMock()
 
-    service = CouncilService(mock_session)
     result = await service.get_waste_collection_data("12345")
 
     expected_data = {
@@ -83,31 +110,243 @@ async def test_get_waste_collection_data_success(mock_session):
     assert result == expected_data
 
 
-async def test_get_waste_collection_data_connection_error(mock_session):
+async def test_get_waste_collection_data_connection_error(mock_session, service):
     """Test waste data fetch with a connection error."""
     mock_session.get.side_effect = aiohttp.ClientError("Test connection error")
 
-    service = CouncilService(mock_session)
     with pytest.raises(CannotConnect):
         await service.get_waste_collection_data("12345")
 
 
-async def test_get_waste_collection_data_unexpected_error(mock_session):
+async def test_get_waste_collection_data_unexpected_error(mock_session, service):
     """Test waste data fetch with an unexpected error."""
     mock_session.get.side_effect = Exception("Unexpected error")
 
-    service = CouncilService(mock_session)
     with pytest.raises(CouncilServiceError):
         await service.get_waste_collection_data("12345")
 
 
-def test_parse_waste_dates_html():
-    """Test parsing of the waste dates HTML."""
+def test_pickup_dates():
+    """Test the collection text extracted from the HTML is turned into dates."""
     service = CouncilService(MagicMock())
-    result = service._parse_waste_dates_html(MOCK_WASTE_DATES_HTML)
+    pickups, _ = extract_pickups(MOCK_WASTE_DATES_HTML)
+    result = service._pickup_dates(pickups)
 
     expected_data = {
         "red": date(2025, 9, 16),
         "yellow": date(2025, 9, 23),
     }
     assert result == expected_data
+
+
+async def test_get_waste_collection_data_not_modified(mock_session, service):
+    """Test a 304 response reuses the last parsed result."""
+    mock_response = mock_session.get.return_value.__aenter__.return_value
+    mock_response.status = 200
+    mock_response.headers = CIMultiDict(
+        {"ETag": '"v1"', "Last-Modified": "Mon, 15 Sep 2025"}
+    )
+    _mock_body(mock_response)
+    mock_response.raise_for_status = MagicMock()
+
+    first = await service.get_waste_collection_data("12345")
+
+    mock_response.status = 304
+    mock_response.content.iter_chunked.reset_mock()
+    second = await service.get_waste_collection_data("12345")
+
+    assert second == first
+    mock_response.content.iter_chunked.assert_not_called()
+    assert mock_session.get.call_args[1]["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 15 Sep 2025",
+    }
+    assert (service.parse_cache_hits, service.parse_cache_misses) == (1, 1)
+
+
+async def test_get_waste_collection_data_unchanged_content(mock_session, service):
+    """Test unchanged content is not parsed again."""
+    mock_response = mock_session.get.return_value.__aenter__.return_value
+    mock_response.status = 200
+    _mock_body(mock_response)
+    mock_response.raise_for_status = MagicMock()
+
+    service._pickup_dates = MagicMock(wraps=service._pickup_dates)
+    await service.get_waste_collection_data("12345")
+    await service.get_waste_collection_data("12345")
+    # A different address has its own cache entry
+    await service.get_waste_collection_data("67890")
+
+    assert service._pickup_dates.call_count == 2
+    assert (service.parse_cache_hits, service.parse_cache_misses) == (1, 2)
+
+
+async def test_search_address_encodes_search_term(mock_session, service):
+    """Test the search term is URL encoded."""
+    mock_response = mock_session.get.return_value.__aenter__.return_value
+    mock_response.json = AsyncMock(return_value=MOCK_SEARCH_RESPONSE)
+    mock_response.raise_for_status = MagicMock()
+
+    await service.search_address("1/2 Test St & Co")
+
+    search_url = mock_session.get.call_args[0][0]
+    assert search_url.endswith("keywords=1/2%20Test%20St%20%26%20Co")
+
+
+async def test_get_waste_collection_data_parses_off_event_loop(mock_session, service):
+    """Test extraction and date conversion run in the parser pool and are timed."""
+    mock_response = mock_session.get.return_value.__aenter__.return_value
+    mock_response.status = 200
+    _mock_body(mock_response)
+    mock_response.raise_for_status = MagicMock()
+
+    feed = council_service.WasteDatesExtractor.feed
+    pickup_dates = service._pickup_dates
+    parse_threads = []
+
+    def _record_feed(extractor, markup):
+        parse_threads.append(threading.current_thread())
+        return feed(extractor, markup)
+
+    def _record_pickup_dates(*args):
+        parse_threads.append(threading.current_thread())
+        return pickup_dates(*args)
+
+    service._pickup_dates = _record_pickup_dates
+    with patch.object(council_service.WasteDatesExtractor, "feed", _record_feed):
+        result = await service.get_waste_collection_data("12345")
+
+    assert result == {"red": date(2025, 9, 16), "yellow": date(2025, 9, 23)}
+    assert len(parse_threads) > 1
+    assert all(
+        thread.name.startswith("blacktown_bin_buddy") for thread in parse_threads
+    )
+    assert service.last_parse_duration is not None
+
+
+async def test_get_waste_collection_data_falls_back_off_event_loop(
+    mock_session, service
+):
+    """Test the BeautifulSoup fallback runs in the parser pool."""
+    mock_response = mock_session.get.return_value.__aenter__.return_value
+    mock_response.status = 200
+    mock_response.raise_for_status = MagicMock()
+    # A stray closing div is left to the BeautifulSoup fallback
+    _mock_body(
+        mock_response,
+        json.dumps({"responseContent": "</div>" + MOCK_WASTE_DATES_HTML}).encode(),
+    )
+
+    parse = council_service.extract_pickups_soup
+    parse_threads = []
+
+    def _record_thread(html_content):
+        parse_threads.append(threading.current_thread())
+        return parse(html_content)
+
+    with patch.object(council_service, "extract_pickups_soup", _record_thread):
+        result = await service.get_waste_collection_data("12345")
+
+    assert result == {"red": date(2025, 9, 16), "yellow": date(2025, 9, 23)}
+    assert parse_threads[0].name.startswith("blacktown_bin_buddy")
+
+
+async def test_get_waste_collection_data_records_metrics(mock_session, service):
+    """Test fetch and parse metrics are kept per address."""
+    mock_response = mock_session.get.return_value.__aenter__.return_value
+    mock_response.status = 200
+    _mock_body(mock_response)
+    mock_response.raise_for_status = MagicMock()
+
+    await service.get_waste_collection_data("12345")
+    await service.get_waste_collection_data("12345")
+
+    metrics = service.metrics["12345"]
+    assert metrics.last_response_size == len(MOCK_WASTE_DATES_BODY)
+    assert metrics.last_fetch_latency is not None
+    assert len(metrics.fetch_latency) == 2
+    assert len(metrics.parse_time) == 1
+    assert metrics.service_elements == 2
+    assert metrics.cache_hit_ratio == 0.5
+    assert "67890" not in service.metrics
+
+
+async def test_get_waste_collection_data_too_large(mock_session, service):
+    """Test a response declaring an oversized body is refused unread."""
+    mock_response = mock_session.get.return_value.__aenter__.return_value
+    mock_response.status = 200
+    mock_response.content_length = 64 * 1024 * 1024
+    _mock_body(mock_response)
+    mock_response.raise_for_status = MagicMock()
+
+    with pytest.raises(ResponseTooLarge):
+        await service.get_waste_collection_data("12345")
+
+    mock_response.content.iter_chunked.assert_not_called()
+
+
+async def test_get_waste_collection_data_stops_reading_when_complete(
+    mock_session, service
+):
+    """Test the rest of the body is left unread once every bin has a date."""
+    html_content = (
+        '<div class="regular-service general-waste">'
+        '<div class="next-service">Fri 12/9/2025</div></div>'
+        '<div class="regular-service recycling">'
+        '<div class="next-service">Fri 19/9/2025</div></div>'
+        '<div class="regular-service food-and-garden-waste">'
+        '<div class="next-service">Fri 26/9/2025</div></div>'
+    ) + "<p>footer</p>" * 1000
+    body = json.dumps({"responseContent": html_content}).encode()
+    mock_response = mock_session.get.return_value.__aenter__.return_value
+    mock_response.status = 200
+    mock_response.raise_for_status = MagicMock()
+    _mock_body(mock_response, body, chunk_size=64)
+
+    result = await service.get_waste_collection_data("12345")
+
+    assert result == {
+        "red": date(2025, 9, 12),
+        "yellow": date(2025, 9, 19),
+        "green": date(2025, 9, 26),
+    }
+    assert mock_response.bytes_read < len(body) // 10
+
+
+async def test_get_waste_collection_data_streamed_too_large(mock_session, service):
+    """Test a body without a length is cut off past the size limit."""
+    body = json.dumps({"responseContent": "<p>" * 1024}).encode()
+    mock_response = mock_session.get.return_value.__aenter__.return_value
+    mock_response.status = 200
+    mock_response.raise_for_status = MagicMock()
+    _mock_body(mock_response, body)
+
+    with (
+        patch.object(council_service, "MAX_RESPONSE_SIZE", 1024),
+        pytest.raises(ResponseTooLarge),
+    ):
+        await service.get_waste_collection_data("12345")
+
+
+async def test_get_waste_collection_data_counts_unparsed_dates(mock_session, service):
+    """Test collection text in no known format is counted in the metrics.
+
+    The green bin still takes the red bin's date.
+    """
+    html_content = MOCK_WASTE_DATES_HTML + (
+        '<div class="regular-service food-and-garden-waste">'
+        '<div class="next-service">Call us to book</div></div>'
+    )
+    mock_response = mock_session.get.return_value.__aenter__.return_value
+    mock_response.status = 200
+    mock_response.raise_for_status = MagicMock()
+    _mock_body(mock_response, json.dumps({"responseContent": html_content}).encode())
+
+    result = await service.get_waste_collection_data("12345")
+
+    assert result == {
+        "red": date(2025, 9, 16),
+        "yellow": date(2025, 9, 23),
+        "green": date(2025, 9, 16),
+    }
+    assert service.metrics["12345"].unparsed_dates == 1
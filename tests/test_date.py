@@ -13,12 +13,17 @@ from custom_components.blacktown_bin_buddy.date import (
     ENTITIES,
 )
 from custom_components.blacktown_bin_buddy.coordinator import BinBuddyCoordinator
-
-MOCK_COORDINATOR_DATA = {
-    "red": date(2025, 9, 16),
-    "yellow": date(2025, 9, 23),
-    "green": date(2025, 10, 1),
-}
+from custom_components.blacktown_bin_buddy.hub import BinBuddyHub
+from custom_components.blacktown_bin_buddy.schedule import Schedule
+from custom_components.blacktown_bin_buddy.store import ScheduleStore
+
+MOCK_COORDINATOR_DATA = Schedule.of(
+    {
+        "red": date(2025, 9, 16),
+        "yellow": date(2025, 9, 23),
+        "green": date(2025, 10, 1),
+    }
+)
 
 
 @pytest.fixture
@@ -44,7 +49,8 @@ def mock_add_entities():
 
 
 async def test_async_setup_entry(mock_hass, mock_coordinator, mock_add_entities):
-    """Test the setup of date entities."""
+    """Test every bin gets a date entity before the first refresh."""
+    mock_coordinator.data = None
     mock_config_entry = MagicMock()
     mock_config_entry.runtime_data = mock_coordinator
 
@@ -57,7 +63,7 @@ async def test_async_setup_entry(mock_hass, mock_coordinator, mock_add_entities)
     added_entities = mock_add_entities.call_args[0][0]
 
     # Ensure we have the correct number of entities
-    assert len(list(added_entities)) == len(MOCK_COORDINATOR_DATA)
+    assert len(list(added_entities)) == len(ENTITIES)
 
 
 def test_bin_buddy_date_entity_properties(mock_coordinator):
@@ -88,7 +94,7 @@ def test_bin_buddy_date_entity_properties(mock_coordinator):
 def test_bin_buddy_date_entity_no_data(mock_coordinator):
     """Test entity behavior when its specific data is not available."""
     # Create a coordinator with missing data for one bin type
-    mock_coordinator.data = {"red": date(2025, 9, 16)}
+    mock_coordinator.data = Schedule.of({"red": date(2025, 9, 16)})
 
     # Test the 'yellow' bin, which has no data
     description = ENTITIES[1]
@@ -98,3 +104,60 @@ def test_bin_buddy_date_entity_no_data(mock_coordinator):
 
     # The native_value should be None
     assert entity.native_value is None
+
+
+def test_bin_buddy_date_entity_before_first_refresh(mock_coordinator):
+    """Test entities are unavailable until the first schedule arrives."""
+    mock_coordinator.data = None
+    mock_coordinator.last_update_success = True
+    entity = BinBuddyDateEntity(mock_coordinator, ENTITIES[0])
+
+    assert entity.available is False
+    assert entity.native_value is None
+
+    mock_coordinator.data = MOCK_COORDINATOR_DATA
+    assert entity.available is True
+    assert entity.native_value == date(2025, 9, 16)
+
+
+def test_only_changed_bins_write_state(mock_hass):
+    """Test a refresh writes state only for the bins whose date changed."""
+    config_entry = MagicMock(data={"id": "test-geo-id"}, entry_id="test-entry-id")
+    coordinator = BinBuddyCoordinator(
+        mock_hass,
+        config_entry,
+        MagicMock(spec=BinBuddyHub),
+        MagicMock(spec=ScheduleStore),
+    )
+    entities = [BinBuddyDateEntity(coordinator, description) for description in ENTITIES]
+    for entity in entities:
+        entity.async_write_ha_state = MagicMock()
+        coordinator.async_add_listener(
+            entity._handle_coordinator_update, entity.coordinator_context
+        )
+
+    def _state_writes(data):
+        for entity in entities:
+            entity.async_write_ha_state.reset_mock()
+        coordinator.async_set_updated_data(data)
+        return {
+            entity.entity_description.key
+            for entity in entities
+            if entity.async_write_ha_state.called
+        }
+
+    # The first update reaches every entity
+    assert _state_writes(MOCK_COORDINATOR_DATA) == {"red", "yellow", "green"}
+    red_changed = Schedule.of({**MOCK_COORDINATOR_DATA, "red": date(2025, 9, 23)})
+    assert _state_writes(red_changed) == {"red"}
+    # A shared but unchanged schedule writes nothing
+    assert _state_writes(red_changed) == set()
+    green_gone = Schedule.of({"red": date(2025, 9, 23), "yellow": date(2025, 9, 23)})
+    assert _state_writes(green_gone) == {"green"}
+
+    # A failed refresh makes every entity unavailable
+    coordinator.last_update_success = False
+    for entity in entities:
+        entity.async_write_ha_state.reset_mock()
+    coordinator.async_update_listeners()
+    assert all(entity.async_write_ha_state.called for entity in entities)
@@ -0,0 +1,91 @@
+"""Tests for the collection date formats."""
+
+from datetime import date
+
+import pytest
+
+from custom_components.blacktown_bin_buddy import date_formats
+from custom_components.blacktown_bin_buddy.date_formats import CollectionDateParser
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Fri 12/9/2025", date(2025, 9, 12)),
+        ("Fri 05/09/2025", date(2025, 9, 5)),
+        ("Tuesday, 16 September 2025", date(2025, 9, 16)),
+        ("Tue 16th Sept, 2025", date(2025, 9, 16)),
+        ("Mon 31/2/2025", None),
+        ("Book online", None),
+    ],
+)
+def test_parse(text, expected):
+    """Test each known format is recognised and anything else is not."""
+    assert CollectionDateParser().parse(text) == expected
+
+
+def test_parse_remembers_format(monkeypatch):
+    """Test the format that last matched for an address is tried first."""
+    parser = CollectionDateParser()
+    assert parser.parse("Tuesday, 16 September 2025", "geo-1") == date(2025, 9, 16)
+
+    monkeypatch.setattr(date_formats, "DATE_FORMATS", ())
+
+    # Only the remembered format is available now
+    assert parser.parse("Tuesday, 23 September 2025", "geo-1") == date(2025, 9, 23)
+    assert parser.parse("Tuesday, 23 September 2025", "geo-2") is None
+    assert parser.parse("Fri 12/9/2025", "geo-1") is None
+
+
+def test_parse_pickups_same_day_as():
+    """Test a bin collected with another takes its date in any order."""
+    dates, unparsed = CollectionDateParser().parse_pickups(
+        [
+            ("green", "Collected\xa0with your red bin"),
+            ("red", "Fri 12/9/2025"),
+            ("yellow", "Same day as the purple bin"),
+        ]
+    )
+
+    assert dates == {"red": date(2025, 9, 12), "green": date(2025, 9, 12)}
+    assert unparsed == [("yellow", "Same day as the purple bin")]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Same day as your general waste bin",
+        "Collected with the General-Waste bin",
+        "Collected with your red bin",
+    ],
+)
+def test_parse_pickups_names_bins(text):
+    """Test a bin can be named by colour, service or display name."""
+    dates, unparsed = CollectionDateParser().parse_pickups(
+        [("yellow", text), ("red", "Fri 12/9/2025")]
+    )
+
+    assert dates == {"red": date(2025, 9, 12), "yellow": date(2025, 9, 12)}
+    assert unparsed == []
+
+
+def test_parse_pickups_green_follows_red():
+    """Test a green bin with text not understood takes the red bin's date."""
+    dates, unparsed = CollectionDateParser().parse_pickups(
+        [
+            ("green", "Please check the council's website"),
+            ("red", "Fri 12/9/2025"),
+            ("yellow", "Please check the council's website"),
+        ]
+    )
+
+    assert dates == {"red": date(2025, 9, 12), "green": date(2025, 9, 12)}
+    assert unparsed == [
+        ("green", "Please check the council's website"),
+        ("yellow", "Please check the council's website"),
+    ]
+
+    # Without a red date there is nothing to follow
+    dates, unparsed = CollectionDateParser().parse_pickups([("green", "Soon")])
+    assert dates == {}
+    assert unparsed == [("green", "Soon")]
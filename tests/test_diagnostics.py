@@ -0,0 +1,55 @@
+"""Tests for the diagnostics of the Blacktown Bin Buddy integration."""
+
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.blacktown_bin_buddy.coordinator import BinBuddyCoordinator
+from custom_components.blacktown_bin_buddy.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.blacktown_bin_buddy.metrics import FetchMetrics
+from custom_components.blacktown_bin_buddy.resilience import CircuitState
+
+
+async def test_config_entry_diagnostics():
+    """Test diagnostics report the schedule, coordinator and metrics."""
+    metrics = FetchMetrics()
+    metrics.record_fetch(0.2, 1024)
+    metrics.record_parse(0.01, 3)
+    metrics.cache_misses += 1
+
+    coordinator = MagicMock(spec=BinBuddyCoordinator)
+    coordinator.data = {"red": date(2025, 9, 16)}
+    coordinator.last_update_success = True
+    coordinator.last_exception = None
+    coordinator.consecutive_failures = 0
+    coordinator.update_interval = timedelta(hours=6)
+    coordinator.next_refresh = dt_util.utcnow() + timedelta(hours=6)
+    coordinator.recurrence = MagicMock(cadences={"red": 7})
+    coordinator.fetch_metrics = metrics
+    coordinator.hub = MagicMock()
+    coordinator.hub.service.breaker.state = CircuitState.CLOSED
+
+    entry = MagicMock()
+    entry.title = "1 Test St, Blacktown"
+    entry.data = {"id": "test-geo-id", "AddressSingleLine": "1 Test St, Blacktown"}
+    entry.runtime_data = coordinator
+
+    result = await async_get_config_entry_diagnostics(
+        MagicMock(spec=HomeAssistant), entry
+    )
+
+    assert result["entry"] == {
+        "title": "**REDACTED**",
+        "data": {"id": "**REDACTED**", "AddressSingleLine": "**REDACTED**"},
+    }
+    assert result["schedule"] == {"red": "2025-09-16"}
+    assert result["coordinator"]["update_interval"] == 6 * 3600
+    assert result["coordinator"]["circuit"] == "closed"
+    assert 0 < result["coordinator"]["seconds_to_next_refresh"] <= 6 * 3600
+    assert result["cadences"] == {"red": 7}
+    assert result["metrics"]["last_response_size"] == 1024
+    assert result["metrics"]["cache_hit_ratio"] == 0
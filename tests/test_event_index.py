@@ -0,0 +1,49 @@
+"""Tests for the collection event index."""
+
+from datetime import date
+
+from custom_components.blacktown_bin_buddy.event_index import CollectionEventIndex
+from custom_components.blacktown_bin_buddy.recurrence import RecurrenceEngine
+
+MOCK_WASTE_DATA = {
+    "red": date(2025, 9, 16),
+    "yellow": date(2025, 9, 16),
+    "green": date(2025, 9, 23),
+}
+
+
+def _index(horizon_days=365):
+    engine = RecurrenceEngine()
+    engine.observe(MOCK_WASTE_DATA, date(2025, 9, 14))
+    return CollectionEventIndex.build(engine, date(2025, 9, 14), horizon_days)
+
+
+def test_build_projects_horizon():
+    """Test a year of weekly and fortnightly collections is indexed."""
+    index = _index()
+
+    assert len(index) == 52 + 26 + 26
+    assert index.between(date(2026, 9, 14), date(2026, 12, 31)) == []
+
+
+def test_between():
+    """Test range queries return collections inclusively and in date order."""
+    index = _index()
+
+    assert index.between(date(2025, 9, 23), date(2025, 9, 30)) == [
+        (date(2025, 9, 23), "green"),
+        (date(2025, 9, 23), "red"),
+        (date(2025, 9, 30), "red"),
+        (date(2025, 9, 30), "yellow"),
+    ]
+    assert index.between(date(2025, 9, 24), date(2025, 9, 29)) == []
+    assert index.between(date(2025, 9, 30), date(2025, 9, 1)) == []
+
+
+def test_first_on_or_after():
+    """Test the next collection is found from any day."""
+    index = _index(horizon_days=14)
+
+    assert index.first_on_or_after(date(2025, 9, 17)) == (date(2025, 9, 23), "green")
+    assert index.first_on_or_after(date(2025, 10, 1)) is None
+    assert CollectionEventIndex([], []).first_on_or_after(date(2025, 9, 1)) is None
@@ -0,0 +1,150 @@
+"""Tests for the shared BinBuddyHub."""
+
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.blacktown_bin_buddy.council_service import (
+    CannotConnect,
+    CouncilService,
+)
+from custom_components.blacktown_bin_buddy.hub import DATA_HUB, BinBuddyHub
+
+MOCK_WASTE_DATA = {"red": date(2025, 9, 16)}
+
+
+def _mock_coordinator(geolocation_id):
+    """Return a mock coordinator subscribed to the given address."""
+    coordinator = MagicMock()
+    coordinator.geolocation_id = geolocation_id
+    coordinator.data = None
+    return coordinator
+
+
+@pytest.fixture
+def mock_hass():
+    """Fixture for HomeAssistant."""
+    hass = MagicMock(spec=HomeAssistant)
+    hass.data = {}
+    return hass
+
+
+@pytest.fixture
+def mock_service():
+    """Fixture for the council service."""
+    service = MagicMock(spec=CouncilService)
+    service.get_waste_collection_data = AsyncMock(return_value=MOCK_WASTE_DATA)
+    return service
+
+
+async def test_concurrent_fetches_are_coalesced(mock_hass, mock_service):
+    """Test entries for the same address share a single fetch."""
+    hub = BinBuddyHub(mock_hass, mock_service)
+    first = _mock_coordinator("geo-1")
+    second = _mock_coordinator("geo-1")
+    hub.async_subscribe(first)
+    hub.async_subscribe(second)
+
+    results = await asyncio.gather(hub.async_fetch(first), hub.async_fetch(second))
+
+    assert results == [MOCK_WASTE_DATA, MOCK_WASTE_DATA]
+    mock_service.get_waste_collection_data.assert_called_once_with("geo-1")
+    # Both were requesters, so neither needs a pushed update
+    first.async_set_updated_data.assert_not_called()
+    second.async_set_updated_data.assert_not_called()
+
+
+async def test_result_is_fanned_out_to_subscribers(mock_hass, mock_service):
+    """Test idle subscribers receive the result of another entry's fetch."""
+    hub = BinBuddyHub(mock_hass, mock_service)
+    requester = _mock_coordinator("geo-1")
+    sibling = _mock_coordinator("geo-1")
+    other_address = _mock_coordinator("geo-2")
+    for coordinator in (requester, sibling, other_address):
+        hub.async_subscribe(coordinator)
+
+    await hub.async_fetch(requester)
+
+    requester.async_set_updated_data.assert_not_called()
+    sibling.async_set_updated_data.assert_called_once_with(MOCK_WASTE_DATA)
+    other_address.async_set_updated_data.assert_not_called()
+    assert sorted(hub.geolocation_ids) == ["geo-1", "geo-2"]
+
+
+async def test_unchanged_result_is_fanned_out(mock_hass, mock_service):
+    """Test idle subscribers receive an unchanged result to reset their timers."""
+    hub = BinBuddyHub(mock_hass, mock_service)
+    requester = _mock_coordinator("geo-1")
+    sibling = _mock_coordinator("geo-1")
+    sibling.data = MOCK_WASTE_DATA
+    for coordinator in (requester, sibling):
+        hub.async_subscribe(coordinator)
+
+    await hub.async_fetch(requester)
+
+    sibling.async_set_updated_data.assert_called_once_with(MOCK_WASTE_DATA)
+    requester.async_set_updated_data.assert_not_called()
+
+
+async def test_fetch_errors_reach_every_requester(mock_hass, mock_service):
+    """Test a failed shared fetch raises for all joined requesters."""
+    mock_service.get_waste_collection_data.side_effect = CannotConnect
+    hub = BinBuddyHub(mock_hass, mock_service)
+    first = _mock_coordinator("geo-1")
+    second = _mock_coordinator("geo-1")
+
+    results = await asyncio.gather(
+        hub.async_fetch(first), hub.async_fetch(second), return_exceptions=True
+    )
+
+    assert all(isinstance(result, CannotConnect) for result in results)
+    mock_service.get_waste_collection_data.assert_called_once()
+
+
+async def test_hub_released_after_last_unsubscribe(mock_hass, mock_service):
+    """Test the hub removes itself once no entries are subscribed."""
+    hub = BinBuddyHub(mock_hass, mock_service)
+    mock_hass.data[DATA_HUB] = hub
+    unsub_first = hub.async_subscribe(_mock_coordinator("geo-1"))
+    unsub_second = hub.async_subscribe(_mock_coordinator("geo-2"))
+
+    unsub_first()
+    assert mock_hass.data[DATA_HUB] is hub
+
+    unsub_second()
+    assert DATA_HUB not in mock_hass.data
+    mock_service.close.assert_called_once()
+
+
+async def test_owned_session_closed_after_last_unsubscribe(mock_hass, mock_service):
+    """Test a session owned by the hub is closed with it, or when HA stops."""
+    mock_hass.bus = MagicMock()
+    session = MagicMock()
+    session.close = AsyncMock()
+    hub = BinBuddyHub(mock_hass, mock_service, session)
+    unsub_close = mock_hass.bus.async_listen_once.return_value
+    unsub = hub.async_subscribe(_mock_coordinator("geo-1"))
+
+    unsub()
+
+    (close_session, _name), _ = mock_hass.async_create_task.call_args
+    await close_session
+    session.close.assert_awaited_once()
+    unsub_close.assert_called_once()
+
+
+async def test_owned_session_closed_on_stop(mock_hass, mock_service):
+    """Test the hub's session is closed when Home Assistant stops."""
+    mock_hass.bus = MagicMock()
+    session = MagicMock()
+    session.close = AsyncMock()
+    BinBuddyHub(mock_hass, mock_service, session)
+
+    (_event_type, on_close), _ = mock_hass.bus.async_listen_once.call_args
+    await on_close(MagicMock())
+
+    session.close.assert_awaited_once()
+    mock_hass.bus.async_listen_once.return_value.assert_not_called()
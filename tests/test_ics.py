@@ -0,0 +1,65 @@
+"""Tests for iCalendar rendering."""
+
+from datetime import date
+
+from custom_components.blacktown_bin_buddy.ics import CalendarFeed, render_calendar
+
+EVENTS = [
+    ("entry-red-20250916@test", date(2025, 9, 16), "General Waste"),
+    ("entry-yellow-20250923@test", date(2025, 9, 23), "Recycling"),
+]
+
+
+def test_render_calendar():
+    """Test events are rendered as all-day VEVENTs with CRLF line endings."""
+    lines = render_calendar("1 Test St", EVENTS).decode().split("\r\n")
+
+    assert lines[:6] == [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//Blacktown Bin Buddy//Collections//EN",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        "X-WR-CALNAME:1 Test St",
+    ]
+    assert lines[6:14] == [
+        "BEGIN:VEVENT",
+        "UID:entry-red-20250916@test",
+        "DTSTAMP:20250916T000000Z",
+        "DTSTART;VALUE=DATE:20250916",
+        "DTEND;VALUE=DATE:20250917",
+        "SUMMARY:General Waste",
+        "TRANSP:TRANSPARENT",
+        "END:VEVENT",
+    ]
+    assert lines[-2:] == ["END:VCALENDAR", ""]
+    assert lines.count("BEGIN:VEVENT") == 2
+
+
+def test_render_calendar_escapes_and_folds():
+    """Test text values are escaped and long lines folded at 75 octets."""
+    summary = "Recycling (Unit 1, 3 Test St; BLACKTOWN NSW 2148) " * 3
+    body = render_calendar("Bins", [("uid", date(2025, 9, 16), summary)])
+
+    lines = body.split(b"\r\n")
+    assert all(len(line) <= 75 for line in lines)
+    unfolded = body.replace(b"\r\n ", b"").decode()
+    assert r"SUMMARY:Recycling (Unit 1\, 3 Test St\; BLACKTOWN" in unfolded
+
+
+def test_render_calendar_folds_multibyte_characters():
+    """Test folding never splits a UTF-8 character."""
+    body = render_calendar("Bins", [("uid", date(2025, 9, 16), "é" * 100)])
+
+    for line in body.split(b"\r\n"):
+        assert len(line) <= 75
+        line.decode()
+    assert "é" * 100 in body.replace(b"\r\n ", b"").decode()
+
+
+def test_calendar_feed_etag():
+    """Test the ETag is stable for the same events and changes with them."""
+    feed = CalendarFeed.render("Bins", EVENTS)
+
+    assert feed == CalendarFeed.render("Bins", EVENTS)
+    assert feed.etag != CalendarFeed.render("Bins", EVENTS[:1]).etag
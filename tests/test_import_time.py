@@ -0,0 +1,47 @@
+"""Import time regression tests for the Blacktown Bin Buddy integration."""
+
+from pathlib import Path
+import subprocess
+import sys
+
+PACKAGE = "custom_components.blacktown_bin_buddy"
+
+# Modules Home Assistant loads when the integration and its platforms are set up
+MODULES = (f"{PACKAGE}.config_flow", f"{PACKAGE}.coordinator", f"{PACKAGE}.date")
+
+# Total self time, in microseconds, allowed for the integration's own modules
+IMPORT_TIME_BUDGET_US = 100_000
+
+# Heavy dependencies that must only be imported on first use
+LAZY_MODULES = ("bs4",)
+
+
+def _import_times() -> dict[str, int]:
+    """Return the self import time in microseconds of each loaded module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(MODULES)}"],
+        cwd=Path(__file__).parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def test_integration_import_time():
+    """Test loading the integration stays within budget and skips lazy modules."""
+    times = _import_times()
+
+    for module in LAZY_MODULES:
+        assert module not in times, f"{module} imported at load time"
+
+    own_time = sum(
+        self_us for name, self_us in times.items() if name.startswith(PACKAGE)
+    )
+    assert own_time < IMPORT_TIME_BUDGET_US
@@ -0,0 +1,47 @@
+"""Tests for the fetch and parse metrics."""
+
+from custom_components.blacktown_bin_buddy.metrics import (
+    FetchMetrics,
+    RollingHistogram,
+)
+
+
+def test_rolling_histogram_percentiles():
+    """Test nearest-rank percentiles over the held samples."""
+    histogram = RollingHistogram()
+    assert histogram.percentiles() == {}
+
+    for value in range(1, 101):
+        histogram.add(value)
+
+    assert histogram.percentiles() == {"p50": 50, "p95": 95, "p99": 99}
+
+
+def test_rolling_histogram_is_bounded():
+    """Test the oldest samples are dropped once the buffer is full."""
+    histogram = RollingHistogram(size=10)
+    for value in range(1000):
+        histogram.add(value)
+
+    assert len(histogram) == 10
+    assert histogram.percentiles() == {"p50": 994, "p95": 999, "p99": 999}
+
+
+def test_fetch_metrics():
+    """Test fetch metrics record the latest values and a hit ratio."""
+    metrics = FetchMetrics()
+    assert metrics.cache_hit_ratio is None
+
+    metrics.record_fetch(0.25, 2048)
+    metrics.record_parse(0.01, 3)
+    metrics.cache_misses += 1
+    metrics.record_fetch(0.5, 0)
+    metrics.cache_hits += 1
+
+    result = metrics.as_dict()
+    assert result["last_fetch_latency"] == 0.5
+    assert result["last_response_size"] == 0
+    assert result["fetch_latency"] == {"p50": 0.25, "p95": 0.5, "p99": 0.5}
+    assert result["parse_time"] == {"p50": 0.01, "p95": 0.01, "p99": 0.01}
+    assert result["service_elements"] == 3
+    assert result["cache_hit_ratio"] == 0.5
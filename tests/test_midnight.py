@@ -0,0 +1,61 @@
+"""Tests for the shared midnight dispatcher."""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.blacktown_bin_buddy.midnight import MidnightDispatcher
+
+
+@pytest.fixture
+def mock_track_time_change():
+    """Fixture for the time tracker behind the dispatcher."""
+    with patch(
+        "custom_components.blacktown_bin_buddy.midnight.async_track_time_change"
+    ) as track:
+        yield track
+
+
+def _midnight(day):
+    return dt_util.start_of_local_day(day)
+
+
+def test_runs_only_callbacks_due(mock_track_time_change):
+    """Test a midnight runs the callbacks due that day, and missed ones."""
+    dispatcher = MidnightDispatcher(MagicMock(spec=HomeAssistant))
+    missed, due, later = MagicMock(), MagicMock(), MagicMock()
+    dispatcher.async_schedule(date(2025, 9, 15), missed)
+    dispatcher.async_schedule(date(2025, 9, 16), due)
+    dispatcher.async_schedule(date(2025, 9, 17), later)
+
+    # One tracker serves every callback
+    mock_track_time_change.assert_called_once()
+    (_hass, on_midnight), _ = mock_track_time_change.call_args
+    on_midnight(_midnight(date(2025, 9, 16)))
+
+    missed.assert_called_once()
+    due.assert_called_once()
+    later.assert_not_called()
+
+    on_midnight(_midnight(date(2025, 9, 17)))
+    later.assert_called_once()
+    assert due.call_count == 1
+    # Nothing left to run, so the tracker is removed
+    mock_track_time_change.return_value.assert_called_once()
+
+
+def test_cancel(mock_track_time_change):
+    """Test a cancelled callback is not run and the tracker is released."""
+    dispatcher = MidnightDispatcher(MagicMock(spec=HomeAssistant))
+    action = MagicMock()
+    cancel = dispatcher.async_schedule(date(2025, 9, 16), action)
+
+    cancel()
+
+    mock_track_time_change.return_value.assert_called_once()
+    (_hass, on_midnight), _ = mock_track_time_change.call_args
+    on_midnight(_midnight(date(2025, 9, 16)))
+    action.assert_not_called()
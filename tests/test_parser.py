@@ -0,0 +1,147 @@
+"""Tests for the waste services HTML extractors."""
+
+import json
+
+import pytest
+
+from custom_components.blacktown_bin_buddy.parser import (
+    ResponseContentDecoder,
+    UnrecognisedMarkup,
+    WasteDatesExtractor,
+    extract_pickups,
+    extract_pickups_soup,
+)
+
+SHORT_DATES_HTML = """
+<div class="waste-services">
+    <div class="regular-service general-waste">
+        <div class="service-image"><img src="/red-lid.png"></div>
+        <div class="next-service">Fri 12/9/2025</div>
+    </div>
+    <div class="regular-service recycling">
+        <div class="service-image"><img src="/yellow-lid.png"></div>
+        <div class="next-service">Fri 19/9/2025</div>
+    </div>
+    <div class="regular-service food-and-garden-waste">
+        <div class="service-image"><img src="/green-lid.png"></div>
+        <div class="next-service">Fri 26/9/2025</div>
+    </div>
+</div>
+"""
+
+LONG_DATES_HTML = """
+<div class="regular-service general-waste">
+    <div class="service-image">
+        <img src="/red-lid.png">
+    </div>
+    <div class="next-service">
+        Tuesday, 16 September 2025
+    </div>
+</div>
+<div class="regular-service recycling">
+    <div class="service-image">
+        <img src="/yellow-lid.png">
+    </div>
+    <div class="next-service">
+        Tuesday, 23 September 2025
+    </div>
+</div>
+"""
+
+SPECIAL_MESSAGE_HTML = """
+<div class='regular-service general-waste' data-note="a > b">
+    <div class="next-service"><span>Fri</span> 12/9/2025</div>
+</div>
+<div class="regular-service food-and-garden-waste">
+    <div class="next-service">Collected&nbsp;with your <b>red</b> bin</div>
+</div>
+<div class="regular-service bulky-waste">
+    <div class="next-service">Book online</div>
+</div>
+"""
+
+NOISY_HTML = (
+    "<!-- <div class='regular-service recycling'> -->"
+    "<script>var tpl = '<div class=\"regular-service\">';</script>"
+    "<style>div.next-service > span { color: red; }</style>"
+    + "<div class='filler'><div>padding</div></div>" * 50
+    + SHORT_DATES_HTML
+)
+
+PARITY_FIXTURES = [SHORT_DATES_HTML, LONG_DATES_HTML, SPECIAL_MESSAGE_HTML, NOISY_HTML]
+
+
+@pytest.mark.parametrize("html_content", PARITY_FIXTURES)
+def test_fast_extractor_matches_beautifulsoup(html_content):
+    """Test both extractors return the same pickups for the same markup."""
+    assert extract_pickups(html_content) == extract_pickups_soup(html_content)
+
+
+@pytest.mark.parametrize("html_content", PARITY_FIXTURES)
+def test_chunked_feed_matches_single_feed(html_content):
+    """Test feeding markup in small chunks gives the same result."""
+    extractor = WasteDatesExtractor()
+    for start in range(0, len(html_content), 7):
+        extractor.feed(html_content[start : start + 7])
+
+    assert extractor.close() == extract_pickups(html_content)[0]
+
+
+def test_stops_once_every_bin_found():
+    """Test the extractor ignores markup after every colour has a date."""
+    extractor = WasteDatesExtractor()
+
+    assert extractor.feed(SHORT_DATES_HTML)
+    assert extractor.feed("</div></div></div>") is True
+    assert extractor.close() == [
+        ("red", "Fri 12/9/2025"),
+        ("yellow", "Fri 19/9/2025"),
+        ("green", "Fri 26/9/2025"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "html_content",
+    [
+        "</div>" + SHORT_DATES_HTML,
+        '<div class="regular-service general-waste"><div class="regular-service">',
+        '<div class="regular-service general-waste"/>',
+        '<p class="regular-service general-waste">Fri 12/9/2025</p>',
+    ],
+)
+def test_unrecognised_markup(html_content):
+    """Test markup the fast path cannot interpret raises for the fallback."""
+    with pytest.raises(UnrecognisedMarkup):
+        extract_pickups(html_content)
+
+
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 4096])
+def test_response_content_decoder(ensure_ascii, chunk_size):
+    """Test the page is decoded from a JSON body fed in chunks of any size."""
+    html_content = SPECIAL_MESSAGE_HTML + '<p title="\\ / caf\u00e9 \U0001f5d1">\t</p>'
+    body = json.dumps(
+        {"status": "ok", "responseContent": html_content, "after": "ignored"},
+        ensure_ascii=ensure_ascii,
+    ).encode()
+
+    decoder = ResponseContentDecoder()
+    decoded = "".join(
+        decoder.feed(body[start : start + chunk_size])
+        for start in range(0, len(body), chunk_size)
+    )
+    decoder.close()
+
+    assert decoded == html_content
+
+
+@pytest.mark.parametrize(
+    "body", [b'{"responseContent": "<div>', b'{"other": "<div>"}', b"not json"]
+)
+def test_response_content_decoder_incomplete(body):
+    """Test a body without a complete responseContent string is rejected."""
+    decoder = ResponseContentDecoder()
+    decoder.feed(body)
+
+    with pytest.raises(ValueError):
+        decoder.close()
@@ -0,0 +1,71 @@
+"""Tests for the collection recurrence engine."""
+
+from datetime import date
+from itertools import islice
+
+from custom_components.blacktown_bin_buddy.recurrence import RecurrenceEngine
+
+MOCK_WASTE_DATA = {
+    "red": date(2025, 9, 16),
+    "yellow": date(2025, 9, 16),
+    "green": date(2025, 9, 23),
+}
+
+
+def test_projects_from_default_cadences():
+    """Test a single fetch projects weekly red and alternating fortnightly bins."""
+    engine = RecurrenceEngine()
+    engine.observe(MOCK_WASTE_DATA, date(2025, 9, 14))
+
+    assert list(islice(engine.occurrences("red", date(2025, 9, 14)), 3)) == [
+        date(2025, 9, 16),
+        date(2025, 9, 23),
+        date(2025, 9, 30),
+    ]
+    assert engine.upcoming(date(2025, 9, 17), 5) == [
+        (date(2025, 9, 23), "green"),
+        (date(2025, 9, 23), "red"),
+        (date(2025, 9, 30), "red"),
+        (date(2025, 9, 30), "yellow"),
+        (date(2025, 10, 7), "green"),
+    ]
+
+
+def test_matching_fetch_keeps_cadence():
+    """Test fetches on the projected dates do not trigger re-learning."""
+    engine = RecurrenceEngine()
+    engine.observe(MOCK_WASTE_DATA, date(2025, 9, 14))
+
+    relearned = engine.observe(
+        {"red": date(2025, 9, 30), "yellow": date(2025, 9, 30)}, date(2025, 9, 25)
+    )
+
+    assert relearned == []
+    assert engine.cadences == {"red": 7, "yellow": 14, "green": 14}
+
+
+def test_mismatch_relearns_cadence():
+    """Test a fetch off the projection re-learns the cadence from the gap."""
+    engine = RecurrenceEngine()
+    engine.observe({"yellow": date(2025, 9, 16)}, date(2025, 9, 14))
+
+    # Collected weekly, not fortnightly as projected
+    assert engine.observe({"yellow": date(2025, 9, 23)}, date(2025, 9, 17)) == [
+        "yellow"
+    ]
+    assert engine.cadences == {"yellow": 7}
+
+    # A holiday shift keeps the cadence but moves the phase
+    assert engine.observe({"yellow": date(2025, 10, 1)}, date(2025, 9, 24)) == [
+        "yellow"
+    ]
+    assert engine.cadences == {"yellow": 7}
+    assert next(engine.occurrences("yellow", date(2025, 10, 2))) == date(2025, 10, 8)
+
+
+def test_unknown_bin_has_no_occurrences():
+    """Test bins that were never observed project nothing."""
+    engine = RecurrenceEngine()
+
+    assert list(engine.occurrences("red", date(2025, 9, 14))) == []
+    assert engine.upcoming(date(2025, 9, 14), 12) == []
@@ -0,0 +1,328 @@
+"""Tests for retries, timeouts and the circuit breaker."""
+
+import asyncio
+from datetime import UTC, date, datetime, timedelta
+from email.utils import format_datetime
+import json
+import time
+from unittest.mock import patch
+
+import aiohttp
+from aiohttp import web
+import pytest
+
+from custom_components.blacktown_bin_buddy import council_service
+from custom_components.blacktown_bin_buddy.council_service import (
+    CannotConnect,
+    CircuitOpen,
+    CouncilService,
+    CouncilServiceError,
+    RateLimited,
+)
+from custom_components.blacktown_bin_buddy.resilience import (
+    CircuitBreaker,
+    CircuitState,
+    TokenBucket,
+    is_transient,
+    retry_after,
+)
+
+MOCK_WASTE_DATES_HTML = """
+<div class="regular-service general-waste">
+    <div class="next-service">Tue 16/9/2025</div>
+</div>
+"""
+
+
+class FaultyCouncil:
+    """A stand-in for the council's API that injects faults on request."""
+
+    def __init__(self) -> None:
+        """Initialize the server."""
+        self.requests = 0
+        # Faults for the next requests: an HTTP status, a status and its
+        # Retry-After header, or "hang"
+        self.faults: list[int | tuple[int, str] | str] = []
+        self.runner: web.AppRunner | None = None
+        self.url = ""
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if self.faults:
+            fault = self.faults.pop(0)
+            if fault == "hang":
+                await asyncio.sleep(1)
+            if isinstance(fault, tuple):
+                status, delay = fault
+                return web.Response(status=status, headers={"Retry-After": delay})
+            return web.Response(status=fault)
+        body = json.dumps({"responseContent": MOCK_WASTE_DATES_HTML})
+        return web.Response(text=body, content_type="application/json")
+
+    async def start(self) -> None:
+        """Start serving on a free local port."""
+        app = web.Application()
+        app.router.add_get("/wasteservices", self._handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, "127.0.0.1", 0).start()
+        host, port = self.runner.addresses[0][:2]
+        self.url = f"http://{host}:{port}/wasteservices?geolocationid="
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        await self.runner.cleanup()
+
+
+@pytest.fixture
+async def council(socket_enabled):
+    """Fixture for the fault-injecting council server, on a local socket."""
+    server = FaultyCouncil()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+async def service(council):
+    """Fixture for a service pointed at the fault-injecting server."""
+    with (
+        patch.object(council_service, "WASTE_COLLECTION_DATES_URL", council.url),
+        patch.object(council_service, "RETRY_BACKOFF_BASE", 0.01),
+        patch.object(council_service, "REQUEST_TIMEOUT", 0.5),
+        patch.object(council_service, "REFRESH_REQUESTS_PER_SECOND", 1000),
+    ):
+        async with aiohttp.ClientSession() as session:
+            service = CouncilService(session)
+            yield service
+            # Joined, as the test harness fails tests that leave threads behind
+            service._parse_executor.shutdown()
+
+
+def test_circuit_breaker_opens_and_half_opens():
+    """Test the circuit opens at the threshold and probes after the timeout."""
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    with patch("time.monotonic", return_value=1000):
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
+
+    with patch("time.monotonic", return_value=1061):
+        assert breaker.state is CircuitState.HALF_OPEN
+        # Only one probe at a time
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        # A failed probe opens the circuit again
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+
+    with patch("time.monotonic", return_value=1122):
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.failures == 0
+
+
+def test_circuit_breaker_release_probe():
+    """Test a probe that ends without an outcome lets another through."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.release()
+    assert breaker.allow_request()
+
+
+@pytest.mark.parametrize(
+    ("err", "expected"),
+    [
+        (aiohttp.ServerDisconnectedError(), True),
+        (aiohttp.ClientConnectionError(), True),
+        (TimeoutError(), True),
+        (aiohttp.ClientResponseError(None, (), status=503), True),
+        (aiohttp.ClientResponseError(None, (), status=429), True),
+        (aiohttp.ClientResponseError(None, (), status=404), False),
+        (ValueError(), False),
+    ],
+)
+def test_is_transient(err, expected):
+    """Test which errors are retried."""
+    assert is_transient(err) is expected
+
+
+async def test_transient_errors_are_retried(council, service):
+    """Test transient failures are retried until the request succeeds."""
+    council.faults = [503, 502]
+
+    result = await service.get_waste_collection_data("12345")
+
+    assert result == {"red": date(2025, 9, 16)}
+    assert council.requests == 3
+    assert service.breaker.failures == 0
+
+
+async def test_retries_are_bounded(council, service):
+    """Test a request fails once its attempts are used up."""
+    council.faults = [500, 500, 500, 500]
+
+    with pytest.raises(CannotConnect):
+        await service.get_waste_collection_data("12345")
+
+    assert council.requests == 3
+    assert service.breaker.failures == 1
+
+
+async def test_client_errors_are_not_retried(council, service):
+    """Test a client error is not retried and does not count against the circuit."""
+    council.faults = [404]
+
+    with pytest.raises(CannotConnect):
+        await service.get_waste_collection_data("12345")
+
+    assert council.requests == 1
+    assert service.breaker.failures == 0
+
+
+async def test_slow_responses_time_out(council, service):
+    """Test a hanging server is abandoned after the request timeout."""
+    council.faults = ["hang", "hang", "hang"]
+
+    with pytest.raises(CannotConnect):
+        await service.get_waste_collection_data("12345")
+
+    assert council.requests == 3
+
+
+async def test_circuit_breaker_fails_fast_and_recovers(council, service):
+    """Test an unhealthy server is left alone until a probe succeeds."""
+    service.breaker.failure_threshold = 2
+    council.faults = [503] * 6
+
+    for _ in range(2):
+        with pytest.raises(CannotConnect):
+            await service.get_waste_collection_data("12345")
+    assert council.requests == 6
+    assert service.breaker.state is CircuitState.OPEN
+
+    # Requests fail without reaching the server while the circuit is open
+    with pytest.raises(CircuitOpen):
+        await service.get_waste_collection_data("12345")
+    with pytest.raises(CircuitOpen):
+        await service.search_address("1 Test St")
+    assert council.requests == 6
+
+    # After the reset timeout a probe is let through and closes the circuit
+    service.breaker.reset_timeout = 0
+    result = await service.get_waste_collection_data("12345")
+    assert result == {"red": date(2025, 9, 16)}
+    assert service.breaker.state is CircuitState.CLOSED
+
+
+async def test_unreachable_server(service):
+    """Test connection errors are retried and reported as CannotConnect."""
+    with patch.object(
+        council_service, "WASTE_COLLECTION_DATES_URL", "http://127.0.0.1:1/?id="
+    ):
+        with pytest.raises(CannotConnect) as excinfo:
+            await service.get_waste_collection_data("12345")
+
+    assert not isinstance(excinfo.value, CircuitOpen)
+    assert isinstance(excinfo.value, CouncilServiceError)
+
+
+async def test_token_bucket_limits_rate():
+    """Test requests beyond the burst start at the bucket's rate."""
+    bucket = TokenBucket(rate=20, capacity=2)
+    start = time.monotonic()
+    for _ in range(2):
+        await bucket.async_acquire()
+    # The burst is free
+    assert time.monotonic() - start < 0.04
+
+    for _ in range(4):
+        await bucket.async_acquire()
+    assert time.monotonic() - start >= 0.19
+
+
+async def test_token_bucket_pause():
+    """Test a paused bucket hands out nothing until the pause is over."""
+    bucket = TokenBucket(rate=1000, capacity=5)
+    bucket.pause(0.1)
+    start = time.monotonic()
+    await bucket.async_acquire()
+    assert time.monotonic() - start >= 0.1
+
+    # A shorter pause does not cut a longer one short
+    bucket.pause(0.1)
+    bucket.pause(0.01)
+    start = time.monotonic()
+    await bucket.async_acquire()
+    assert time.monotonic() - start >= 0.09
+
+
+async def test_token_bucket_max_wait():
+    """Test a request gives up once it has waited max_wait."""
+    bucket = TokenBucket(rate=1, capacity=1, max_wait=0.05)
+    await bucket.async_acquire()
+    with pytest.raises(TimeoutError):
+        await bucket.async_acquire()
+
+
+@pytest.mark.parametrize(
+    ("status", "value", "expected"),
+    [
+        (429, "2", 2),
+        (503, "2.5", 2.5),
+        (429, "-5", 0),
+        (429, "3600", 300),
+        (429, "soon", None),
+        (429, None, None),
+        (500, "2", None),
+    ],
+)
+def test_retry_after(status, value, expected):
+    """Test Retry-After is honoured for throttling statuses, up to the cap."""
+    headers = {} if value is None else {"Retry-After": value}
+    err = aiohttp.ClientResponseError(None, (), status=status, headers=headers)
+    assert retry_after(err, 300) == expected
+
+
+def test_retry_after_http_date():
+    """Test Retry-After given as an HTTP date."""
+    when = datetime.now(UTC) + timedelta(seconds=60)
+    err = aiohttp.ClientResponseError(
+        None, (), status=503, headers={"Retry-After": format_datetime(when, True)}
+    )
+    assert 55 < retry_after(err, 300) <= 60
+    assert retry_after(ValueError(), 300) is None
+
+
+async def test_retry_after_pauses_requests(council, service):
+    """Test a throttled response holds back searches and refreshes alike."""
+    council.faults = [(429, "0.2")]
+    start = time.monotonic()
+
+    result = await service.get_waste_collection_data("12345")
+
+    assert result == {"red": date(2025, 9, 16)}
+    assert council.requests == 2
+    # The retry waited for Retry-After rather than the backoff
+    assert time.monotonic() - start >= 0.2
+
+    service.search_bucket.pause(0.2)
+    service.search_bucket.max_wait = 0.01
+    with pytest.raises(RateLimited):
+        await service.search_address("1 Test St")
+    # Giving up on the rate limit says nothing about the service's health
+    assert service.breaker.state is CircuitState.CLOSED
+    assert service.breaker.failures == 0
+
+    # Refreshes give up too, rather than hold a fetch slot for the whole pause
+    assert service.refresh_bucket.max_wait < council_service.RETRY_AFTER_MAX
+    service.refresh_bucket.pause(0.2)
+    service.refresh_bucket.max_wait = 0.01
+    with pytest.raises(RateLimited):
+        await service.get_waste_collection_data("12345")
@@ -0,0 +1,50 @@
+"""Tests for the schedule snapshot."""
+
+from datetime import date
+import pickle
+
+import pytest
+
+from custom_components.blacktown_bin_buddy.schedule import Schedule
+
+MOCK_WASTE_DATA = {"red": date(2025, 9, 16), "green": date(2025, 9, 23)}
+
+
+def test_schedule_reads_as_mapping():
+    """Test a schedule behaves like a dict of the bins with a date."""
+    schedule = Schedule.of(MOCK_WASTE_DATA)
+
+    assert schedule == MOCK_WASTE_DATA
+    assert dict(schedule) == MOCK_WASTE_DATA
+    assert list(schedule) == ["red", "green"]
+    assert len(schedule) == 2
+    assert "yellow" not in schedule
+    assert schedule.get("yellow") is None
+    assert (schedule.red, schedule.yellow, schedule.green) == (
+        date(2025, 9, 16),
+        None,
+        date(2025, 9, 23),
+    )
+    with pytest.raises(KeyError):
+        schedule["purple"]
+
+
+def test_schedule_is_interned():
+    """Test identical schedules share one object, however they were made."""
+    schedule = Schedule.of(MOCK_WASTE_DATA)
+
+    assert Schedule.of(dict(reversed(MOCK_WASTE_DATA.items()))) is schedule
+    assert Schedule.of({**MOCK_WASTE_DATA, "purple": date(2025, 1, 1)}) is schedule
+    assert pickle.loads(pickle.dumps(schedule)) is schedule
+    assert Schedule.of({"red": date(2025, 9, 16)}) != schedule
+    assert not hasattr(schedule, "__dict__")
+
+
+def test_schedule_is_immutable():
+    """Test a shared schedule cannot be changed or built directly."""
+    schedule = Schedule.of(MOCK_WASTE_DATA)
+
+    with pytest.raises(AttributeError):
+        schedule._red = 0
+    with pytest.raises(TypeError):
+        Schedule()
@@ -0,0 +1,101 @@
+"""Tests for the sensor platform of the Blacktown Bin Buddy integration."""
+
+from datetime import date, datetime, UTC
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.blacktown_bin_buddy.coordinator import BinBuddyCoordinator
+from custom_components.blacktown_bin_buddy.hub import BinBuddyHub
+from custom_components.blacktown_bin_buddy.metrics import FetchMetrics
+from custom_components.blacktown_bin_buddy.midnight import MidnightDispatcher
+from custom_components.blacktown_bin_buddy.schedule import Schedule
+from custom_components.blacktown_bin_buddy.sensor import (
+    async_setup_entry,
+    BinBuddyDaysUntilSensor,
+    BinBuddyFetchMetricsSensor,
+)
+
+
+def _mock_coordinator():
+    """Return a mock coordinator with no fetches yet."""
+    coordinator = MagicMock(spec=BinBuddyCoordinator)
+    coordinator.config_entry = MagicMock()
+    coordinator.config_entry.entry_id = "test-entry-id"
+    coordinator.fetch_metrics = None
+    coordinator.consecutive_failures = 0
+    coordinator.next_refresh = None
+    coordinator.data = Schedule.of({"red": date(2025, 9, 16)})
+    return coordinator
+
+
+async def test_async_setup_entry():
+    """Test one metrics sensor is added per entry."""
+    entry = MagicMock()
+    entry.runtime_data = _mock_coordinator()
+    add_entities = MagicMock()
+
+    await async_setup_entry(MagicMock(spec=HomeAssistant), entry, add_entities)
+
+    (entities,) = add_entities.call_args[0]
+    assert [entity.unique_id for entity in entities] == [
+        "test-entry-id_fetch_latency",
+        "test-entry-id_red_days_until",
+        "test-entry-id_yellow_days_until",
+        "test-entry-id_green_days_until",
+    ]
+    assert entities[0].entity_registry_enabled_default is False
+
+
+def test_fetch_metrics_sensor():
+    """Test the sensor reports the latest latency and the metrics."""
+    coordinator = _mock_coordinator()
+    sensor = BinBuddyFetchMetricsSensor(coordinator)
+    assert sensor.native_value is None
+    assert sensor.extra_state_attributes == {
+        "consecutive_failures": 0,
+        "next_refresh": None,
+    }
+
+    coordinator.fetch_metrics = FetchMetrics()
+    coordinator.fetch_metrics.record_fetch(0.3, 512)
+    coordinator.consecutive_failures = 2
+    coordinator.next_refresh = datetime(2025, 9, 17, 15, 0, tzinfo=UTC)
+
+    assert sensor.native_value == 0.3
+    attributes = sensor.extra_state_attributes
+    assert attributes["last_response_size"] == 512
+    assert attributes["consecutive_failures"] == 2
+    assert attributes["next_refresh"] == "2025-09-17T15:00:00+00:00"
+    assert sensor.available is True
+
+
+def test_days_until_sensor():
+    """Test the countdown is recounted every midnight."""
+    coordinator = _mock_coordinator()
+    coordinator.next_collection.return_value = date(2025, 9, 16)
+    coordinator.hub = MagicMock(spec=BinBuddyHub)
+    coordinator.hub.midnight = MagicMock(spec=MidnightDispatcher)
+    sensor = BinBuddyDaysUntilSensor(coordinator, "red")
+
+    with patch.object(
+        dt_util, "now", return_value=datetime(2025, 9, 14, 9, 0, tzinfo=UTC)
+    ):
+        sensor._async_update_countdown()
+
+    assert sensor.native_value == 2
+    (day, _action), _ = coordinator.hub.midnight.async_schedule.call_args
+    assert day == date(2025, 9, 15)
+
+
+def test_sensors_share_device():
+    """Test the entry's sensors belong to its one Bin Collection device."""
+    coordinator = _mock_coordinator()
+    metrics = BinBuddyFetchMetricsSensor(coordinator)
+    days_until = BinBuddyDaysUntilSensor(coordinator, "red")
+
+    assert metrics.device_info == days_until.device_info
+    assert metrics.device_info["identifiers"] == {
+        ("blacktown_bin_buddy", "test-entry-id")
+    }
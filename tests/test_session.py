@@ -0,0 +1,26 @@
+"""Tests for the council HTTP session."""
+
+from aiohttp import hdrs
+
+from custom_components.blacktown_bin_buddy.const import (
+    COUNCIL_CONNECTIONS_PER_HOST,
+    DNS_CACHE_TTL,
+)
+from custom_components.blacktown_bin_buddy.session import (
+    async_create_council_session,
+)
+
+
+async def test_council_session_has_its_own_pool():
+    """Test the session owns a connector tuned for the council's hosts."""
+    session = async_create_council_session()
+    try:
+        connector = session.connector
+        assert connector.limit_per_host == COUNCIL_CONNECTIONS_PER_HOST
+        assert connector.use_dns_cache
+        assert connector._cached_hosts._ttl == DNS_CACHE_TTL
+        assert connector._keepalive_timeout > 15
+        assert hdrs.USER_AGENT in session.headers
+    finally:
+        await session.close()
+    assert connector.closed
@@ -0,0 +1,38 @@
+"""Tests for staggered refresh timing."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from custom_components.blacktown_bin_buddy.stagger import jittered, refresh_offset
+
+WINDOW = timedelta(hours=1)
+
+
+def test_refresh_offset_is_stable():
+    """Test an address keeps its slot and the slot lies within the window."""
+    offset = refresh_offset("test-geo-id", WINDOW)
+
+    assert offset == refresh_offset("test-geo-id", WINDOW)
+    assert timedelta(0) <= offset < WINDOW
+
+
+def test_refresh_offset_spreads_addresses():
+    """Test many addresses are spread evenly across the window."""
+    buckets = [0] * 6
+    for n in range(6000):
+        offset = refresh_offset(f"geo-{n}", WINDOW)
+        buckets[int(offset / (WINDOW / len(buckets)))] += 1
+
+    # Every ten-minute slot holds close to its share of 1000 addresses
+    assert all(800 < count < 1200 for count in buckets)
+
+
+def test_jittered():
+    """Test jitter only ever lengthens a delay, by at most the jitter."""
+    with patch("random.random", return_value=0.5):
+        assert jittered(timedelta(hours=1), timedelta(minutes=2)) == timedelta(
+            hours=1, minutes=1
+        )
+    for _ in range(100):
+        delay = jittered(timedelta(hours=1), timedelta(minutes=1))
+        assert timedelta(hours=1) <= delay <= timedelta(hours=1, minutes=1)
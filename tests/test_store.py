@@ -0,0 +1,67 @@
+"""Tests for the persistent schedule store."""
+
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.blacktown_bin_buddy.store import ScheduleStore
+
+MOCK_WASTE_DATA = {"red": date(2025, 9, 16), "yellow": date(2025, 9, 23)}
+
+
+@pytest.fixture
+def mock_store():
+    """Fixture for the underlying Home Assistant Store."""
+    with patch("custom_components.blacktown_bin_buddy.store.Store") as store_class:
+        yield store_class.return_value
+
+
+def _stored(saved_at, geolocation_id="geo-1"):
+    """Return a stored payload as written by ScheduleStore."""
+    return {
+        "geolocation_id": geolocation_id,
+        "saved_at": saved_at.isoformat(),
+        "dates": {key: value.isoformat() for key, value in MOCK_WASTE_DATA.items()},
+    }
+
+
+async def test_load_recent_schedule(mock_store):
+    """Test a recently saved schedule is restored."""
+    mock_store.async_load = AsyncMock(return_value=_stored(dt_util.utcnow()))
+    store = ScheduleStore(MagicMock(spec=HomeAssistant), "entry-1", "geo-1")
+
+    assert await store.async_load() == MOCK_WASTE_DATA
+
+
+@pytest.mark.parametrize(
+    "stored",
+    [
+        None,
+        _stored(dt_util.utcnow() - timedelta(days=30)),
+        _stored(dt_util.utcnow(), geolocation_id="geo-2"),
+        {"geolocation_id": "geo-1", "saved_at": "not a date", "dates": {}},
+    ],
+)
+async def test_load_ignores_unusable_schedule(mock_store, stored):
+    """Test missing, expired, foreign or invalid schedules are not restored."""
+    mock_store.async_load = AsyncMock(return_value=stored)
+    store = ScheduleStore(MagicMock(spec=HomeAssistant), "entry-1", "geo-1")
+
+    assert await store.async_load() is None
+
+
+async def test_save_schedule(mock_store):
+    """Test only non-empty schedules are saved."""
+    store = ScheduleStore(MagicMock(spec=HomeAssistant), "entry-1", "geo-1")
+
+    store.async_save({})
+    mock_store.async_delay_save.assert_not_called()
+
+    store.async_save(MOCK_WASTE_DATA)
+    data_func = mock_store.async_delay_save.call_args[0][0]
+    saved = data_func()
+    assert saved["geolocation_id"] == "geo-1"
+    assert saved["dates"] == {"red": "2025-09-16", "yellow": "2025-09-23"}
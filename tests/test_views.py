@@ -0,0 +1,113 @@
+"""Tests for the iCalendar feed view."""
+
+from datetime import date
+from http import HTTPStatus
+from unittest.mock import MagicMock, patch
+
+from aiohttp.helpers import ETag
+import pytest
+from homeassistant.components.http import KEY_HASS
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+
+from custom_components.blacktown_bin_buddy import views
+from custom_components.blacktown_bin_buddy.event_index import CollectionEventIndex
+from custom_components.blacktown_bin_buddy.views import BinBuddyCalendarView
+
+
+def _events(*collections):
+    """Return an event index of (day, colour) collections."""
+    return CollectionEventIndex(
+        [day.toordinal() for day, _ in collections],
+        [colour for _, colour in collections],
+    )
+
+
+def _entry(entry_id, title, events):
+    """Return a loaded config entry whose coordinator has the given events."""
+    entry = MagicMock(entry_id=entry_id, title=title, state=ConfigEntryState.LOADED)
+    entry.runtime_data.events = events
+    return entry
+
+
+@pytest.fixture
+def entries():
+    """Fixture for two loaded entries."""
+    return [
+        _entry("entry-1", "1 Test St", _events((date(2025, 9, 16), "red"))),
+        _entry("entry-2", "2 Test St", _events((date(2025, 9, 15), "yellow"))),
+    ]
+
+
+@pytest.fixture
+def mock_hass(entries):
+    """Fixture for HomeAssistant with the entries loaded."""
+    hass = MagicMock(spec=HomeAssistant)
+    hass.config_entries = MagicMock()
+    hass.config_entries.async_entries.return_value = entries
+    return hass
+
+
+def _request(hass, if_none_match=None):
+    """Return a request, optionally conditional on ETags."""
+    request = MagicMock()
+    request.app = {KEY_HASS: hass}
+    request.if_none_match = (
+        None if if_none_match is None else (ETag(value=if_none_match),)
+    )
+    return request
+
+
+async def test_entry_feed(mock_hass):
+    """Test an entry's feed holds its collections and a strong ETag."""
+    view = BinBuddyCalendarView()
+
+    response = await view.get(_request(mock_hass), "entry-1")
+
+    assert response.status == HTTPStatus.OK
+    assert response.content_type == "text/calendar"
+    body = response.body.decode()
+    assert "X-WR-CALNAME:1 Test St" in body
+    assert "UID:entry-1-red-20250916@blacktown_bin_buddy" in body
+    assert "SUMMARY:General Waste\r\n" in body
+    assert "entry-2" not in body
+    assert response.headers["ETag"].startswith('"')
+
+
+async def test_combined_feed(mock_hass):
+    """Test the combined feed holds every entry's collections in date order."""
+    response = await BinBuddyCalendarView().get(_request(mock_hass))
+
+    body = response.body.decode()
+    assert body.index("SUMMARY:Recycling (2 Test St)") < body.index(
+        "SUMMARY:General Waste (1 Test St)"
+    )
+
+
+async def test_unknown_entry(mock_hass):
+    """Test a feed for an entry that is not loaded is not found."""
+    response = await BinBuddyCalendarView().get(_request(mock_hass), "entry-3")
+
+    assert response.status == HTTPStatus.NOT_FOUND
+
+
+async def test_feeds_are_cached_until_the_events_change(mock_hass, entries):
+    """Test feeds render once per event index and answer 304 for their ETag."""
+    view = BinBuddyCalendarView()
+    with patch.object(
+        views.CalendarFeed, "render", wraps=views.CalendarFeed.render
+    ) as render:
+        first = await view.get(_request(mock_hass), "entry-1")
+        etag = first.headers["ETag"].strip('"')
+
+        cached = await view.get(_request(mock_hass, etag), "entry-1")
+        assert cached.status == HTTPStatus.NOT_MODIFIED
+        assert cached.body is None
+        assert render.call_count == 1
+
+        # A coordinator update replaces the event index
+        entries[0].runtime_data.events = _events((date(2025, 9, 23), "red"))
+        updated = await view.get(_request(mock_hass, etag), "entry-1")
+        assert updated.status == HTTPStatus.OK
+        assert updated.headers["ETag"] != first.headers["ETag"]
+        assert render.call_count == 2